@@ -8,15 +8,49 @@ import sys
 
 import terminaltexteffects.effects
 import terminaltexteffects.engine.terminal as term
+from terminaltexteffects.engine import asciicast
 from terminaltexteffects.engine.terminal import TerminalConfig
+from terminaltexteffects.utils import ansitools
 from terminaltexteffects.utils.argsdataclass import ArgsDataClass
+from terminaltexteffects.utils.argvalidators import PositiveFloat
+
+
+def play(argv: list[str]) -> None:
+    """Plays an asciicast recording made with --record. No effect modules are imported.
+
+    Args:
+        argv (list[str]): command line arguments following 'play'
+    """
+    parser = argparse.ArgumentParser(prog="tte play", description="Play an asciicast v2 recording made with --record.")
+    parser.add_argument("recording", type=str, help="Path of the recording")
+    parser.add_argument(
+        "--speed",
+        type=PositiveFloat.type_parser,
+        default=1.0,
+        metavar=PositiveFloat.METAVAR,
+        help="Playback speed multiplier",
+    )
+    args = parser.parse_args(argv)
+    try:
+        asciicast.play(args.recording, speed=args.speed)
+    except FileNotFoundError:
+        print(f"File not found: {args.recording}")
+    except ValueError as e:
+        print(f"Error reading recording: {args.recording} - {e}")
+    except KeyboardInterrupt:
+        sys.stdout.write(ansitools.SHOW_CURSOR())
+        sys.exit(1)
 
 
 def main():
+    # recordings are played without building the effect parser, which imports every effect module
+    if sys.argv[1:2] == ["play"]:
+        play(sys.argv[2:])
+        return
     parser = (argparse.ArgumentParser)(
         prog="tte",
         description="A terminal visual effects engine, application, and library",
-        epilog="Ex: ls -a | tte decrypt --typing-speed 2 --ciphertext-colors 008000 00cb00 00ff00 --final-gradient-stops eda000 --final-gradient-steps 12 --final-gradient-direction vertical",
+        epilog="Play a recording made with --record: tte play <path>. Ex: ls -a | tte decrypt --typing-speed 2 --ciphertext-colors 008000 00cb00 00ff00 --final-gradient-stops eda000 --final-gradient-steps 12 --final-gradient-direction vertical",
     )
 
     parser.add_argument("--input-file", "-i", type=str, help="File to read input from")
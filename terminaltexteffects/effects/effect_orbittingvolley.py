@@ -19,7 +19,7 @@ from terminaltexteffects.engine.terminal import Terminal
 from terminaltexteffects.utils import easing
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass, argclass
 from terminaltexteffects.utils.geometry import Coord
-from terminaltexteffects.utils.graphics import Color, Gradient
+from terminaltexteffects.utils.graphics import Color, CoordinateColorMapping, Gradient
 
 
 def get_effect_and_args() -> tuple[type[typing.Any], type[ArgsDataClass]]:
@@ -204,7 +204,7 @@ class OrbittingVolleyIterator(BaseEffectIterator[OrbittingVolleyConfig]):
         self.pending_chars: list[EffectCharacter] = []
         self.final_gradient = Gradient(*self.config.final_gradient_stops, steps=self.config.final_gradient_steps)
         self.character_final_color_map: dict[EffectCharacter, Color] = {}
-        self.final_gradient_coordinate_map: dict[Coord, Color] = self.final_gradient.build_coordinate_color_mapping(
+        self.final_gradient_coordinate_map: CoordinateColorMapping = self.final_gradient.build_coordinate_color_mapping(
             self.terminal.canvas.top, self.terminal.canvas.right, self.config.final_gradient_direction
         )
         self.complete = False
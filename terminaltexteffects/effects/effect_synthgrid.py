@@ -18,7 +18,7 @@ from terminaltexteffects.engine.terminal import Terminal
 from terminaltexteffects.utils import argvalidators, geometry
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass, argclass
 from terminaltexteffects.utils.geometry import Coord
-from terminaltexteffects.utils.graphics import Color, Gradient
+from terminaltexteffects.utils.graphics import Color, CoordinateColorMapping, Gradient
 
 
 def get_effect_and_args() -> tuple[type[typing.Any], type[ArgsDataClass]]:
@@ -154,7 +154,7 @@ class GridLine:
         args: SynthGridConfig,
         origin: Coord,
         direction: str,
-        grid_gradient_mapping: dict[geometry.Coord, Color],
+        grid_gradient_mapping: CoordinateColorMapping,
     ):
         self.terminal = terminal
         self.args = args
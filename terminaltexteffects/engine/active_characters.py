@@ -0,0 +1,331 @@
+"""The set of characters ticked by an effect, with a timing wheel for characters waiting on a hold or a long frame.
+
+After a character is ticked, the number of following ticks which would only advance a counter is found from its
+Motion and Animation. These are ticks spent holding at the end of a path or showing a frame with a long duration. If
+there are enough of them, the character is parked in the slot of the timing wheel for the tick where its state changes
+next, and is not ticked until then. When woken, the counters are advanced by the number of ticks that were skipped, so
+the character is in the same state as if it had been ticked every time.
+
+When the optional numpy extra is installed and many characters are moving, characters whose following ticks would
+only look up the next step of their compiled path are batched instead. Batched characters are moved together with
+NumPy at the end of each update (see character_arrays), until they reach a step which triggers an event or the end of
+their path.
+
+A parked or batched character is woken early when it is changed from outside of its own tick, for example when an
+effect activates a path or scene on it.
+
+Classes:
+    ActiveCharacters: The active characters of an effect, deduplicated by character ID.
+"""
+
+from __future__ import annotations
+
+import typing
+
+from terminaltexteffects.engine.character_arrays import CharacterArrays
+from terminaltexteffects.utils.graphics import _import_numpy
+
+if typing.TYPE_CHECKING:
+    from terminaltexteffects.engine.base_character import EffectCharacter
+
+
+class ActiveCharacters:
+    """The active characters of an effect, deduplicated by character ID and kept in the order they were added.
+
+    Characters are ticked by update() until they are no longer active. Characters whose next change is at least
+    PARK_MIN_TICKS ticks away are parked in a timing wheel and skipped until that tick, so the cost of an update scales
+    with the number of characters that change rather than the number of active characters. When NumPy is available,
+    characters moving along compiled paths are batched and moved together when at least BATCH_MIN_CHARACTERS of them
+    can be batched in an update. Parked and batched characters are still members of the set.
+
+    Supports the list operations used by effects: append(), extend(), remove(), clear(), iteration, len() and `in`.
+
+    Attributes:
+        tick_count (int): number of completed calls to update()
+    """
+
+    PARK_MIN_TICKS = 4
+    """Minimum number of ticks without a change for a character to be parked."""
+
+    BATCH_MIN_TICKS = 4
+    """Minimum number of ticks which only look up the next step of a path for a character to be batched."""
+
+    BATCH_MIN_CHARACTERS = 256
+    """Minimum number of characters which can be batched in the same update for them to be moved with NumPy."""
+
+    def __init__(self, characters: typing.Iterable[EffectCharacter] = ()) -> None:
+        """Initializes the set with the given characters.
+
+        Args:
+            characters (typing.Iterable[EffectCharacter], optional): characters to add. Defaults to ().
+        """
+        self.tick_count = 0
+        # every member, keyed by character ID, in the order they were added
+        self._characters: dict[int, EffectCharacter] = {}
+        # sequence number of every member, keyed by character ID, to find entries of removed characters
+        self._sequences: dict[int, int] = {}
+        # (sequence number, character) of characters to tick in the next update, in order of sequence number
+        self._running: list[tuple[int, EffectCharacter]] = []
+        # characters added or woken since the last update, merged into the running characters by the next update
+        self._added: list[tuple[int, EffectCharacter]] = []
+        # characters due at each tick, keyed by the tick
+        self._wheel: dict[int, list[tuple[int, EffectCharacter]]] = {}
+        # (sequence number, tick parked, tick due) of each parked character, keyed by character ID
+        self._parked: dict[int, tuple[int, int, int]] = {}
+        # characters woken during an update which have not been ticked by it yet
+        self._due: list[tuple[int, EffectCharacter]] | None = None
+        self._current_sequence = 0
+        self._next_sequence = 0
+        self._removed_in_update = False
+        # characters moved with NumPy, created when characters are first batched
+        self._arrays: CharacterArrays | None = None
+        self.extend(characters)
+
+    @property
+    def parked_count(self) -> int:
+        """The number of characters currently parked.
+
+        Returns:
+            int: the number of parked characters
+        """
+        return len(self._parked)
+
+    @property
+    def batched_count(self) -> int:
+        """The number of characters currently batched.
+
+        Returns:
+            int: the number of batched characters
+        """
+        return 0 if self._arrays is None else len(self._arrays)
+
+    def append(self, character: EffectCharacter) -> None:
+        """Adds a character. Characters which are already members are not added again.
+
+        Args:
+            character (EffectCharacter): the character to add
+        """
+        character_id = character.character_id
+        if character_id in self._characters:
+            return
+        self._characters[character_id] = character
+        self._sequences[character_id] = self._next_sequence
+        self._added.append((self._next_sequence, character))
+        self._next_sequence += 1
+
+    def extend(self, characters: typing.Iterable[EffectCharacter]) -> None:
+        """Adds each of the characters. Characters which are already members are not added again.
+
+        Args:
+            characters (typing.Iterable[EffectCharacter]): the characters to add
+        """
+        for character in characters:
+            self.append(character)
+
+    def remove(self, character: EffectCharacter) -> None:
+        """Removes a character. A parked or batched character is woken first. A character removed during an update,
+        for example by an event, is not ticked again by the update.
+
+        Args:
+            character (EffectCharacter): the character to remove
+
+        Raises:
+            ValueError: if the character is not a member
+        """
+        character_id = character.character_id
+        if character_id not in self._characters:
+            raise ValueError(f"Character {character_id} is not active.")
+        if character._scheduler is self:
+            self.wake(character)
+        del self._characters[character_id]
+        del self._sequences[character_id]
+        if self._due is not None:
+            self._removed_in_update = True
+        self._running = [entry for entry in self._running if entry[1] is not character]
+        self._added = [entry for entry in self._added if entry[1] is not character]
+
+    def clear(self) -> None:
+        """Removes every character. Parked and batched characters are woken first."""
+        for character_id in list(self._parked):
+            self.wake(self._characters[character_id])
+        if self._arrays is not None:
+            for character_id in self._arrays:
+                self.wake(self._characters[character_id])
+        self._characters.clear()
+        self._sequences.clear()
+        if self._due is not None:
+            self._removed_in_update = True
+        self._running = []
+        self._added = []
+        self._wheel.clear()
+
+    def wake(self, character: EffectCharacter) -> None:
+        """Wakes a parked or batched character. The counters of the character are advanced by the ticks it was parked
+        or batched for, and it is ticked from the next update. Called by the character when it is changed while parked
+        or batched.
+
+        Args:
+            character (EffectCharacter): the parked or batched character
+        """
+        arrays = self._arrays
+        if arrays is not None and character.character_id in arrays:
+            self._wake_batched(character)
+            return
+        sequence, parked_tick, _ = self._parked.pop(character.character_id)
+        character._scheduler = None
+        tick_count = self.tick_count
+        if self._due is not None and sequence > self._current_sequence:
+            # woken during an update before its turn, it is ticked later in the same update
+            character._skip_idle_ticks(tick_count - 1 - parked_tick)
+            self._due.append((sequence, character))
+        else:
+            character._skip_idle_ticks(tick_count - parked_tick)
+            self._added.append((sequence, character))
+
+    def _wake_batched(self, character: EffectCharacter) -> None:
+        """Wakes a batched character. Batched characters are moved at the end of an update, so a character woken during
+        an update after its turn is moved first, as it would have been ticked before it was changed.
+
+        Args:
+            character (EffectCharacter): the batched character
+        """
+        sequence, _ = typing.cast(CharacterArrays, self._arrays).release(character)
+        if self._due is not None:
+            if sequence > self._current_sequence:
+                # woken during an update before its turn, it is ticked later in the same update
+                self._due.append((sequence, character))
+                return
+            character.tick()
+        self._added.append((sequence, character))
+
+    def _batch(
+        self, numpy: typing.Any, running: list[tuple[int, EffectCharacter]]
+    ) -> list[tuple[int, EffectCharacter]]:
+        """Batches the running characters with at least BATCH_MIN_TICKS lookup ticks, if there are at least
+        BATCH_MIN_CHARACTERS of them.
+
+        Args:
+            numpy (typing.Any): the numpy module
+            running (list[tuple[int, EffectCharacter]]): the characters to tick in the next update
+
+        Returns:
+            list[tuple[int, EffectCharacter]]: the characters to tick in the next update which were not batched
+        """
+        batch_min_ticks = self.BATCH_MIN_TICKS
+        batched: list[tuple[tuple[int, EffectCharacter], int]] = []
+        ticked: list[tuple[int, EffectCharacter]] = []
+        for entry in running:
+            lookup_ticks = entry[1]._lookup_ticks()
+            if lookup_ticks >= batch_min_ticks:
+                batched.append((entry, lookup_ticks))
+            else:
+                ticked.append(entry)
+        if len(batched) < self.BATCH_MIN_CHARACTERS:
+            return running
+        if self._arrays is None:
+            self._arrays = CharacterArrays(numpy)
+        self._arrays.add(batched)
+        for entry, _ in batched:
+            entry[1]._scheduler = self
+        return ticked
+
+    def update(self) -> None:
+        """Ticks every character that is not parked or batched, moves the batched characters, wakes characters due at
+        this tick and removes characters which are no longer active. Characters with no change for at least
+        PARK_MIN_TICKS ticks are parked, and moving characters are batched when NumPy is available."""
+        self.tick_count += 1
+        tick_count = self.tick_count
+        parked = self._parked
+        added = self._added
+        woken = self._wheel.pop(tick_count, None)
+        if woken:
+            for sequence, character in woken:
+                character_id = character.character_id
+                parked_state = parked.get(character_id)
+                if parked_state is None or parked_state[2] != tick_count:
+                    # the character was woken early
+                    continue
+                del parked[character_id]
+                character._scheduler = None
+                character._skip_idle_ticks(tick_count - 1 - parked_state[1])
+                added.append((sequence, character))
+        running = self._running
+        if added:
+            added.sort()
+            # added characters are usually new and follow every running character
+            needs_sort = bool(running) and added[0][0] < running[-1][0]
+            running.extend(added)
+            if needs_sort:
+                running.sort()
+            self._added = []
+        characters = self._characters
+        sequences = self._sequences
+        wheel = self._wheel
+        park_min_ticks = self.PARK_MIN_TICKS
+        next_running: list[tuple[int, EffectCharacter]] = []
+        running_count = len(running)
+        self._due = running
+        try:
+            # characters woken by events are appended to running during the loop
+            for entry in running:
+                sequence, character = entry
+                character_id = character.character_id
+                if sequences.get(character_id) != sequence:
+                    # removed earlier in this update
+                    continue
+                self._current_sequence = sequence
+                character.tick()
+                if sequences.get(character_id) != sequence:
+                    # removed by its own tick
+                    continue
+                if not character.is_active:
+                    del characters[character_id]
+                    del sequences[character_id]
+                    continue
+                # characters moving along a path change every tick
+                motion = character._motion
+                if motion is not None:
+                    active_path = motion.active_path
+                    if active_path is not None and active_path.current_step < active_path.max_steps:
+                        next_running.append(entry)
+                        continue
+                idle_ticks = character._idle_ticks()
+                if idle_ticks < park_min_ticks:
+                    next_running.append(entry)
+                    continue
+                wake_tick = tick_count + idle_ticks + 1
+                parked[character_id] = (sequence, tick_count, wake_tick)
+                character._scheduler = self
+                if wake_tick in wheel:
+                    wheel[wake_tick].append(entry)
+                else:
+                    wheel[wake_tick] = [entry]
+        finally:
+            self._due = None
+        if self._removed_in_update:
+            # characters removed after their turn were already kept for the next update
+            self._removed_in_update = False
+            next_running = [entry for entry in next_running if sequences.get(entry[1].character_id) == entry[0]]
+        if len(running) > running_count:
+            next_running.sort()
+        arrays = self._arrays
+        if arrays:
+            # characters which leave the batch are ticked from the next update
+            self._added.extend(arrays.advance())
+        if len(next_running) >= self.BATCH_MIN_CHARACTERS:
+            numpy = _import_numpy()
+            if numpy is not None:
+                next_running = self._batch(numpy, next_running)
+        self._running = next_running
+
+    def __iter__(self) -> typing.Iterator[EffectCharacter]:
+        return iter(list(self._characters.values()))
+
+    def __len__(self) -> int:
+        return len(self._characters)
+
+    def __bool__(self) -> bool:
+        return bool(self._characters)
+
+    def __contains__(self, character: typing.Any) -> bool:
+        return getattr(character, "character_id", None) in self._characters
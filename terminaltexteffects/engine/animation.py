@@ -1,15 +1,21 @@
 from __future__ import annotations
 
+import functools
 import random
+import sys
 import typing
-from dataclasses import dataclass
+import weakref
+from dataclasses import dataclass, field
 from enum import Enum, auto
 
-from terminaltexteffects.utils import ansitools, colorterm, easing, graphics, hexterm
+from terminaltexteffects.utils import ansitools, easing, graphics, sgr
 
 if typing.TYPE_CHECKING:
     from terminaltexteffects.engine import base_character
 
+# dataclasses can only be slotted from Python 3.10, older versions keep an instance dict
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 class SyncMetric(Enum):
     """Enum for specifying the type of sync to use for a Scene.
@@ -23,10 +29,14 @@ class SyncMetric(Enum):
     STEP = auto()
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CharacterVisual:
     """A class for storing symbol, color, and terminal graphical modes for the character.
 
+    After formatting, the visual is available both as a formatted symbol (the symbol wrapped in the ANSI sequences for
+    its modes and color) and as structured data (the raw symbol and its interned SGR style). The structured form is
+    used by the Terminal to emit only the SGR changes between adjacent cells.
+
     Args:
         symbol (str): the symbol to show
         bold (bool): bold mode
@@ -38,8 +48,20 @@ class CharacterVisual:
         hidden (bool): hidden mode
         strike (bool): strike mode
         color (str | int | None): color code
+
+    Attributes:
+        raw_symbol (str): the symbol without any formatting
+        style (sgr.Style): the interned SGR style applied to the symbol
+
+    Methods:
+        disable_modes: Disables all graphical modes.
+        format_symbol: Formats the symbol for printing.
+        format_cache_info: Returns the hit and miss statistics of the formatted symbol cache.
     """
 
+    FORMAT_CACHE_SIZE = 1 << 14
+    """Maximum number of formatted symbols kept by the formatted symbol cache."""
+
     symbol: str
     bold: bool = False
     dim: bool = False
@@ -50,8 +72,11 @@ class CharacterVisual:
     hidden: bool = False
     strike: bool = False
     color: str | int | None = None
+    raw_symbol: str = field(init=False, repr=False, compare=False)
+    style: sgr.Style = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
+        self.raw_symbol = self.symbol
         self.format_symbol()
 
     def disable_modes(self) -> None:
@@ -66,29 +91,95 @@ class CharacterVisual:
         self.strike = False
 
     def format_symbol(self) -> None:
-        """Formats the symbol for printing by applying ANSI sequences for any active modes and color."""
-        formatting_string = ""
-        if self.bold:
-            formatting_string += ansitools.APPLY_BOLD()
-        if self.italic:
-            formatting_string += ansitools.APPLY_ITALIC()
-        if self.underline:
-            formatting_string += ansitools.APPLY_UNDERLINE()
-        if self.blink:
-            formatting_string += ansitools.APPLY_BLINK()
-        if self.reverse:
-            formatting_string += ansitools.APPLY_REVERSE()
-        if self.hidden:
-            formatting_string += ansitools.APPLY_HIDDEN()
-        if self.strike:
-            formatting_string += ansitools.APPLY_STRIKETHROUGH()
-        if self.color is not None:
-            formatting_string += colorterm.fg(self.color)
-
-        self.symbol = f"{formatting_string}{self.symbol}{ansitools.RESET_ALL() if formatting_string else ''}"
-
-
-@dataclass
+        """Formats the symbol for printing by applying ANSI sequences for any active modes and color. The style is
+        updated to match.
+
+        Formatted symbols are interned by a process-wide LRU cache keyed on the symbol, color and modes, so visuals
+        with the same appearance share the same formatted string and style objects."""
+        self.symbol, self.style = _format_symbol(
+            self.raw_symbol,
+            self.color,
+            self.bold,
+            self.dim,
+            self.italic,
+            self.underline,
+            self.blink,
+            self.reverse,
+            self.hidden,
+            self.strike,
+        )
+
+    @staticmethod
+    def format_cache_info() -> functools._CacheInfo:
+        """Returns the statistics of the formatted symbol cache.
+
+        Returns:
+            functools._CacheInfo: the hits, misses, maxsize and currsize of the cache
+        """
+        return _format_symbol.cache_info()
+
+
+@functools.lru_cache(maxsize=CharacterVisual.FORMAT_CACHE_SIZE)
+def _format_symbol(
+    symbol: str,
+    color: str | int | None,
+    bold: bool,
+    dim: bool,
+    italic: bool,
+    underline: bool,
+    blink: bool,
+    reverse: bool,
+    hidden: bool,
+    strike: bool,
+) -> tuple[str, sgr.Style]:
+    """Returns a symbol wrapped in the ANSI sequences for its modes and color, along with the matching SGR style.
+    Cached by CharacterVisual.format_symbol().
+
+    Args:
+        symbol (str): the symbol to format
+        color (str | int | None): color code
+        bold (bool): bold mode
+        dim (bool): dim mode
+        italic (bool): italic mode
+        underline (bool): underline mode
+        blink (bool): blink mode
+        reverse (bool): reverse mode
+        hidden (bool): hidden mode
+        strike (bool): strike mode
+
+    Returns:
+        tuple[str, sgr.Style]: the formatted symbol and its style
+    """
+    formatting_string = ""
+    if bold:
+        formatting_string += ansitools.APPLY_BOLD()
+    if dim:
+        formatting_string += ansitools.APPLY_DIM()
+    if italic:
+        formatting_string += ansitools.APPLY_ITALIC()
+    if underline:
+        formatting_string += ansitools.APPLY_UNDERLINE()
+    if blink:
+        formatting_string += ansitools.APPLY_BLINK()
+    if reverse:
+        formatting_string += ansitools.APPLY_REVERSE()
+    if hidden:
+        formatting_string += ansitools.APPLY_HIDDEN()
+    if strike:
+        formatting_string += ansitools.APPLY_STRIKETHROUGH()
+    if color is not None:
+        # the interned Color holds the parsed color and its sequence
+        formatting_string += graphics.Color(color).fg_sequence
+
+    style: sgr.Style = (
+        sgr.apply_parameters(sgr.DEFAULT_STYLE, formatting_string[2:-1].replace("m\x1b[", ";"))
+        if formatting_string
+        else sgr.DEFAULT_STYLE
+    )
+    return f"{formatting_string}{symbol}{ansitools.RESET_ALL() if formatting_string else ''}", style
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Frame:
     """A Frame is a CharacterVisual with a duration.
 
@@ -99,24 +190,169 @@ class Frame:
 
     character_visual: CharacterVisual
     duration: int
+    symbol: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        self.frames_played = 0
         self.symbol = self.character_visual.symbol
 
 
+class SceneTemplate:
+    """An immutable sequence of Frames shared by every Scene with the same Frames.
+
+    Templates are interned by the symbol, duration, color and graphical modes of each Frame, so Scenes built with
+    identical Frames, such as the gradient Scenes of characters with the same final color, share a single template
+    along with its Frame and CharacterVisual objects. A template is kept while it is used by at least one Scene.
+
+    Attributes:
+        frame_keys (tuple[tuple[str, int, str | int | None, int], ...]): the symbol, duration, color and graphical
+            modes of each Frame
+        frames (tuple[Frame, ...]): the Frames of the template, in order
+        easing_total_steps (int): the total duration of the Frames
+
+    Properties:
+        frame_index_map (dict[int, Frame]): The Frame shown at each step of the template.
+
+    Methods:
+        get: Returns the interned template for a sequence of frame keys.
+        get_frame_key: Returns the key of a Frame.
+    """
+
+    MODES = ("bold", "dim", "italic", "underline", "blink", "reverse", "hidden", "strike")
+    """Graphical modes in the order of their bits in a frame key."""
+
+    _templates: weakref.WeakValueDictionary[tuple, SceneTemplate] = weakref.WeakValueDictionary()
+
+    def __init__(self, frame_keys: tuple[tuple[str, int, str | int | None, int], ...]) -> None:
+        """Initializes a SceneTemplate. Use SceneTemplate.get() to share templates.
+
+        Args:
+            frame_keys (tuple[tuple[str, int, str | int | None, int], ...]): the key of each Frame, see
+                SceneTemplate.get_frame_key()
+        """
+        self.frame_keys = frame_keys
+        frames: list[Frame] = []
+        self.easing_total_steps: int = 0
+        for symbol, duration, color, modes in frame_keys:
+            mode_flags = {mode: bool(modes & 1 << bit) for bit, mode in enumerate(self.MODES)} if modes else {}
+            frames.append(Frame(CharacterVisual(symbol, color=color, **mode_flags), duration))
+            self.easing_total_steps += duration
+        self.frames: tuple[Frame, ...] = tuple(frames)
+        self._frame_index_map: dict[int, Frame] | None = None
+
+    @property
+    def frame_index_map(self) -> dict[int, Frame]:
+        """The Frame shown at each step of the template. Used to play eased Scenes, created when first used.
+
+        Returns:
+            dict[int, Frame]: mapping of step to Frame
+        """
+        if self._frame_index_map is None:
+            self._frame_index_map = {}
+            for frame in self.frames:
+                for _ in range(frame.duration):
+                    self._frame_index_map[len(self._frame_index_map)] = frame
+        return self._frame_index_map
+
+    @classmethod
+    def get(cls, frame_keys: tuple[tuple[str, int, str | int | None, int], ...]) -> SceneTemplate:
+        """Returns the interned template for a sequence of frame keys, creating it if necessary.
+
+        Args:
+            frame_keys (tuple[tuple[str, int, str | int | None, int], ...]): the key of each Frame, see
+                SceneTemplate.get_frame_key()
+
+        Returns:
+            SceneTemplate: the template
+        """
+        template = cls._templates.get(frame_keys)
+        if template is None:
+            template = cls._templates[frame_keys] = cls(frame_keys)
+        return template
+
+    @staticmethod
+    def get_frame_key(
+        symbol: str,
+        duration: int,
+        color: str | int | None = None,
+        *,
+        bold=False,
+        dim=False,
+        italic=False,
+        underline=False,
+        blink=False,
+        reverse=False,
+        hidden=False,
+        strike=False,
+    ) -> tuple[str, int, str | int | None, int]:
+        """Returns the key of a Frame. The graphical modes are packed into an integer with one bit per mode.
+
+        Args:
+            symbol (str): the symbol to show
+            duration (int): the number of frames to use the Frame
+            color (str | int | None, optional): the color code. Defaults to None.
+            bold (bool, optional): bold mode. Defaults to False.
+            dim (bool, optional): dim mode. Defaults to False.
+            italic (bool, optional): italic mode. Defaults to False.
+            underline (bool, optional): underline mode. Defaults to False.
+            blink (bool, optional): blink mode. Defaults to False.
+            reverse (bool, optional): reverse mode. Defaults to False.
+            hidden (bool, optional): hidden mode. Defaults to False.
+            strike (bool, optional): strike mode. Defaults to False.
+
+        Returns:
+            tuple[str, int, str | int | None, int]: the symbol, duration, color and graphical modes
+        """
+        modes = bold | dim << 1 | italic << 2 | underline << 3 | blink << 4 | reverse << 5 | hidden << 6 | strike << 7
+        return (symbol, duration, color, int(modes))
+
+
 class Scene:
     """A Scene is a collection of Frames that can be played in sequence. Scenes can be looped and synced to movement.
 
+    The Frames of a Scene are held by a SceneTemplate, which is shared with every other Scene with identical Frames.
+    The template is created the first time the Frames are needed after a Frame is added. The Scene only holds its
+    playback state: the index of the current Frame and the number of steps the current Frame has been shown, so
+    advancing, looping and resetting the Scene do not modify the Frames.
+
+    A Scene keeps a reference to the Animation which created or last activated it. Resetting the Scene or adding a
+    Frame while it is the active Scene of that Animation wakes the character if it is parked, so the change is played
+    from the next tick.
+
+    Attributes:
+        frame_cursor (int): index of the current Frame, equal to the number of Frames once the Scene is complete
+        current_frame_steps (int): number of steps the current Frame has been shown
+
+    Properties:
+        template (SceneTemplate): The shared template holding the Frames of the Scene.
+        frames (tuple[Frame, ...]): The Frames of the Scene, in order.
+        frame_index_map (dict[int, Frame]): The Frame shown at each step of the Scene.
+        easing_total_steps (int): The total duration of the Frames.
+        is_complete (bool): Whether every Frame has been played.
+        played_frames (list[Frame]): The Frames which have been played.
+
     Methods:
         add_frame: Adds a Frame to the Scene.
         activate: Activates the Scene.
         get_next_symbol: Returns the next symbol in the Scene.
+        get_next_visual: Returns the next CharacterVisual in the Scene.
         apply_gradient_to_symbols: Applies a gradient effect to a sequence of symbols.
         reset_scene: Resets the Scene.
     """
 
-    xterm_color_map: dict[str, int] = {}
+    __slots__ = (
+        "scene_id",
+        "is_looping",
+        "sync",
+        "ease",
+        "no_color",
+        "use_xterm_colors",
+        "frame_cursor",
+        "current_frame_steps",
+        "easing_current_step",
+        "_template",
+        "_frame_keys",
+        "_animation",
+    )
 
     def __init__(
         self,
@@ -126,6 +362,7 @@ class Scene:
         ease: easing.EasingFunction | None = None,
         no_color: bool = False,
         use_xterm_colors: bool = False,
+        template: SceneTemplate | None = None,
     ):
         """Initializes a Scene.
 
@@ -136,6 +373,8 @@ class Scene:
             ease (easing.EasingFunction | None, optional): The easing function to use for the Scene. Defaults to None.
             no_color (bool, optional): Whether to colors should be ignored. Defaults to False.
             use_xterm_colors (bool, optional): Whether to convert all colors to XTerm-256 colors. Defaults to False.
+            template (SceneTemplate | None, optional): Template holding the initial Frames of the Scene. Defaults to
+                None.
         """
         self.scene_id = scene_id
         self.is_looping = is_looping
@@ -143,11 +382,18 @@ class Scene:
         self.ease: easing.EasingFunction | None = ease
         self.no_color = no_color
         self.use_xterm_colors = use_xterm_colors
-        self.frames: list[Frame] = []
-        self.played_frames: list[Frame] = []
-        self.frame_index_map: dict[int, Frame] = {}
-        self.easing_total_steps: int = 0
+        self.frame_cursor: int = 0
+        self.current_frame_steps: int = 0
         self.easing_current_step: int = 0
+        self._template: SceneTemplate | None = template
+        self._frame_keys: list[tuple[str, int, str | int | None, int]] = []
+        self._animation: Animation | None = None
+
+    def _wake_character(self) -> None:
+        """Wakes the character playing the Scene if it is parked. Called before the playback of the Scene is changed."""
+        animation = self._animation
+        if animation is not None and animation.active_scene is self:
+            animation.character._wake()
 
     def add_frame(
         self,
@@ -184,35 +430,79 @@ class Scene:
             if self.no_color:
                 char_vis_color = None
             elif self.use_xterm_colors:
-                if color.xterm_color:
-                    char_vis_color = color.xterm_color
-                elif color.rgb_color in self.xterm_color_map:
-                    char_vis_color = self.xterm_color_map[color.rgb_color]
-                else:
-                    xterm_color = hexterm.hex_to_xterm(color.rgb_color)
-                    self.xterm_color_map[color.rgb_color] = xterm_color
-                    char_vis_color = xterm_color
+                char_vis_color = color.xterm_index
             else:
                 char_vis_color = color.rgb_color
         if duration < 1:
             raise ValueError("duration must be greater than 0")
-        char_vis = CharacterVisual(
-            symbol,
-            bold=bold,
-            dim=dim,
-            italic=italic,
-            underline=underline,
-            blink=blink,
-            reverse=reverse,
-            hidden=hidden,
-            strike=strike,
-            color=char_vis_color,
+        self._wake_character()
+        if self._template is not None:
+            # the template is shared, the Frames are copied to a new template when they are next needed
+            self._frame_keys = list(self._template.frame_keys)
+            self._template = None
+        # same packing as SceneTemplate.get_frame_key(), inlined as frames are added in bulk while effects are built
+        modes = (
+            bold | dim << 1 | italic << 2 | underline << 3 | blink << 4 | reverse << 5 | hidden << 6 | strike << 7
         )
-        frame = Frame(char_vis, duration)
-        self.frames.append(frame)
-        for _ in range(frame.duration):
-            self.frame_index_map[self.easing_total_steps] = frame
-            self.easing_total_steps += 1
+        self._frame_keys.append((symbol, duration, char_vis_color, int(modes)))
+
+    @property
+    def template(self) -> SceneTemplate:
+        """The shared template holding the Frames of the Scene.
+
+        Returns:
+            SceneTemplate: the template
+        """
+        if self._template is None:
+            self._template = SceneTemplate.get(tuple(self._frame_keys))
+            self._frame_keys = []
+        return self._template
+
+    @property
+    def frames(self) -> tuple[Frame, ...]:
+        """The Frames of the Scene, in order.
+
+        Returns:
+            tuple[Frame, ...]: the Frames
+        """
+        return self.template.frames
+
+    @property
+    def frame_index_map(self) -> dict[int, Frame]:
+        """The Frame shown at each step of the Scene. Used to play eased Scenes.
+
+        Returns:
+            dict[int, Frame]: mapping of step to Frame
+        """
+        return self.template.frame_index_map
+
+    @property
+    def easing_total_steps(self) -> int:
+        """The total duration of the Frames of the Scene.
+
+        Returns:
+            int: the number of steps
+        """
+        return self.template.easing_total_steps
+
+    @property
+    def is_complete(self) -> bool:
+        """Whether every Frame in the Scene has been played. Looping Scenes restart before they are complete.
+
+        Returns:
+            bool: True if complete, False otherwise
+        """
+        template = self._template or self.template
+        return self.frame_cursor >= len(template.frames)
+
+    @property
+    def played_frames(self) -> list[Frame]:
+        """The Frames which have been played, in order.
+
+        Returns:
+            list[Frame]: the played Frames
+        """
+        return list(self.frames[: self.frame_cursor])
 
     def activate(self) -> str:
         """Activates the Scene by returning the first frame symbol. Called by the Animation object when the Scene is activated.
@@ -223,33 +513,39 @@ class Scene:
         Returns:
             str: the next symbol in the Scene
         """
-        if self.frames:
-            return self.frames[0].symbol
+        if not self.is_complete:
+            return self.frames[self.frame_cursor].symbol
         else:
             raise ValueError("Scene has no sequences.")
 
     def get_next_symbol(self) -> str:
         """
-        This method is used to get the next symbol in the Scene. It first retrieves the current sequence from the frames list.
-        It then increments the 'frames_played' attribute of the current sequence. If the 'frames_played' equals the 'duration'
-        of the current sequence, it resets 'frames_played' to 0 and moves the current sequence from the frames list to the
-        'played_frames' list. If the Scene is set to loop and all frames have been played, it refills the frames list with the
-        sequences from 'played_frames' and clears 'played_frames'. Finally, it returns the symbol of the current sequence.
+        This method is used to get the next symbol in the Scene. It first retrieves the current sequence at the frame cursor.
+        It then increments 'current_frame_steps'. If 'current_frame_steps' equals the 'duration' of the current sequence,
+        it resets 'current_frame_steps' to 0 and advances the frame cursor. If the Scene is set to loop and all frames have
+        been played, the frame cursor returns to the first frame. Finally, it returns the symbol of the current sequence.
 
         Returns:
             str: The symbol of the current sequence in the Scene.
         """
+        return self.get_next_visual().symbol
+
+    def get_next_visual(self) -> CharacterVisual:
+        """Advances the Scene in the same way as get_next_symbol() and returns the CharacterVisual of the current
+        sequence.
 
-        current_sequence = self.frames[0]
-        next_symbol = current_sequence.symbol
-        current_sequence.frames_played += 1
-        if current_sequence.frames_played == current_sequence.duration:
-            current_sequence.frames_played = 0
-            self.played_frames.append(self.frames.pop(0))
-            if self.is_looping and not self.frames:
-                self.frames.extend(self.played_frames)
-                self.played_frames.clear()
-        return next_symbol
+        Returns:
+            CharacterVisual: The CharacterVisual of the current sequence in the Scene.
+        """
+        frames = (self._template or self.template).frames
+        current_sequence = frames[self.frame_cursor]
+        self.current_frame_steps += 1
+        if self.current_frame_steps == current_sequence.duration:
+            self.current_frame_steps = 0
+            self.frame_cursor += 1
+            if self.is_looping and self.frame_cursor == len(frames):
+                self.frame_cursor = 0
+        return current_sequence.character_visual
 
     def apply_gradient_to_symbols(
         self, gradient: graphics.Gradient, symbols: typing.Sequence[str], duration: int
@@ -287,12 +583,9 @@ class Scene:
 
     def reset_scene(self) -> None:
         """Resets the Scene."""
-        for sequence in self.frames:
-            sequence.frames_played = 0
-            self.played_frames.append(sequence)
-        self.frames.clear()
-        self.frames.extend(self.played_frames)
-        self.played_frames.clear()
+        self._wake_character()
+        self.frame_cursor = 0
+        self.current_frame_steps = 0
 
     def __eq__(self, other: typing.Any):
         if not isinstance(other, Scene):
@@ -304,21 +597,58 @@ class Scene:
 
 
 class Animation:
+    __slots__ = (
+        "_scenes",
+        "character",
+        "active_scene",
+        "use_xterm_colors",
+        "no_color",
+        "_xterm_color_map",
+        "active_scene_current_step",
+    )
+
+    BRIGHTNESS_CACHE_SIZE = 1 << 14
+    """Maximum number of adjusted colors kept by the brightness cache."""
+
     def __init__(self, character: "base_character.EffectCharacter"):
         """Animation handles the animations of a character. It contains a scene_name -> Scene mapping and the active Scene. Calls to step_animation()
         progress the Scene and apply the next symbol to the character.
 
+        The scenes and xterm_color_map dictionaries are created when first used, as many characters never use them.
+
         Args:
             character (base_character.EffectCharacter): the EffectCharacter object to animate
         """
-        self.scenes: dict[str, Scene] = {}
+        self._scenes: dict[str, Scene] | None = None
         self.character = character
         self.active_scene: Scene | None = None
         self.use_xterm_colors: bool = False
         self.no_color: bool = False
-        self.xterm_color_map: dict[str, int] = {}
+        self._xterm_color_map: dict[str, int] | None = None
         self.active_scene_current_step: int = 0
 
+    @property
+    def scenes(self) -> dict[str, Scene]:
+        """Mapping of scene_id to Scene for the scenes of the character.
+
+        Returns:
+            dict[str, Scene]: the scenes
+        """
+        if self._scenes is None:
+            self._scenes = {}
+        return self._scenes
+
+    @property
+    def xterm_color_map(self) -> dict[str, int]:
+        """Mapping of RGB colors to XTerm-256 colors.
+
+        Returns:
+            dict[str, int]: the color map
+        """
+        if self._xterm_color_map is None:
+            self._xterm_color_map = {}
+        return self._xterm_color_map
+
     def new_scene(
         self,
         *,
@@ -326,6 +656,7 @@ class Animation:
         sync: SyncMetric | None = None,
         ease: easing.EasingFunction | None = None,
         id: str = "",
+        template: SceneTemplate | None = None,
     ) -> Scene:
         """Creates a new Scene and adds it to the Animation.
 
@@ -334,6 +665,8 @@ class Animation:
             is_looping (bool): Whether the scene should loop.
             sync (SyncMetric): The type of sync to use for the scene.
             ease (easing.EasingFunction): The easing function to use for the scene.
+            template (SceneTemplate | None): Template holding the initial frames of the scene, such as the template of
+                an identical scene of another character. Defaults to None.
 
         Returns:
             Scene: the new Scene
@@ -348,8 +681,9 @@ class Animation:
                 else:
                     current_id += 1
 
-        new_scene = Scene(scene_id=id, is_looping=is_looping, sync=sync, ease=ease)
+        new_scene = Scene(scene_id=id, is_looping=is_looping, sync=sync, ease=ease, template=template)
         self.scenes[id] = new_scene
+        new_scene._animation = self
         new_scene.no_color = self.no_color
         new_scene.use_xterm_colors = self.use_xterm_colors
         return new_scene
@@ -377,7 +711,7 @@ class Animation:
         """
         if not self.active_scene:
             return True
-        elif not self.active_scene.frames or self.active_scene.is_looping:
+        elif self.active_scene.is_complete or self.active_scene.is_looping:
             return True
 
         return False
@@ -398,8 +732,8 @@ class Animation:
                 char_vis_color = color.xterm_color
             else:
                 char_vis_color = color.rgb_color
-        visual = CharacterVisual(symbol, color=char_vis_color)
-        self.character.symbol = visual.symbol
+        self.character._wake()
+        self.character.visual = CharacterVisual(symbol, color=char_vis_color)
 
     @staticmethod
     def random_color() -> graphics.Color:
@@ -415,6 +749,9 @@ class Animation:
         """
         Adjusts the brightness of a given color.
 
+        Adjusted colors are cached by a process-wide LRU cache keyed on the color and brightness, and the HSL values of
+        each color are cached, so effects which adjust the same colors every frame only convert each color once.
+
         Args:
             color (Color): The color code to adjust.
             brightness (float): The brightness adjustment factor.
@@ -422,79 +759,30 @@ class Animation:
         Returns:
             Color: The adjusted color code.
         """
+        return _adjust_color_brightness(color, brightness)
 
-        def hue_to_rgb(lightness_scaled: float, color_intensity: float, hue_value: float) -> float:
-            """
-            Converts a hue value to an RGB value component.
-
-            This function is a helper function used in the conversion from HSL (Hue, Saturation, Lightness)
-            color space to RGB (Red, Green, Blue) color space. It takes in three parameters: lightness_scaled,
-            color_intensity, and hue_value. These parameters are derived from the HSL color space and are used
-            to calculate the corresponding RGB value.
-
-            Args:
-                lightness_scaled (float): The lightness value from the HSL color space, scaled and shifted to be used in the RGB conversion.
-                color_intensity (float): The intensity of the color, used to adjust the RGB values.
-                hue_value (float): The hue value from the HSL color space, used to calculate the RGB values.
-
-            Returns:
-                float: The calculated RGB component.
-            """
-
-            if hue_value < 0:
-                hue_value += 1
-            if hue_value > 1:
-                hue_value -= 1
-            if hue_value < 1 / 6:
-                return lightness_scaled + (color_intensity - lightness_scaled) * 6 * hue_value
-            if hue_value < 1 / 2:
-                return color_intensity
-            if hue_value < 2 / 3:
-                return lightness_scaled + (color_intensity - lightness_scaled) * (2 / 3 - hue_value) * 6
-            return lightness_scaled
-
-        normalized_red = int(color.rgb_color[0:2], 16) / 255
-        normalized_green = int(color.rgb_color[2:4], 16) / 255
-        normalized_blue = int(color.rgb_color[4:6], 16) / 255
-
-        # Convert RGB to HSL
-        max_val = max(normalized_red, normalized_green, normalized_blue)
-        min_val = min(normalized_red, normalized_green, normalized_blue)
-        lightness = (max_val + min_val) / 2
-
-        if max_val == min_val:
-            hue_value = saturation = 0.0  # achromatic
-        else:
-            diff = max_val - min_val
-            saturation = diff / (2 - max_val - min_val) if lightness > 0.5 else diff / (max_val + min_val)
-            if max_val == normalized_red:
-                hue_value = (normalized_green - normalized_blue) / diff + (
-                    6 if normalized_green < normalized_blue else 0
-                )
-            elif max_val == normalized_green:
-                hue_value = (normalized_blue - normalized_red) / diff + 2
-            else:
-                hue_value = (normalized_red - normalized_green) / diff + 4
-            hue_value /= 6
+    @staticmethod
+    def brightness_ramp(color: graphics.Color, brightness_factors: typing.Iterable[float]) -> tuple[graphics.Color, ...]:
+        """Adjusts the brightness of a color by each of a sequence of brightness factors. The color is converted to HSL
+        once for the whole ramp. See adjust_color_brightness().
 
-        # Adjust lightness
-        lightness = max(min(lightness * brightness, 1), 0)
+        Args:
+            color (Color): The color code to adjust.
+            brightness_factors (typing.Iterable[float]): The brightness adjustment factors.
 
-        # Convert back to RGB
-        if saturation == 0:
-            red = green = blue = lightness  # achromatic
-        else:
-            color_intensity = (
-                lightness * (1 + saturation) if lightness < 0.5 else lightness + saturation - lightness * saturation
-            )
-            lightness_scaled = 2 * lightness - color_intensity
-            red = hue_to_rgb(lightness_scaled, color_intensity, hue_value + 1 / 3)
-            green = hue_to_rgb(lightness_scaled, color_intensity, hue_value)
-            blue = hue_to_rgb(lightness_scaled, color_intensity, hue_value - 1 / 3)
+        Returns:
+            tuple[Color, ...]: The adjusted color for each brightness factor, in order.
+        """
+        return tuple(_adjust_color_brightness(color, brightness) for brightness in brightness_factors)
 
-        # Convert to hex
-        adjusted_color = "{:02x}{:02x}{:02x}".format(int(red * 255), int(green * 255), int(blue * 255))
-        return graphics.Color(adjusted_color)
+    @staticmethod
+    def brightness_cache_info() -> functools._CacheInfo:
+        """Returns the statistics of the brightness cache.
+
+        Returns:
+            functools._CacheInfo: the hits, misses, maxsize and currsize of the cache
+        """
+        return _adjust_color_brightness.cache_info()
 
     def _ease_animation(self, easing_func: easing.EasingFunction) -> float:
         """Returns the percentage of total distance that should be moved based on the easing function.
@@ -511,10 +799,43 @@ class Animation:
         elapsed_step_ratio = self.active_scene.easing_current_step / self.active_scene.easing_total_steps
         return easing_func(elapsed_step_ratio)
 
+    def _idle_ticks(self) -> int:
+        """Returns the number of following calls to step_animation() which would only count a step of the current
+        frame, without changing the visual of the character or completing the scene.
+
+        Returns:
+            int: the number of idle steps, sys.maxsize if there is no scene in progress
+        """
+        active_scene = self.active_scene
+        if active_scene is None:
+            return sys.maxsize
+        if active_scene.sync or active_scene.ease:
+            return 0
+        frames = (active_scene._template or active_scene.template).frames
+        frame_cursor = active_scene.frame_cursor
+        if frame_cursor >= len(frames):
+            return sys.maxsize
+        frame = frames[frame_cursor]
+        idle_ticks = frame.duration - active_scene.current_frame_steps - 1
+        if idle_ticks <= 0 or self.character.visual is not frame.character_visual:
+            return 0
+        return idle_ticks
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Counts a number of idle steps of the current frame, as returned by _idle_ticks().
+
+        Args:
+            ticks (int): the number of steps to count
+        """
+        if self.active_scene is not None and not self.active_scene.is_complete:
+            self.active_scene.current_frame_steps += ticks
+
     def step_animation(self) -> None:
         """Apply the next symbol in the scene to the character. If a scene order exists, the next scene
         will be activated when the current scene is complete."""
-        if self.active_scene and self.active_scene.frames:
+        if self.character._scheduler is not None:
+            self.character._wake()
+        if self.active_scene and not self.active_scene.is_complete:
             # if the active scene is synced to movement, calculate the sequence index based on the
             # current waypoint progress
             if self.active_scene.sync:
@@ -544,30 +865,28 @@ class Animation:
                             )
                         )
                     try:
-                        self.character.symbol = self.active_scene.frames[sequence_index].symbol
+                        self.character.visual = self.active_scene.frames[sequence_index].character_visual
                     except IndexError:
-                        self.character.symbol = self.active_scene.frames[-1].symbol
+                        self.character.visual = self.active_scene.frames[-1].character_visual
                 else:  # when the active waypoint has been deactivated, use the final symbol in the scene and finish the scene
-                    self.character.symbol = self.active_scene.frames[-1].symbol
-                    self.active_scene.played_frames.extend(self.active_scene.frames)
-                    self.active_scene.frames.clear()
+                    self.character.visual = self.active_scene.frames[-1].character_visual
+                    self.active_scene.frame_cursor = len(self.active_scene.frames)
 
             elif self.active_scene and self.active_scene.ease:
                 easing_factor = self._ease_animation(self.active_scene.ease)
                 frame_index = round(easing_factor * max(self.active_scene.easing_total_steps - 1, 0))
                 frame_index = max(min(frame_index, self.active_scene.easing_total_steps - 1), 0)
                 frame = self.active_scene.frame_index_map[frame_index]
-                self.character.symbol = frame.symbol
+                self.character.visual = frame.character_visual
                 self.active_scene.easing_current_step += 1
                 if self.active_scene.easing_current_step == self.active_scene.easing_total_steps:
                     if self.active_scene.is_looping:
                         self.active_scene.easing_current_step = 0
                     else:
-                        self.active_scene.played_frames.extend(self.active_scene.frames)
-                        self.active_scene.frames.clear()
+                        self.active_scene.frame_cursor = len(self.active_scene.frames)
 
             else:
-                self.character.symbol = self.active_scene.get_next_symbol()
+                self.character.visual = self.active_scene.get_next_visual()
             if self.active_scene_is_complete():
                 completed_scene = self.active_scene
                 if not self.active_scene.is_looping:
@@ -584,9 +903,12 @@ class Animation:
         Args:
             scene (Scene): the Scene to set as active
         """
+        self.character._wake()
+        scene._animation = self
         self.active_scene = scene
         self.active_scene_current_step = 0
-        self.character.symbol = self.active_scene.activate()
+        self.active_scene.activate()
+        self.character.visual = self.active_scene.frames[self.active_scene.frame_cursor].character_visual
         self.character.event_handler._handle_event(self.character.event_handler.Event.SCENE_ACTIVATED, scene)
 
     def deactivate_scene(self, scene: Scene) -> None:
@@ -595,5 +917,106 @@ class Animation:
         Args:
             scene (Scene): the Scene to deactivate
         """
+        self.character._wake()
         if self.active_scene is scene:
             self.active_scene = None
+
+
+@functools.lru_cache(maxsize=Animation.BRIGHTNESS_CACHE_SIZE)
+def _color_to_hsl(color: graphics.Color) -> tuple[float, float, float]:
+    """Converts a color to HSL. Cached by _adjust_color_brightness().
+
+    Args:
+        color (graphics.Color): the color to convert
+
+    Returns:
+        tuple[float, float, float]: the hue, saturation and lightness of the color, between 0 and 1
+    """
+    red_int, green_int, blue_int = color.rgb_ints
+    normalized_red = red_int / 255
+    normalized_green = green_int / 255
+    normalized_blue = blue_int / 255
+
+    # Convert RGB to HSL
+    max_val = max(normalized_red, normalized_green, normalized_blue)
+    min_val = min(normalized_red, normalized_green, normalized_blue)
+    lightness = (max_val + min_val) / 2
+
+    if max_val == min_val:
+        hue_value = saturation = 0.0  # achromatic
+    else:
+        diff = max_val - min_val
+        saturation = diff / (2 - max_val - min_val) if lightness > 0.5 else diff / (max_val + min_val)
+        if max_val == normalized_red:
+            hue_value = (normalized_green - normalized_blue) / diff + (
+                6 if normalized_green < normalized_blue else 0
+            )
+        elif max_val == normalized_green:
+            hue_value = (normalized_blue - normalized_red) / diff + 2
+        else:
+            hue_value = (normalized_red - normalized_green) / diff + 4
+        hue_value /= 6
+    return hue_value, saturation, lightness
+
+
+@functools.lru_cache(maxsize=Animation.BRIGHTNESS_CACHE_SIZE)
+def _adjust_color_brightness(color: graphics.Color, brightness: float) -> graphics.Color:
+    """Returns a color with its lightness scaled by a brightness factor. Cached by
+    Animation.adjust_color_brightness().
+
+    Args:
+        color (graphics.Color): the color to adjust
+        brightness (float): the brightness adjustment factor
+
+    Returns:
+        graphics.Color: the adjusted color
+    """
+    hue_value, saturation, lightness = _color_to_hsl(color)
+
+    # Adjust lightness
+    lightness = max(min(lightness * brightness, 1), 0)
+
+    # Convert back to RGB
+    if saturation == 0:
+        red = green = blue = lightness  # achromatic
+    else:
+        color_intensity = (
+            lightness * (1 + saturation) if lightness < 0.5 else lightness + saturation - lightness * saturation
+        )
+        lightness_scaled = 2 * lightness - color_intensity
+        red = _hue_to_rgb(lightness_scaled, color_intensity, hue_value + 1 / 3)
+        green = _hue_to_rgb(lightness_scaled, color_intensity, hue_value)
+        blue = _hue_to_rgb(lightness_scaled, color_intensity, hue_value - 1 / 3)
+
+    return graphics.Color.from_rgb(int(red * 255), int(green * 255), int(blue * 255))
+
+
+def _hue_to_rgb(lightness_scaled: float, color_intensity: float, hue_value: float) -> float:
+    """
+    Converts a hue value to an RGB value component.
+
+    This function is a helper function used in the conversion from HSL (Hue, Saturation, Lightness)
+    color space to RGB (Red, Green, Blue) color space. It takes in three parameters: lightness_scaled,
+    color_intensity, and hue_value. These parameters are derived from the HSL color space and are used
+    to calculate the corresponding RGB value.
+
+    Args:
+        lightness_scaled (float): The lightness value from the HSL color space, scaled and shifted to be used in the RGB conversion.
+        color_intensity (float): The intensity of the color, used to adjust the RGB values.
+        hue_value (float): The hue value from the HSL color space, used to calculate the RGB values.
+
+    Returns:
+        float: The calculated RGB component.
+    """
+
+    if hue_value < 0:
+        hue_value += 1
+    if hue_value > 1:
+        hue_value -= 1
+    if hue_value < 1 / 6:
+        return lightness_scaled + (color_intensity - lightness_scaled) * 6 * hue_value
+    if hue_value < 1 / 2:
+        return color_intensity
+    if hue_value < 2 / 3:
+        return lightness_scaled + (color_intensity - lightness_scaled) * (2 / 3 - hue_value) * 6
+    return lightness_scaled
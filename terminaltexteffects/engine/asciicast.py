@@ -0,0 +1,120 @@
+"""Recording and playback of terminal output in the asciicast v2 format.
+
+An asciicast v2 file starts with a JSON header line followed by one JSON event per line. Output events have the form
+`[time, "o", data]`, where time is the number of seconds since the start of the recording and data is the text written
+to the terminal.
+
+Playing a recording only writes the recorded output at the recorded times. No effect is imported and no characters
+are built, so replaying an effect costs a small fraction of running it.
+
+Classes:
+    AsciicastRecorder: Streams terminal output to an asciicast v2 file.
+
+Functions:
+    play: Writes the output events of an asciicast v2 file to a stream at the recorded times.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+import typing
+
+from terminaltexteffects.engine.output import OutputSink
+
+ASCIICAST_VERSION = 2
+
+
+class AsciicastRecorder:
+    """Streams terminal output to an asciicast v2 file.
+
+    The header is written when the recorder is created. Each call to write_output() appends an output event with the
+    time elapsed since the recorder was created.
+
+    Attributes:
+        path (str): Path of the recording.
+        width (int): Terminal width stored in the header.
+        height (int): Terminal height stored in the header.
+        events_written (int): Number of output events written.
+
+    Methods:
+        write_output(text: str): Appends an output event.
+        close(): Closes the recording file.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        width: int,
+        height: int,
+        *,
+        clock: typing.Callable[[], float] = time.perf_counter,
+    ) -> None:
+        """Initializes the AsciicastRecorder, creating the recording file and writing the header.
+
+        Args:
+            path (str): path of the recording, an existing file is overwritten
+            width (int): terminal width stored in the header
+            height (int): terminal height stored in the header
+            clock (typing.Callable[[], float], optional): Monotonic clock returning seconds. Defaults to
+                time.perf_counter.
+        """
+        self.path = path
+        self.width = width
+        self.height = height
+        self.events_written = 0
+        self._clock = clock
+        self._file = open(path, "w", encoding="utf-8")
+        header = {"version": ASCIICAST_VERSION, "width": width, "height": height, "timestamp": int(time.time())}
+        self._file.write(json.dumps(header) + "\n")
+        self._start = clock()
+
+    def write_output(self, text: str) -> None:
+        """Appends an output event for text written to the terminal.
+
+        Args:
+            text (str): the text written to the terminal
+        """
+        event = [round(self._clock() - self._start, 6), "o", text]
+        self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+        self.events_written += 1
+
+    def close(self) -> None:
+        """Closes the recording file."""
+        self._file.close()
+
+
+def play(path: str, *, speed: float = 1.0, stream: typing.TextIO | None = None) -> None:
+    """Writes the output events of an asciicast v2 file to a stream at the recorded times. The file is read as it is
+    played, so recordings of any length can be played.
+
+    Args:
+        path (str): path of the recording
+        speed (float, optional): Playback speed multiplier. Defaults to 1.0.
+        stream (typing.TextIO | None, optional): Stream to write to. Defaults to sys.stdout.
+
+    Raises:
+        ValueError: if the file is not an asciicast v2 recording or speed is not positive
+    """
+    if speed <= 0:
+        raise ValueError(f"Playback speed must be > 0, got {speed}.")
+    sink = OutputSink(stream)
+    with open(path, "r", encoding="utf-8") as recording:
+        try:
+            header = json.loads(recording.readline())
+        except json.JSONDecodeError as error:
+            raise ValueError(f"{path} is not an asciicast recording: {error}") from None
+        if not isinstance(header, dict) or header.get("version") != ASCIICAST_VERSION:
+            raise ValueError(f"{path} is not an asciicast v{ASCIICAST_VERSION} recording.")
+        start = time.perf_counter()
+        for line in recording:
+            if not line.strip():
+                continue
+            event_time, event_type, data = json.loads(line)
+            if event_type != "o":
+                continue
+            delay = start + event_time / speed - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            sink.write(data)
+            sink.flush()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import sys
+import types
 import typing
 from dataclasses import dataclass
 from enum import Enum, auto
@@ -9,6 +11,10 @@ from enum import Enum, auto
 from terminaltexteffects.engine import animation, motion
 from terminaltexteffects.utils.geometry import Coord
 
+if typing.TYPE_CHECKING:
+    from terminaltexteffects.engine.active_characters import ActiveCharacters
+    from terminaltexteffects.engine.terminal import Terminal
+
 
 class EventHandler:
     """Register and handle events related to a character.
@@ -19,33 +25,77 @@ class EventHandler:
 
     Attributes:
         character (EffectCharacter): The character that the EventHandler is handling events for.
-        registered_events (dict[tuple[Event, str], list[tuple[Action, str]]]): A dictionary of registered events.
-            The key is a tuple of the event and the subject_id (waypoint id/scene id).
-            The value is a list of tuples of the action and the action target (waypoint id/scene id).
+        registered_events (typing.Mapping[tuple[Event, str], tuple[tuple[Action, str], ...]]): A read-only mapping of
+            registered events. The key is a tuple of the event and the subject_id (waypoint id/scene id).
+            The value is a tuple of tuples of the action and the action target (waypoint id/scene id).
         layer (int): The layer of the character. The layer determines the order in which characters are printed.
 
+    Registered events are compiled into a tuple of handlers for each event and caller, so handling an event is a
+    lookup followed by calling the handlers. Use register_events() to register the same events for many characters.
+
     Note:
         SEGMENT_ENTERED/EXITED events will trigger the first time the character enters or exits a segment.
         If looping, each loop will trigger the event, but not backwards motion as is possible with the bounce easing functions.
     """
 
+    __slots__ = ("character", "layer", "_registered_events", "_handlers")
+
     def __init__(self, character: "EffectCharacter"):
-        """Initializes the instance with the EffectCharacter object.
+        """Initializes the instance with the EffectCharacter object. The registered_events dictionary is created when
+        the first event is registered.
 
         Args:
             character (EffectCharacter): The character for which the EventHandler is handling events.
         """
         self.character = character
         self.layer: int = 0
-        self.registered_events: dict[
-            tuple[EventHandler.Event, animation.Scene | motion.Waypoint | motion.Path],
-            list[
+        self._registered_events: (
+            dict[
+                tuple[EventHandler.Event, animation.Scene | motion.Waypoint | motion.Path],
                 tuple[
-                    EventHandler.Action,
-                    animation.Scene | motion.Waypoint | motion.Path | int | Coord | EventHandler.Callback,
-                ]
+                    tuple[
+                        EventHandler.Action,
+                        animation.Scene | motion.Waypoint | motion.Path | int | Coord | EventHandler.Callback,
+                    ],
+                    ...,
+                ],
+            ]
+            | None
+        ) = None
+        # registered events compiled into the handler and target of each action, keyed by event and then caller
+        self._handlers: (
+            dict[
+                EventHandler.Event,
+                dict[
+                    animation.Scene | motion.Waypoint | motion.Path,
+                    tuple[tuple[typing.Callable[[EffectCharacter, typing.Any], None], typing.Any], ...],
+                ],
+            ]
+            | None
+        ) = None
+
+    @property
+    def registered_events(
+        self,
+    ) -> typing.Mapping[
+        tuple[EventHandler.Event, animation.Scene | motion.Waypoint | motion.Path],
+        tuple[
+            tuple[
+                EventHandler.Action,
+                animation.Scene | motion.Waypoint | motion.Path | int | Coord | EventHandler.Callback,
             ],
-        ] = {}
+            ...,
+        ],
+    ]:
+        """A read-only view of the registered events, keyed by the event and the subject. Events are added with
+        register_event(), which keeps the compiled handlers up to date.
+
+        Returns:
+            typing.Mapping: the registered events
+        """
+        if self._registered_events is None:
+            self._registered_events = {}
+        return types.MappingProxyType(self._registered_events)
 
     class Event(Enum):
         """An Event that can be registered with the EventHandler.
@@ -134,11 +184,75 @@ class EventHandler:
             Register an event to activate a scene when a Path is complete:
             `event_handler.register_event(EventHandler.Event.PATH_COMPLETE, some_path, EventHandler.Action.ACTIVATE_SCENE, some_scene)`
         """
+        if self._registered_events is None:
+            self._registered_events = {}
         new_event = (event, caller)
-        new_action = (action, target)
-        if new_event not in self.registered_events:
-            self.registered_events[new_event] = list()
-        self.registered_events[new_event].append(new_action)
+        actions = self._registered_events[new_event] = (*self._registered_events.get(new_event, ()), (action, target))
+        if self._handlers is not None:
+            self._handlers.setdefault(event, {})[caller] = tuple(
+                (_ACTION_HANDLERS[registered_action], registered_target)
+                for registered_action, registered_target in actions
+            )
+
+    @staticmethod
+    def register_events(
+        characters: typing.Iterable[EffectCharacter],
+        events: typing.Iterable[
+            tuple[Event, str | tuple[str, str], Action, str | int | Coord | EventHandler.Callback],
+        ],
+    ) -> None:
+        """Registers the same events for many characters. Callers and Path/Scene targets are given by ID and are
+        looked up in the Motion or Animation of each character.
+
+        Args:
+            characters (typing.Iterable[EffectCharacter]): The characters to register the events for.
+            events (typing.Iterable[tuple[Event, str | tuple[str, str], Action, str | int | Coord | Callback]]): The
+                events to register, as (event, caller, action, target) tuples. The caller is a path ID for path events,
+                a scene ID for scene events and a (path ID, waypoint ID) tuple for segment events. The target is a path
+                ID for path actions, a scene ID for scene actions, or the target itself for other actions.
+
+        Example:
+            Register an event to activate the scene with ID "fade" when the path with ID "input" is complete:
+            `EventHandler.register_events(characters, [(EventHandler.Event.PATH_COMPLETE, "input", EventHandler.Action.ACTIVATE_SCENE, "fade")])`
+        """
+        events = list(events)
+        for character in characters:
+            event_handler = character.event_handler
+            for event, caller_id, action, target in events:
+                if event in _SEGMENT_EVENTS:
+                    path_id, waypoint_id = caller_id
+                    caller = character.motion.query_path(path_id).query_waypoint(waypoint_id)
+                elif event in _PATH_EVENTS:
+                    caller = character.motion.query_path(typing.cast(str, caller_id))
+                else:
+                    caller = character.animation.query_scene(typing.cast(str, caller_id))
+                if action in _PATH_ACTIONS:
+                    target = character.motion.query_path(typing.cast(str, target))
+                elif action in _SCENE_ACTIONS:
+                    target = character.animation.query_scene(typing.cast(str, target))
+                event_handler.register_event(event, caller, action, target)
+
+    def _compile_handlers(
+        self,
+    ) -> dict[
+        Event,
+        dict[
+            animation.Scene | motion.Waypoint | motion.Path,
+            tuple[tuple[typing.Callable[[EffectCharacter, typing.Any], None], typing.Any], ...],
+        ],
+    ]:
+        """Compiles the registered events into the handlers to call for each event and caller.
+
+        Returns:
+            dict: the handler and target of each action, keyed by the event and the caller
+        """
+        handlers: dict = {}
+        for (event, caller), actions in (self._registered_events or {}).items():
+            handlers.setdefault(event, {})[caller] = tuple(
+                (_ACTION_HANDLERS[action], target) for action, target in actions
+            )
+        self._handlers = handlers
+        return handlers
 
     def _handle_event(self, event: Event, caller: animation.Scene | motion.Waypoint | motion.Path) -> None:
         """Handles an event by taking the specified action.
@@ -147,21 +261,68 @@ class EventHandler:
             event (Event): An event to handle. If the event is not registered, nothing happens.
             caller (animation.Scene | motion.Waypoint | motion.Path): The object triggering the call.
         """
-        action_map = {
-            EventHandler.Action.ACTIVATE_PATH: self.character.motion.activate_path,
-            EventHandler.Action.ACTIVATE_SCENE: self.character.animation.activate_scene,
-            EventHandler.Action.DEACTIVATE_PATH: self.character.motion.deactivate_path,
-            EventHandler.Action.DEACTIVATE_SCENE: self.character.animation.deactivate_scene,
-            EventHandler.Action.SET_LAYER: lambda layer: setattr(self.character, "layer", layer),
-            EventHandler.Action.SET_COORDINATE: lambda coord: setattr(self.character.motion, "current_coord", coord),
-            EventHandler.Action.CALLBACK: lambda callback: callback.callback(self.character, *callback.args),
-        }
-
-        if (event, caller) not in self.registered_events:
+        handlers = self._handlers
+        if handlers is None:
+            if not self._registered_events:
+                return
+            handlers = self._compile_handlers()
+        callers = handlers.get(event)
+        if callers is None:
+            return
+        caller_handlers = callers.get(caller)
+        if caller_handlers is None:
             return
-        for event_action in self.registered_events[(event, caller)]:
-            action, target = event_action
-            action_map[action](target)  # type: ignore
+        character = self.character
+        for handler, target in caller_handlers:
+            handler(character, target)
+
+
+def _activate_path(character: EffectCharacter, path: motion.Path) -> None:
+    character.motion.activate_path(path)
+
+
+def _activate_scene(character: EffectCharacter, scene: animation.Scene) -> None:
+    character.animation.activate_scene(scene)
+
+
+def _deactivate_path(character: EffectCharacter, path: motion.Path) -> None:
+    character.motion.deactivate_path(path)
+
+
+def _deactivate_scene(character: EffectCharacter, scene: animation.Scene) -> None:
+    character.animation.deactivate_scene(scene)
+
+
+def _set_layer(character: EffectCharacter, layer: int) -> None:
+    character.layer = layer
+
+
+def _set_coordinate(character: EffectCharacter, coord: Coord) -> None:
+    character._wake()
+    character.motion.current_coord = coord
+
+
+def _callback(character: EffectCharacter, callback: EventHandler.Callback) -> None:
+    callback.callback(character, *callback.args)
+
+
+_ACTION_HANDLERS: dict[EventHandler.Action, typing.Callable[[EffectCharacter, typing.Any], None]] = {
+    EventHandler.Action.ACTIVATE_PATH: _activate_path,
+    EventHandler.Action.ACTIVATE_SCENE: _activate_scene,
+    EventHandler.Action.DEACTIVATE_PATH: _deactivate_path,
+    EventHandler.Action.DEACTIVATE_SCENE: _deactivate_scene,
+    EventHandler.Action.SET_LAYER: _set_layer,
+    EventHandler.Action.SET_COORDINATE: _set_coordinate,
+    EventHandler.Action.CALLBACK: _callback,
+}
+"""The function taking each action, called with the character and the action target."""
+
+_SEGMENT_EVENTS = frozenset((EventHandler.Event.SEGMENT_ENTERED, EventHandler.Event.SEGMENT_EXITED))
+_PATH_EVENTS = frozenset(
+    (EventHandler.Event.PATH_ACTIVATED, EventHandler.Event.PATH_COMPLETE, EventHandler.Event.PATH_HOLDING)
+)
+_PATH_ACTIONS = frozenset((EventHandler.Action.ACTIVATE_PATH, EventHandler.Action.DEACTIVATE_PATH))
+_SCENE_ACTIONS = frozenset((EventHandler.Action.ACTIVATE_SCENE, EventHandler.Action.DEACTIVATE_SCENE))
 
 
 class EffectCharacter:
@@ -177,15 +338,33 @@ class EffectCharacter:
     Attributes:
         input_symbol (str): The symbol for the character in the input data.
         input_coord (Coord): The coordinate of the character in the input data.
-        symbol (str): The current symbol for the character, determined by the animation units.
+        symbol (str): The current formatted symbol for the character, determined by the animation units.
+        visual (animation.CharacterVisual): The current visual for the character, determined by the animation units.
         character_id (int): The unique ID of the character, generated by the Terminal.
-        animation (graphics.Animation): The animation object that controls the character's appearance.
-        motion (motion.Motion): The motion object that controls the character's movement.
+        animation (graphics.Animation): The animation object that controls the character's appearance. Created
+            when first used.
+        motion (motion.Motion): The motion object that controls the character's movement. Created when
+            first used.
         event_handler (EventHandler): The event handler object that handles events related to the character.
+            Created when first used.
         is_visible (bool): Whether the character is currently visible and should be printed to the terminal.
         layer (int): The layer of the character. The layer determines the order in which characters are printed.
     """
 
+    __slots__ = (
+        "_character_id",
+        "_input_symbol",
+        "_input_coord",
+        "_is_visible",
+        "visual",
+        "_animation",
+        "_motion",
+        "_event_handler",
+        "_layer",
+        "_terminal",
+        "_scheduler",
+    )
+
     def __init__(self, character_id: int, symbol: str, input_column: int, input_row: int):
         """Initializes the character instance with the character ID, symbol, and input coordinates.
 
@@ -199,11 +378,47 @@ class EffectCharacter:
         self._input_symbol: str = symbol
         self._input_coord: Coord = Coord(input_column, input_row)
         self._is_visible: bool = False
-        self.symbol: str = symbol
-        self.animation: animation.Animation = animation.Animation(self)
-        self.motion: motion.Motion = motion.Motion(self)
-        self.event_handler: EventHandler = EventHandler(self)
-        self.layer: int = 0
+        self.visual: animation.CharacterVisual = animation.CharacterVisual(symbol)
+        self._animation: animation.Animation | None = None
+        self._motion: motion.Motion | None = None
+        self._event_handler: EventHandler | None = None
+        self._layer: int = 0
+        self._terminal: Terminal | None = None
+        # the ActiveCharacters which parked or batched the character, None unless the character is parked or batched
+        self._scheduler: ActiveCharacters | None = None
+
+    @property
+    def animation(self) -> animation.Animation:
+        """The animation object that controls the character's appearance. Created when first used.
+
+        Returns:
+            animation.Animation: the animation
+        """
+        if self._animation is None:
+            self._animation = animation.Animation(self)
+        return self._animation
+
+    @property
+    def motion(self) -> motion.Motion:
+        """The motion object that controls the character's movement. Created when first used.
+
+        Returns:
+            motion.Motion: the motion
+        """
+        if self._motion is None:
+            self._motion = motion.Motion(self)
+        return self._motion
+
+    @property
+    def event_handler(self) -> EventHandler:
+        """The event handler object that handles events related to the character. Created when first used.
+
+        Returns:
+            EventHandler: the event handler
+        """
+        if self._event_handler is None:
+            self._event_handler = EventHandler(self)
+        return self._event_handler
 
     @property
     def input_symbol(self) -> str:
@@ -213,6 +428,20 @@ class EffectCharacter:
     def input_coord(self) -> Coord:
         return self._input_coord
 
+    @property
+    def symbol(self) -> str:
+        """The current formatted symbol for the character, taken from the current visual.
+
+        Returns:
+            str: the symbol with any SGR sequences applied
+        """
+        return self.visual.symbol
+
+    @symbol.setter
+    def symbol(self, symbol: str) -> None:
+        self._wake()
+        self.visual = animation.CharacterVisual(symbol)
+
     @property
     def is_visible(self) -> bool:
         return self._is_visible
@@ -221,6 +450,22 @@ class EffectCharacter:
     def character_id(self) -> int:
         return self._character_id
 
+    @property
+    def layer(self) -> int:
+        """The layer of the character. The layer determines the order in which characters are printed.
+
+        Returns:
+            int: the layer
+        """
+        return self._layer
+
+    @layer.setter
+    def layer(self, layer: int) -> None:
+        previous_layer = self._layer
+        self._layer = layer
+        if layer != previous_layer and self._is_visible and self._terminal is not None:
+            self._terminal._move_character_to_layer(self, previous_layer)
+
     @property
     def is_active(self) -> bool:
         """Returns whether the character is currently active. A character is active if its animation or motion is not complete.
@@ -228,14 +473,84 @@ class EffectCharacter:
         Returns:
             bool: True if the character is active, False if not.
         """
-        if not self.animation.active_scene_is_complete() or not self.motion.movement_is_complete():
+        # subsystems which have not been created have nothing in progress
+        if self._animation is not None and not self._animation.active_scene_is_complete():
+            return True
+        if self._motion is not None and not self._motion.movement_is_complete():
             return True
         return False
 
     def tick(self) -> None:
         """Progress the character's animation and motion by one step."""
-        self.motion.move()
-        self.animation.step_animation()
+        if self._motion is not None:
+            self._motion.move()
+        if self._animation is not None:
+            self._animation.step_animation()
+
+    def _wake(self) -> None:
+        """Wakes the character if it is parked by an ActiveCharacters. Called before the character is changed."""
+        if self._scheduler is not None:
+            self._scheduler.wake(self)
+
+    def _idle_ticks(self) -> int:
+        """Returns the number of following ticks which would only advance the hold or frame counters of the character,
+        without changing its coordinate or visual or triggering an event.
+
+        Returns:
+            int: the number of idle ticks, sys.maxsize if ticking would never change the character
+        """
+        idle_ticks = sys.maxsize
+        motion = self._motion
+        if motion is not None and motion.active_path is not None:
+            # a character moving along a path changes every tick
+            if motion.active_path.current_step < motion.active_path.max_steps:
+                return 0
+            idle_ticks = motion._idle_ticks()
+            if not idle_ticks:
+                return 0
+        if self._animation is not None and self._animation.active_scene is not None:
+            idle_ticks = min(idle_ticks, self._animation._idle_ticks())
+        return idle_ticks
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Advances the counters of the character by a number of idle ticks, as returned by _idle_ticks().
+
+        Args:
+            ticks (int): the number of ticks to skip
+        """
+        if ticks <= 0:
+            return
+        if self._motion is not None:
+            self._motion._skip_idle_ticks(ticks)
+        if self._animation is not None:
+            self._animation._skip_idle_ticks(ticks)
+
+    def _lookup_ticks(self) -> int:
+        """Returns the number of following ticks which would only look up the next compiled step of the active path of
+        the character, without changing its visual or triggering an event.
+
+        Returns:
+            int: the number of lookup ticks
+        """
+        if self._motion is None:
+            return 0
+        lookup_ticks = self._motion._lookup_ticks()
+        if lookup_ticks and self._animation is not None and self._animation.active_scene is not None:
+            lookup_ticks = min(lookup_ticks, self._animation._idle_ticks())
+        return lookup_ticks
+
+    def _skip_lookup_ticks(self, ticks: int) -> None:
+        """Advances the path and animation counters of the character by a number of lookup ticks, as returned by
+        _lookup_ticks(). The coordinates of the character are kept up to date by the caller.
+
+        Args:
+            ticks (int): the number of ticks to skip
+        """
+        if ticks <= 0:
+            return
+        typing.cast(motion.Motion, self._motion)._skip_lookup_ticks(ticks)
+        if self._animation is not None:
+            self._animation._skip_idle_ticks(ticks)
 
     def __hash__(self) -> int:
         return hash(self.character_id)
@@ -14,11 +14,13 @@ Classes:
 
 from __future__ import annotations
 
+import functools
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
 from copy import deepcopy
-from typing import Generator, Generic, TypeVar
+from typing import Callable, Generator, Generic, Iterable, TypeVar
 
+from terminaltexteffects.engine.active_characters import ActiveCharacters
 from terminaltexteffects.engine.base_character import EffectCharacter
 from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
 from terminaltexteffects.utils.argsdataclass import ArgsDataClass
@@ -29,13 +31,23 @@ T = TypeVar("T", bound=ArgsDataClass)
 class BaseEffectIterator(ABC, Generic[T]):
     """Base iterator class for all effects.
 
+    The `__next__` method implemented by an effect advances the simulation by one tick and returns the frame. If a
+    tick rate is set in the terminal config, the method is wrapped so that each frame advances the simulation by
+    `tick_rate / frame_rate` ticks. Only the last tick of a frame is rendered. When the tick rate is lower than the frame
+    rate, frames without a tick repeat the previous frame.
+
+    Iterators created inside `BaseEffect.terminal_output()` share the frame scheduler of the output terminal. Frames the
+    frame policy would skip because they are late are simulated but not rendered, and the final frame of the effect is
+    always rendered.
+
     Args:
         effect (BaseEffect): Effect to apply to the input data.
 
     Attributes:
         config (T): Configuration for the effect.
         terminal (Terminal): Terminal to use for output.
-        active_characters (list[EffectCharacter]): List of active characters in the effect.
+        active_characters (ActiveCharacters): Active characters in the effect, deduplicated by character ID. Assigning
+            an iterable of characters replaces the active characters.
 
     Properties:
         frame (str): Current frame of the effect.
@@ -54,25 +66,136 @@ class BaseEffectIterator(ABC, Generic[T]):
         """
         self.config: T = deepcopy(effect.effect_config)
         self.terminal = Terminal(effect.input_data, deepcopy(effect.terminal_config))
-        self.active_characters: list[EffectCharacter] = []
+        if effect._output_terminal is not None:
+            self.terminal.frame_scheduler = effect._output_terminal.frame_scheduler
+        self._active_characters = ActiveCharacters()
+        self._frame_count = 0
+        self._tick_count = 0
+        self._previous_frame = ""
+        self._in_tick = False
+        self._render_frames = True
+        self._frame_skipped = False
+        self._finished = False
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        """Wraps the `__next__` method of effect iterators to run the number of ticks per frame set by the terminal
+        config."""
+        super().__init_subclass__(**kwargs)
+        tick = cls.__dict__.get("__next__")
+        if tick is None:
+            return
+
+        @functools.wraps(tick)
+        def __next__(self: BaseEffectIterator) -> str:
+            return self._next_frame(tick)
+
+        cls.__next__ = __next__  # type: ignore[method-assign]
 
     @property
     def frame(self) -> str:
-        """Return the current frame by getting the formatted output string from the terminal.
+        """Return the current frame by getting the formatted output string from the terminal. Ticks which are not
+        rendered because the frame advances more than one tick return an empty string, and frames which the frame
+        policy skips return the last rendered frame.
 
         Returns:
             str: Current frame of the effect.
         """
+        if not self._render_frames:
+            return ""
+        if not self.terminal.frame_due():
+            # the frame will not be printed, return the last rendered frame without compositing this one
+            self._frame_skipped = True
+            return self.terminal.framebuffer.to_string()
+        self._frame_skipped = False
         return self.terminal.get_formatted_output_string()
 
+    def _next_frame(self, tick: Callable[[BaseEffectIterator], str]) -> str:
+        """Advances the simulation to the next frame by running the effect's tick as many times as required by the
+        ticks per frame of the terminal.
+
+        Args:
+            tick (Callable[[BaseEffectIterator], str]): the `__next__` method implemented by the effect
+
+        Raises:
+            StopIteration: The effect is complete.
+
+        Returns:
+            str: the frame
+        """
+        if self._in_tick:
+            return tick(self)
+        if self._finished:
+            raise StopIteration
+        ticks_per_frame = self.terminal.ticks_per_frame
+        if ticks_per_frame is None:
+            try:
+                return tick(self)
+            except StopIteration:
+                self._finished = True
+                if not self._frame_skipped:
+                    raise
+                return self._render_final_frame()
+        # frame n shows the state after floor((n - 1) * ticks_per_frame) + 1 ticks
+        target_tick_count = int(self._frame_count * ticks_per_frame) + 1
+        self._frame_count += 1
+        if target_tick_count <= self._tick_count:
+            if self._frame_skipped:
+                # the held frame was not rendered
+                self._previous_frame = self.frame
+            return self._previous_frame
+        ticks_run = 0
+        self._in_tick = True
+        try:
+            while self._tick_count < target_tick_count:
+                self._render_frames = self._tick_count == target_tick_count - 1
+                try:
+                    frame = tick(self)
+                except StopIteration:
+                    self._finished = True
+                    if not ticks_run and not self._frame_skipped:
+                        raise
+                    # the previous tick was not rendered
+                    frame = self._render_final_frame()
+                    break
+                self._tick_count += 1
+                ticks_run += 1
+        finally:
+            self._in_tick = False
+            self._render_frames = True
+        self._previous_frame = frame
+        return frame
+
+    def _render_final_frame(self) -> str:
+        """Renders the state of the effect after its last tick, regardless of the frame schedule.
+
+        Returns:
+            str: the final frame
+        """
+        self._frame_skipped = False
+        return self.terminal.get_formatted_output_string()
+
+    @property
+    def active_characters(self) -> ActiveCharacters:
+        """The active characters in the effect, ticked by update().
+
+        Returns:
+            ActiveCharacters: the active characters
+        """
+        return self._active_characters
+
+    @active_characters.setter
+    def active_characters(self, characters: Iterable[EffectCharacter]) -> None:
+        if characters is self._active_characters:
+            return
+        characters = list(characters)
+        self._active_characters.clear()
+        self._active_characters.extend(characters)
+
     def update(self) -> None:
-        """Run the tick method for all active characters and remove inactive characters from the active list."""
-        _active_characters = []
-        for character in self.active_characters:
-            character.tick()
-            if character.is_active:
-                _active_characters.append(character)
-        self.active_characters = _active_characters
+        """Run the tick method for all active characters and remove inactive characters from the active characters.
+        Characters waiting on a path hold time or a long frame are parked until their next change instead of being
+        ticked."""
+        self._active_characters.update()
 
     def __iter__(self) -> "BaseEffectIterator":
         return self
@@ -114,13 +237,15 @@ class BaseEffect(ABC, Generic[T]):
         self.input_data = input_data
         self.effect_config = self._config_cls()
         self.terminal_config = TerminalConfig()
+        self._output_terminal: Terminal | None = None
 
     def __iter__(self) -> BaseEffectIterator:
         return self._iterator_cls(self)
 
     @contextmanager
     def terminal_output(self, end_symbol: str = "\n") -> Generator[Terminal, None, None]:
-        """Context manager for terminal output. Prepares the terminal for output and restores it after.
+        """Context manager for terminal output. Prepares the terminal for output and restores it after. Iterators of
+        the effect created inside the context share the frame scheduler of the terminal.
 
         Args:
             end_symbol (str, optional): Symbol to print after the effect has completed. Defaults to newline.
@@ -133,10 +258,12 @@ class BaseEffect(ABC, Generic[T]):
                 state.
         """
         terminal = Terminal(self.input_data, self.terminal_config)
+        self._output_terminal = terminal
         try:
             terminal.prep_canvas()
             yield terminal
         except:  # noqa: E722
             raise
         finally:
+            self._output_terminal = None
             terminal.restore_cursor(end_symbol)
@@ -0,0 +1,172 @@
+"""Characters moved along their compiled paths with NumPy. Used by ActiveCharacters when the optional numpy extra is
+installed.
+
+A character is batched when its following ticks would only look up the next step of its compiled path while its
+animation shows the same frame. The characters batched in the same update form a group, which keeps the coordinates
+of the remaining lookup steps of each character in one contiguous array. Each update, a group finds the next
+coordinate of all of its characters with a single array lookup and writes it to their Motion, instead of ticking
+every character.
+
+The step of the path and the frame counters of the animation are only advanced when a character leaves its group,
+either when its lookup steps run out or when it is woken because it is changed. The character is then in the same
+state as if it had been ticked every time.
+
+Classes:
+    CharacterArrays: The batched characters of an ActiveCharacters, in groups advanced with NumPy.
+"""
+
+from __future__ import annotations
+
+import bisect
+import itertools
+import typing
+
+if typing.TYPE_CHECKING:
+    from terminaltexteffects.engine.base_character import EffectCharacter
+    from terminaltexteffects.engine.motion import Motion, Path
+    from terminaltexteffects.utils.geometry import Coord
+
+
+class _CharacterGroup:
+    """Characters batched in the same update, ordered by their number of lookup ticks."""
+
+    __slots__ = ("entries", "motions", "lookup_ticks", "starts", "coords", "tick_count", "first")
+
+    def __init__(self, numpy: typing.Any, entries: list[tuple[tuple[int, EffectCharacter], int]]) -> None:
+        """Initializes the group and copies the coordinates of the lookup steps of each character.
+
+        Args:
+            numpy (typing.Any): the numpy module
+            entries (list[tuple[tuple[int, EffectCharacter], int]]): (sequence number, character) and number of lookup
+                ticks of each character, in order of the number of lookup ticks
+        """
+        # the entry and motion of characters which left the group are None
+        self.entries: list[tuple[int, EffectCharacter] | None] = []
+        self.motions: list[Motion | None] = []
+        self.lookup_ticks: list[int] = []
+        starts: list[int] = []
+        coords: list[Coord] = []
+        for entry, lookup_ticks in entries:
+            motion = typing.cast("Motion", entry[1]._motion)
+            active_path = typing.cast("Path", motion.active_path)
+            step_coords = typing.cast("list[Coord]", active_path._step_coords)
+            current_step = active_path.current_step
+            starts.append(len(coords))
+            coords.extend(step_coords[current_step : current_step + lookup_ticks])
+            self.entries.append(entry)
+            self.motions.append(motion)
+            self.lookup_ticks.append(lookup_ticks)
+        self.starts = numpy.array(starts, dtype=numpy.intp)
+        self.coords = numpy.empty(len(coords), dtype=object)
+        self.coords[:] = coords
+        # number of updates which advanced the group
+        self.tick_count = 0
+        # index of the first character with lookup ticks left, the characters before it have left the group
+        self.first = 0
+
+
+class CharacterArrays:
+    """The batched characters of an ActiveCharacters, in groups advanced with NumPy.
+
+    Supports len(), `in` with a character ID and iteration over the character IDs.
+    """
+
+    MAX_LOOKUP_TICKS = 64
+    """Maximum number of ticks a character stays batched before it is ticked again, which limits the number of
+    coordinates copied for each character."""
+
+    def __init__(self, numpy: typing.Any) -> None:
+        """Initializes the empty set of batched characters.
+
+        Args:
+            numpy (typing.Any): the numpy module
+        """
+        self._numpy = numpy
+        self._groups: list[_CharacterGroup] = []
+        # (group, index in the group) of each batched character, keyed by character ID
+        self._members: dict[int, tuple[_CharacterGroup, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __contains__(self, character_id: int) -> bool:
+        return character_id in self._members
+
+    def __iter__(self) -> typing.Iterator[int]:
+        return iter(list(self._members))
+
+    def add(self, entries: list[tuple[tuple[int, EffectCharacter], int]]) -> None:
+        """Batches characters as a new group. Each character is advanced by the following calls to advance() for its
+        number of lookup ticks, up to MAX_LOOKUP_TICKS.
+
+        Args:
+            entries (list[tuple[tuple[int, EffectCharacter], int]]): (sequence number, character) and number of lookup
+                ticks of each character, as returned by EffectCharacter._lookup_ticks()
+        """
+        max_lookup_ticks = self.MAX_LOOKUP_TICKS
+        entries = sorted(
+            ((entry, min(lookup_ticks, max_lookup_ticks)) for entry, lookup_ticks in entries), key=lambda item: item[1]
+        )
+        group = _CharacterGroup(self._numpy, entries)
+        self._groups.append(group)
+        members = self._members
+        for index, (entry, _) in enumerate(entries):
+            members[entry[1].character_id] = (group, index)
+
+    def advance(self) -> list[tuple[int, EffectCharacter]]:
+        """Moves every batched character to the next step of its path. Characters with no lookup ticks left leave the
+        batch with their counters advanced.
+
+        Returns:
+            list[tuple[int, EffectCharacter]]: (sequence number, character) of the characters which left the batch
+        """
+        left: list[tuple[int, EffectCharacter]] = []
+        groups = self._groups
+        for group in groups:
+            group.tick_count += 1
+            tick_count = group.tick_count
+            first = group.first
+            next_coords = group.coords[group.starts[first:] + (tick_count - 1)].tolist()
+            for motion, coord in zip(itertools.islice(group.motions, first, None), next_coords):
+                if motion is not None:
+                    motion.previous_coord = motion.current_coord
+                    motion.current_coord = coord
+            # characters are ordered by their number of lookup ticks, so the characters which are done are next
+            done = bisect.bisect_right(group.lookup_ticks, tick_count, first)
+            for index in range(first, done):
+                entry = group.entries[index]
+                if entry is not None:
+                    self._release(group, index)
+                    left.append(entry)
+            group.first = done
+        if groups and any(group.first == len(group.entries) for group in groups):
+            self._groups = [group for group in groups if group.first < len(group.entries)]
+        return left
+
+    def release(self, character: EffectCharacter) -> tuple[int, EffectCharacter]:
+        """Removes a character from the batch and advances its counters by the ticks it was batched for.
+
+        Args:
+            character (EffectCharacter): the batched character
+
+        Returns:
+            tuple[int, EffectCharacter]: the sequence number and the character
+        """
+        group, index = self._members[character.character_id]
+        entry = typing.cast("tuple[int, EffectCharacter]", group.entries[index])
+        self._release(group, index)
+        return entry
+
+    def _release(self, group: _CharacterGroup, index: int) -> None:
+        """Removes a character from its group and advances its counters by the ticks the group was advanced.
+
+        Args:
+            group (_CharacterGroup): the group of the character
+            index (int): the index of the character in the group
+        """
+        character = typing.cast("tuple[int, EffectCharacter]", group.entries[index])[1]
+        group.entries[index] = None
+        group.motions[index] = None
+        del self._members[character.character_id]
+        character._scheduler = None
+        character._skip_lookup_ticks(group.tick_count)
@@ -0,0 +1,219 @@
+"""A persistent cell grid holding the composited state of the canvas.
+
+The Framebuffer is sized once from the Canvas and updated in place every frame. It is used by the Terminal to build
+the formatted output string and can be read by anything else that needs the cell contents of the current frame, such
+as renderers, recorders, or headless consumers.
+
+Classes:
+    Framebuffer: Flat per-cell storage of the symbol, style and layer for every cell of the canvas.
+"""
+
+from __future__ import annotations
+
+from array import array
+
+from terminaltexteffects.engine.renderer import encode_row
+from terminaltexteffects.utils import sgr
+
+
+class Framebuffer:
+    """Flat per-cell storage for every cell of the canvas.
+
+    Cells are stored row by row starting from the bottom row, matching the canvas coordinate system where Coord(1, 1)
+    is the bottom left cell. The index of a cell is `(row - 1) * width + (column - 1)`.
+
+    Each cell holds the raw symbol and interned SGR style of the visual drawn in the cell (as found in
+    EffectCharacter.visual) and the layer of the character that drew it. The cells are cleared by slice assignment
+    from preallocated empty storage, so updating the framebuffer does not allocate per cell.
+
+    Readers that prefer integer cells can use the symbol_ids and style_ids properties, which intern each symbol and
+    style into an id indexing symbol_table and style_table.
+
+    Rows are formatted with encode_row(), which emits only the SGR changes between adjacent cells. The formatted rows
+    are kept between frames and a row is only formatted again when its cells change. Writers add the row of every
+    cell they write to dirty_rows (set_cell() does this), and clear() marks the rows written since the previous clear,
+    so only rows that were written in this frame or the previous frame are compared with their formatted cells. If
+    no cell changed since the rows were last formatted, no row is compared and to_string() returns the same string
+    object as the previous call, so consumers can detect an unchanged frame by identity.
+
+    Attributes:
+        width (int): Number of columns.
+        height (int): Number of rows.
+        symbols (list[str]): Raw symbol for each cell. Empty cells are a space.
+        styles (list[sgr.Style]): Style for each cell. Empty cells have the default style.
+        layers (list[int]): Layer of the character drawn in each cell, 0 for empty cells.
+        dirty_rows (set[int]): Rows written since the last clear, 1 is the bottom row.
+        symbol_table (list[str]): Symbol for each symbol id. Symbol id 0 is a space.
+        style_table (list[str]): SGR sequence for each style id. Style id 0 is the default style.
+
+    Properties:
+        symbol_ids (array[int]): Symbol id for each cell.
+        style_ids (array[int]): Style id for each cell.
+
+    Methods:
+        clear(): Resets every cell to an empty cell.
+        set_cell(column: int, row: int, symbol: str, style: sgr.Style, layer: int = 0): Writes a cell and marks its row.
+        cell_index(column: int, row: int) -> int: Returns the index of the cell at the given coordinate.
+        get_cell(column: int, row: int) -> tuple[str, str]: Returns the symbol and SGR sequence of the cell at the given coordinate.
+        get_rows() -> list[str]: Returns the formatted rows, top row first.
+        to_string() -> str: Returns the formatted rows joined by newlines, top row first.
+    """
+
+    def __init__(self, width: int, height: int) -> None:
+        """Initializes the Framebuffer with every cell empty.
+
+        Args:
+            width (int): number of columns
+            height (int): number of rows
+        """
+        self.width = width
+        self.height = height
+        self._empty_symbols = [" "] * (width * height)
+        self._empty_styles = [sgr.DEFAULT_STYLE] * (width * height)
+        self._empty_layers = [0] * (width * height)
+        self.symbols: list[str] = self._empty_symbols.copy()
+        self.styles: list[sgr.Style] = self._empty_styles.copy()
+        self.layers: list[int] = self._empty_layers.copy()
+        self.dirty_rows: set[int] = set()
+        self.symbol_table: list[str] = [" "]
+        self.style_table: list[str] = [""]
+        self._symbol_ids: dict[str, int] = {" ": 0}
+        self._style_ids: dict[sgr.Style, int] = {sgr.DEFAULT_STYLE: 0}
+        self._cleared_rows: set[int] = set()
+        # cells as of the last time the rows were formatted, to detect an unchanged frame without slicing any row
+        self._formatted_symbols = self._empty_symbols.copy()
+        self._formatted_styles = self._empty_styles.copy()
+        empty_row_symbols = [" "] * width
+        empty_row_styles = [sgr.DEFAULT_STYLE] * width
+        self._row_cells: list[tuple[list[str], list[sgr.Style]]] = [(empty_row_symbols, empty_row_styles)] * height
+        self._formatted_rows: list[str] = [encode_row(empty_row_symbols, empty_row_styles)] * height
+        self._string: str | None = None
+
+    def clear(self) -> None:
+        """Resets every cell to an empty cell."""
+        self.symbols[:] = self._empty_symbols
+        self.styles[:] = self._empty_styles
+        self.layers[:] = self._empty_layers
+        self._cleared_rows |= self.dirty_rows
+        self.dirty_rows.clear()
+
+    def set_cell(self, column: int, row: int, symbol: str, style: sgr.Style, layer: int = 0) -> None:
+        """Writes the cell at the given coordinate and marks its row as dirty.
+
+        Args:
+            column (int): column, 1 is the leftmost column
+            row (int): row, 1 is the bottom row
+            symbol (str): raw symbol drawn in the cell
+            style (sgr.Style): interned style the symbol is drawn with
+            layer (int, optional): layer of the character drawing the cell. Defaults to 0.
+        """
+        cell_index = self.cell_index(column, row)
+        self.symbols[cell_index] = symbol
+        self.styles[cell_index] = style
+        self.layers[cell_index] = layer
+        self.dirty_rows.add(row)
+
+    @property
+    def symbol_ids(self) -> array:
+        """Symbol id for each cell. Ids index into symbol_table.
+
+        Returns:
+            array[int]: symbol ids
+        """
+        symbol_ids = self._symbol_ids
+        for symbol in dict.fromkeys(self.symbols):
+            if symbol not in symbol_ids:
+                symbol_ids[symbol] = len(self.symbol_table)
+                self.symbol_table.append(symbol)
+        return array("I", map(symbol_ids.__getitem__, self.symbols))
+
+    @property
+    def style_ids(self) -> array:
+        """Style id for each cell. Ids index into style_table.
+
+        Returns:
+            array[int]: style ids
+        """
+        style_ids = self._style_ids
+        for style in dict.fromkeys(self.styles):
+            if style not in style_ids:
+                style_ids[style] = len(self.style_table)
+                self.style_table.append(sgr.get_sequence(style))
+        return array("I", map(style_ids.__getitem__, self.styles))
+
+    def cell_index(self, column: int, row: int) -> int:
+        """Returns the index of the cell at the given coordinate.
+
+        Args:
+            column (int): column, 1 is the leftmost column
+            row (int): row, 1 is the bottom row
+
+        Raises:
+            IndexError: if the coordinate is outside the framebuffer
+
+        Returns:
+            int: index into the cell storage
+        """
+        if not (1 <= column <= self.width and 1 <= row <= self.height):
+            raise IndexError(f"Cell ({column}, {row}) is outside the framebuffer ({self.width}x{self.height}).")
+        return (row - 1) * self.width + (column - 1)
+
+    def get_cell(self, column: int, row: int) -> tuple[str, str]:
+        """Returns the symbol and SGR sequence of the cell at the given coordinate.
+
+        Args:
+            column (int): column, 1 is the leftmost column
+            row (int): row, 1 is the bottom row
+
+        Returns:
+            tuple[str, str]: the raw symbol and the SGR sequence applied to it
+        """
+        cell_index = self.cell_index(column, row)
+        return self.symbols[cell_index], sgr.get_sequence(self.styles[cell_index])
+
+    def _format_rows(self) -> None:
+        """Formats the rows which changed since the rows were last formatted."""
+        symbols = self.symbols
+        styles = self.styles
+        if symbols == self._formatted_symbols and styles == self._formatted_styles:
+            self._cleared_rows.clear()
+            return
+        width = self.width
+        height = self.height
+        row_cells = self._row_cells
+        formatted_rows = self._formatted_rows
+        for row in self.dirty_rows | self._cleared_rows:
+            if not 0 < row <= height:
+                continue
+            row_start = (row - 1) * width
+            row_end = row_start + width
+            row_symbols = symbols[row_start:row_end]
+            row_styles = styles[row_start:row_end]
+            previous_symbols, previous_styles = row_cells[row - 1]
+            if previous_symbols != row_symbols or previous_styles != row_styles:
+                row_cells[row - 1] = (row_symbols, row_styles)
+                formatted_rows[row - 1] = encode_row(row_symbols, row_styles)
+                self._string = None
+        self._cleared_rows.clear()
+        self._formatted_symbols[:] = symbols
+        self._formatted_styles[:] = styles
+
+    def get_rows(self) -> list[str]:
+        """Returns the formatted rows, top row first. Each row starts and ends in the default SGR state.
+
+        Returns:
+            list[str]: formatted rows
+        """
+        self._format_rows()
+        return self._formatted_rows[::-1]
+
+    def to_string(self) -> str:
+        """Returns the formatted rows joined by newlines, top row first.
+
+        Returns:
+            str: the formatted frame
+        """
+        self._format_rows()
+        if self._string is None:
+            self._string = "\n".join(reversed(self._formatted_rows))
+        return self._string
@@ -9,8 +9,13 @@ Classes:
 
 from __future__ import annotations
 
+import bisect
+import functools
+import itertools
+import operator
+import sys
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from terminaltexteffects.utils import easing, geometry
 from terminaltexteffects.utils.geometry import Coord
@@ -18,8 +23,10 @@ from terminaltexteffects.utils.geometry import Coord
 if typing.TYPE_CHECKING:
     from terminaltexteffects.engine import base_character
 
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class Waypoint:
     """A Waypoint comprises a coordinate, speed, and, optionally, bezier control point(s).
 
@@ -46,7 +53,7 @@ class Waypoint:
         return hash(self.waypoint_id)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Segment:
     """A segment of a path consisting of two waypoints and the distance between them.
 
@@ -63,10 +70,8 @@ class Segment:
     start: Waypoint
     end: Waypoint
     distance: float
-
-    def __post_init__(self) -> None:
-        self.enter_event_triggered: bool = False
-        self.exit_event_triggered: bool = False
+    enter_event_triggered: bool = field(default=False, init=False, repr=False, compare=False)
+    exit_event_triggered: bool = field(default=False, init=False, repr=False, compare=False)
 
     def get_coord_on_segment(self, distance_factor: float) -> Coord:
         """Returns the coordinate at the given distance along the segment.
@@ -96,7 +101,96 @@ class Segment:
         return hash((self.start, self.end))
 
 
-@dataclass
+_SEGMENT_SCAN_LIMIT = 16
+"""Segments are scanned in Python when the segment containing a distance is expected within this many segments."""
+
+_MAX_CACHED_COORDS = 1 << 16
+_coords: dict[tuple[int, int], Coord] = {}
+"""Coordinates shared by compiled paths. Compiled paths hold a Coord for every step, interning them keeps the number of
+long-lived objects bounded by the number of distinct cells rather than the number of steps."""
+
+
+def _get_coord(column: int, row: int) -> Coord:
+    """Returns the interned Coord for a column and row.
+
+    Args:
+        column (int): column
+        row (int): row
+
+    Returns:
+        Coord: the interned coordinate
+    """
+    coord = _coords.get((column, row))
+    if coord is None:
+        if len(_coords) >= _MAX_CACHED_COORDS:
+            _coords.clear()
+        coord = _coords[(column, row)] = Coord(column, row)
+    return coord
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_distance_factors(ease: easing.EasingFunction | None, max_steps: int) -> tuple[float, ...]:
+    """Returns the fraction of the total distance reached at each step of a path. Paths with the same easing function
+    and number of steps share the result.
+
+    Args:
+        ease (easing.EasingFunction | None): easing function of the path
+        max_steps (int): number of steps in the path
+
+    Returns:
+        tuple[float, ...]: fraction of the total distance reached at steps 1 to max_steps
+    """
+    if ease:
+        return tuple(ease(step / max_steps) for step in range(1, max_steps + 1))
+    return tuple(step / max_steps for step in range(1, max_steps + 1))
+
+
+def _find_segment(
+    segment_distances: list[float], segment_ends: list[float], distance: float
+) -> tuple[int | None, float]:
+    """Returns the segment containing a distance along a path and the distance from the start of that segment.
+
+    The distance from the start of the segment is computed by subtracting the distance of each preceding segment in
+    order. The result is identical to scanning the segments one by one, including rounding, so coordinates rounded
+    from it do not depend on how the segment was found. Paths with many segments run the subtractions in C, limited by
+    a binary search over the segment end distances.
+
+    Args:
+        segment_distances (list[float]): distance of each segment
+        segment_ends (list[float]): cumulative distance at the end of each segment
+        distance (float): distance along the path
+
+    Returns:
+        tuple[int | None, float]: index of the first segment whose remaining distance is within the segment, or None
+            if the distance is beyond the last segment, and the distance from the start of that segment (the final
+            segment if None)
+    """
+    expected_index = 0
+    if len(segment_distances) > _SEGMENT_SCAN_LIMIT:
+        expected_index = bisect.bisect_left(segment_ends, distance)
+    if expected_index < _SEGMENT_SCAN_LIMIT:
+        for segment_index, segment_distance in enumerate(segment_distances):
+            if distance <= segment_distance:
+                return segment_index, distance
+            distance -= segment_distance
+        return None, distance + segment_distances[-1]
+    # remaining[i] is the distance left after subtracting the distances of the segments before segment i
+    scan_count = expected_index + 2
+    remaining = list(
+        itertools.accumulate(itertools.islice(segment_distances, scan_count), operator.sub, initial=distance)
+    )
+    within_segment = map(operator.le, remaining, segment_distances)
+    segment_index = next(itertools.compress(itertools.count(), within_segment), None)
+    if segment_index is None and scan_count < len(segment_distances):
+        remaining = list(itertools.accumulate(segment_distances, operator.sub, initial=distance))
+        within_segment = map(operator.le, remaining, segment_distances)
+        segment_index = next(itertools.compress(itertools.count(), within_segment), None)
+    if segment_index is None:
+        return None, remaining[-1] + segment_distances[-1]
+    return segment_index, remaining[segment_index]
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Path:
     """
     Represents a path consisting of multiple waypoints for motion.
@@ -114,6 +208,8 @@ class Path:
             Creates a new Waypoint and appends adds it to the Path.
         query_waypoint(waypoint_id: str) -> Waypoint:
             Returns the waypoint with the given waypoint_id.
+        compile() -> None:
+            Computes the coordinate, distance and segment events for every step of the path.
         step(event_handler: base_character.EventHandler) -> Coord:
             Progresses to the next step along the path and returns the coordinate at that step.
     """
@@ -124,6 +220,19 @@ class Path:
     layer: int | None = None
     hold_time: int = 0
     loop: bool = False
+    segments: list[Segment] = field(init=False, repr=False, compare=False)
+    waypoints: list[Waypoint] = field(init=False, repr=False, compare=False)
+    waypoint_lookup: dict[str, Waypoint] = field(init=False, repr=False, compare=False)
+    total_distance: float = field(init=False, repr=False, compare=False)
+    current_step: int = field(init=False, repr=False, compare=False)
+    max_steps: int = field(init=False, repr=False, compare=False)
+    hold_time_remaining: int = field(init=False, repr=False, compare=False)
+    last_distance_reached: float = field(init=False, repr=False, compare=False)
+    origin_segment: Segment | None = field(init=False, repr=False, compare=False)
+    _step_coords: list[Coord] | None = field(init=False, repr=False, compare=False)
+    _step_distances: list[float] = field(init=False, repr=False, compare=False)
+    _step_events: dict[int, list[tuple[Segment, bool]]] = field(init=False, repr=False, compare=False)
+    _event_steps: list[int] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """
@@ -138,6 +247,11 @@ class Path:
         self.hold_time_remaining = self.hold_time
         self.last_distance_reached: float = 0  # used for animation syncing to distance
         self.origin_segment: Segment | None = None
+        self._step_coords: list[Coord] | None = None
+        self._step_distances: list[float] = []
+        self._step_events: dict[int, list[tuple[Segment, bool]]] = {}
+        # steps which trigger segment events, in order
+        self._event_steps: list[int] = []
         if self.speed <= 0:
             raise ValueError(f"({self.speed=}) Speed must be greater than 0.")
 
@@ -194,6 +308,7 @@ class Path:
         self.total_distance += distance_from_previous
         self.segments.append(Segment(self.waypoints[-2], waypoint, distance_from_previous))
         self.max_steps = round(self.total_distance / self.speed)
+        self._step_coords = None
 
     def query_waypoint(self, waypoint_id: str) -> Waypoint:
         """Returns the waypoint with the given waypoint_id.
@@ -209,12 +324,101 @@ class Path:
             raise ValueError(f"Waypoint with id {waypoint_id} not found.")
         return waypoint
 
+    def compile(self) -> None:
+        """Computes the coordinate and distance travelled for every step of the path, along with the segment enter and
+        exit events triggered at each step. The path is compiled automatically by the first call to step() after the
+        path is activated or modified.
+
+        The segment containing each step is found with the same sequence of subtractions as scanning the segments, and
+        coordinates on lines are computed with the same expression as geometry.find_coord_on_line(), so the results are
+        identical to computing each step when it is reached. The number of steps on a bezier curve still follows from
+        geometry.find_length_of_bezier_curve(), while the steps are spaced along the curve with its arc length table,
+        so characters move along curves at a constant speed.
+        """
+        distance_factors = _get_distance_factors(self.ease, self.max_steps)
+        segments = self.segments
+        segment_distances = [segment.distance for segment in segments]
+        segment_ends = list(itertools.accumulate(segment_distances))
+        segment_count = len(segments)
+        scan_segments = segment_count <= _SEGMENT_SCAN_LIMIT
+        total_distance = self.total_distance
+        step_coords: list[Coord] = []
+        step_distances: list[float] = []
+        step_events: dict[int, list[tuple[Segment, bool]]] = {}
+        entered: set[int] = set()
+        exited_count = 0
+        previous_segment_index = previous_passed_count = -1
+        coords = _coords
+        for step, distance_factor in enumerate(distance_factors, 1):
+            distance_to_travel = distance_factor * total_distance
+            step_distances.append(distance_to_travel)
+            if scan_segments:
+                segment_distance_to_travel = distance_to_travel
+                for segment_index, segment_distance in enumerate(segment_distances):
+                    if segment_distance_to_travel <= segment_distance:
+                        break
+                    segment_distance_to_travel -= segment_distance
+                else:
+                    segment_index = None
+                    segment_distance_to_travel += segment_distances[-1]
+            else:
+                segment_index, segment_distance_to_travel = _find_segment(
+                    segment_distances, segment_ends, distance_to_travel
+                )
+            if segment_index is None:
+                # beyond the last segment, the distance is measured from the start of the final segment
+                passed_count = segment_count
+                segment_index = segment_count - 1
+            else:
+                passed_count = segment_index
+            # events and segment coordinates only change when the step reaches a different segment
+            if segment_index != previous_segment_index or passed_count != previous_passed_count:
+                previous_segment_index, previous_passed_count = segment_index, passed_count
+                active_segment = segments[segment_index]
+                start_column, start_row = active_segment.start.coord.column, active_segment.start.coord.row
+                end_column, end_row = active_segment.end.coord.column, active_segment.end.coord.row
+                curve = None
+                if active_segment.end.bezier_control:
+                    curve = geometry.get_bezier_curve(
+                        active_segment.start.coord, active_segment.end.bezier_control, active_segment.end.coord
+                    )
+                events: list[tuple[Segment, bool]] = []
+                # segments are exited in order and each is exited once, so only newly passed segments trigger events
+                if passed_count > exited_count:
+                    events.extend((segments[index], False) for index in range(exited_count, passed_count))
+                    exited_count = passed_count
+                if passed_count == segment_index and segment_index not in entered:
+                    entered.add(segment_index)
+                    events.append((active_segment, True))
+                if events:
+                    step_events[step] = events
+            if active_segment.distance == 0:
+                t = 0.0
+            else:
+                t = segment_distance_to_travel / active_segment.distance
+            if curve is not None:
+                # the segment distance sets the number of steps, the arc length table spaces them along the curve
+                coord = curve.find_coord_at_distance(t * curve.length)
+                column, row = coord.column, coord.row
+            else:
+                column = round((1 - t) * start_column + t * end_column)
+                row = round((1 - t) * start_row + t * end_row)
+            coord = coords.get((column, row))
+            if coord is None:
+                coord = _get_coord(column, row)
+            step_coords.append(coord)
+        self._step_coords = step_coords
+        self._step_distances = step_distances
+        self._step_events = step_events
+        self._event_steps = list(step_events)
+
     def step(self, event_handler: "base_character.EventHandler") -> Coord:
         """
         Progresses to the next step along the path and returns the coordinate at that step.
 
-        This method is called by the Motion.move() method. It calculates the next coordinate based on the current step,
-        total distance, bezier control points, and the easing function if provided. It also handles the triggering of segment enter and exit events.
+        This method is called by the Motion.move() method. The coordinates, distances and segment events for every step
+        are computed by compile() when the path is first stepped after activation, so each step is a lookup. It also
+        handles the triggering of segment enter and exit events.
 
         Args:
             event_handler (base_character.EventHandler): The EventHandler for the character.
@@ -222,49 +426,30 @@ class Path:
         Returns:
             Coord: The next coordinate on the path.
         """
-        if not self.max_steps or self.current_step >= self.max_steps or not self.total_distance:
+        current_step = self.current_step
+        if current_step >= self.max_steps or not self.total_distance:
             # if the path has zero distance or there are no more steps, return the coordinate of the final waypoint in the path
             return self.segments[-1].end.coord
-        else:
-            self.current_step += 1
-        if self.ease:
-            distance_factor = self.ease(self.current_step / self.max_steps)
-        else:
-            distance_factor = self.current_step / self.max_steps
-
-        distance_to_travel = distance_factor * self.total_distance
-        self.last_distance_reached = distance_to_travel
-        for segment in self.segments:
-            if distance_to_travel <= segment.distance:
-                active_segment = segment
-                if not segment.enter_event_triggered:
-                    segment.enter_event_triggered = True
-                    event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
-                break
-            distance_to_travel -= segment.distance
-            if not segment.exit_event_triggered:
-                segment.exit_event_triggered = True
-                event_handler._handle_event(event_handler.Event.SEGMENT_EXITED, segment.end)
-        else:  # if the distance_to_travel is further than the last waypoint, preserve the distance from the start of the final segment
-            active_segment = self.segments[-1]
-            distance_to_travel += active_segment.distance
-        if active_segment.distance == 0:
-            segment_distance_to_travel_factor = 0.0
-        else:
-            segment_distance_to_travel_factor = distance_to_travel / active_segment.distance
-
-        if active_segment.end.bezier_control:
-            next_coord = geometry.find_coord_on_bezier_curve(
-                active_segment.start.coord,
-                active_segment.end.bezier_control,
-                active_segment.end.coord,
-                segment_distance_to_travel_factor,
-            )
-        else:
-            next_coord = geometry.find_coord_on_line(
-                active_segment.start.coord, active_segment.end.coord, segment_distance_to_travel_factor
-            )
-
+        step_coords = self._step_coords
+        if step_coords is None:
+            self.compile()
+            step_coords = typing.cast("list[Coord]", self._step_coords)
+        self.current_step = current_step + 1
+        self.last_distance_reached = self._step_distances[current_step]
+        next_coord = step_coords[current_step]
+        if self.current_step == self.max_steps:
+            # the path is complete, release the compiled steps until it is stepped again
+            self._step_coords = None
+        events = self._step_events.get(self.current_step)
+        if events:
+            for segment, is_enter_event in events:
+                if is_enter_event:
+                    if not segment.enter_event_triggered:
+                        segment.enter_event_triggered = True
+                        event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
+                elif not segment.exit_event_triggered:
+                    segment.exit_event_triggered = True
+                    event_handler._handle_event(event_handler.Event.SEGMENT_EXITED, segment.end)
         return next_coord
 
     def __eq__(self, other: typing.Any) -> bool:
@@ -306,24 +491,40 @@ class Motion:
         move() -> None:
             Moves the character one step closer to the target position based on an easing function if present, otherwise linearly."""
 
+    __slots__ = ("_paths", "character", "current_coord", "previous_coord", "active_path", "completed_path")
+
     def __init__(self, character: "base_character.EffectCharacter"):
-        """Initializes the Motion object with the given EffectCharacter.
+        """Initializes the Motion object with the given EffectCharacter. The paths dictionary is created when first
+        used.
 
         Args:
             character (base_character.EffectCharacter): The EffectCharacter to move.
         """
-        self.paths: dict[str, Path] = {}
+        self._paths: dict[str, Path] | None = None
         self.character = character
-        self.current_coord: Coord = Coord(character.input_coord.column, character.input_coord.row)
-        self.previous_coord: Coord = Coord(-1, -1)
+        # coordinates are immutable, so the input coordinate and the interned initial previous coordinate are shared
+        self.current_coord: Coord = character.input_coord
+        self.previous_coord: Coord = _get_coord(-1, -1)
         self.active_path: Path | None = None
 
+    @property
+    def paths(self) -> dict[str, Path]:
+        """Mapping of path_id to Path for the paths of the character.
+
+        Returns:
+            dict[str, Path]: the paths
+        """
+        if self._paths is None:
+            self._paths = {}
+        return self._paths
+
     def set_coordinate(self, coord: Coord) -> None:
         """Sets the current coordinate to the given coordinate.
 
         Args:
             coord (Coord): coordinate
         """
+        self.character._wake()
         self.current_coord = coord
 
     def new_path(
@@ -391,6 +592,63 @@ class Motion:
             return True
         return False
 
+    def _idle_ticks(self) -> int:
+        """Returns the number of following calls to move() which would only count down the hold time of the active
+        path, without moving the character or triggering an event.
+
+        Returns:
+            int: the number of idle moves, sys.maxsize if there is no path in progress
+        """
+        active_path = self.active_path
+        if active_path is None or not active_path.segments:
+            return sys.maxsize
+        if active_path.current_step < active_path.max_steps:
+            return 0
+        if active_path.hold_time and active_path.hold_time_remaining == active_path.hold_time:
+            return 0
+        if self.current_coord != active_path.segments[-1].end.coord:
+            return 0
+        return active_path.hold_time_remaining
+
+    def _skip_idle_ticks(self, ticks: int) -> None:
+        """Counts down the hold time of the active path by a number of idle moves, as returned by _idle_ticks().
+
+        Args:
+            ticks (int): the number of moves to count
+        """
+        self.previous_coord = self.current_coord
+        if self.active_path is not None and self.active_path.segments:
+            self.active_path.hold_time_remaining -= ticks
+
+    def _lookup_ticks(self) -> int:
+        """Returns the number of following calls to move() which would only look up the next compiled step of the
+        active path, without reaching the end of the path or triggering an event.
+
+        Returns:
+            int: the number of lookup moves
+        """
+        active_path = self.active_path
+        if active_path is None or active_path._step_coords is None:
+            return 0
+        current_step = active_path.current_step
+        end_step = active_path.max_steps
+        event_steps = active_path._event_steps
+        event_index = bisect.bisect_right(event_steps, current_step)
+        if event_index < len(event_steps) and event_steps[event_index] < end_step:
+            end_step = event_steps[event_index]
+        return max(end_step - current_step - 1, 0)
+
+    def _skip_lookup_ticks(self, ticks: int) -> None:
+        """Advances the active path by a number of lookup moves, as returned by _lookup_ticks(). The current and
+        previous coordinates are not changed, they are kept up to date by the caller while the moves are skipped.
+
+        Args:
+            ticks (int): the number of moves to count
+        """
+        active_path = typing.cast(Path, self.active_path)
+        active_path.current_step += ticks
+        active_path.last_distance_reached = active_path._step_distances[active_path.current_step - 1]
+
     def _get_easing_factor(self, easing_func: easing.EasingFunction) -> float:
         """Returns the percentage of total distance that should be moved based on the easing function.
 
@@ -449,6 +707,7 @@ class Motion:
         Args:
             path (Path): The path to activate.
         """
+        self.character._wake()
         self.active_path = path
         first_waypoint = self.active_path.waypoints[0]
         if first_waypoint.bezier_control:
@@ -471,6 +730,8 @@ class Motion:
         self.active_path.current_step = 0
         self.active_path.hold_time_remaining = self.active_path.hold_time
         self.active_path.max_steps = round(self.active_path.total_distance / self.active_path.speed)
+        # the origin segment changed, the path is compiled again when it is first stepped
+        self.active_path._step_coords = None
         for segment in self.active_path.segments:
             segment.enter_event_triggered = False
             segment.exit_event_triggered = False
@@ -484,6 +745,7 @@ class Motion:
         Args:
             path (Path): the Path to deactivate
         """
+        self.character._wake()
         if self.active_path and self.active_path is path:
             self.active_path = None
 
@@ -504,10 +766,21 @@ class Motion:
 
         The character's previous coordinate is preserved before moving to allow for clearing the location in the terminal.
         """
+        if self.character._scheduler is not None:
+            self.character._wake()
         # preserve previous coordinate to allow for clearing the location in the terminal
-        self.previous_coord = Coord(self.current_coord.column, self.current_coord.row)
+        self.previous_coord = self.current_coord
 
-        if not self.active_path or not self.active_path.segments:
+        active_path = self.active_path
+        if not active_path or not active_path.segments:
+            return
+        # a compiled step before the end of the path which triggers no events is a lookup
+        next_step = active_path.current_step + 1
+        step_coords = active_path._step_coords
+        if step_coords is not None and next_step < active_path.max_steps and next_step not in active_path._step_events:
+            active_path.current_step = next_step
+            active_path.last_distance_reached = active_path._step_distances[next_step - 1]
+            self.current_coord = step_coords[next_step - 1]
             return
         self.current_coord = self.active_path.step(self.character.event_handler)
         if self.active_path.current_step == self.active_path.max_steps:
@@ -0,0 +1,305 @@
+"""Bytes-native output for frames written to the terminal.
+
+Frames are assembled into a single reusable bytearray and written to the file descriptor behind the output stream
+with one os.write loop, bypassing the text layer of sys.stdout. The bytes of the most recent frame remain available as
+a memoryview until the next frame is started.
+
+ThreadedOutputSink moves the write to a background thread, so the next frame can be computed while the terminal is
+consuming the previous one.
+
+Classes:
+    OutputSink: Assembles output into a reusable bytearray and writes it to a stream's file descriptor.
+    ThreadedOutputSink: An OutputSink which writes frames from a background thread using a fixed pool of buffers.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import queue
+import sys
+import threading
+import typing
+
+if typing.TYPE_CHECKING:
+    from terminaltexteffects.engine.asciicast import AsciicastRecorder
+
+
+class OutputSink:
+    """Assembles output into a reusable bytearray and writes it to the file descriptor of a stream.
+
+    Text is encoded with the encoding of the stream. Escape sequences that are written repeatedly, such as cursor
+    movement, are encoded once and cached. Frame payloads are encoded with a single str.encode() call per frame.
+
+    If the stream does not have a file descriptor (for example, when stdout is replaced by an io.StringIO), the output
+    is written to the binary buffer of the stream if it has one, or decoded and written to the stream as text. On
+    Windows the file descriptor is never written to directly, as bytes written to the descriptor of a console bypass
+    the console layer of the stream and are decoded in the active code page of the console. The binary buffer of the
+    stream is used instead.
+
+    Attributes:
+        frames_written (int): Number of calls to flush() that wrote output.
+        bytes_written (int): Total number of bytes written.
+        recorder (AsciicastRecorder | None): If set, everything written is also recorded as an output event.
+
+    Properties:
+        frame (memoryview): Read-only view of the output assembled since the last flush, or of the most recently
+            flushed output if nothing has been written since.
+
+    Methods:
+        begin_frame(): Discards any output that has not been flushed and the previously flushed output.
+        write(text: str): Encodes text and appends it to the output.
+        write_sequence(sequence: str): Appends an escape sequence, using a cached encoding.
+        write_bytes(data: bytes | bytearray | memoryview): Appends already encoded bytes to the output.
+        flush(): Writes the pending output to the stream.
+        close(): Writes the pending output and waits until all output has been written.
+    """
+
+    def __init__(self, stream: typing.TextIO | None = None) -> None:
+        """Initializes the OutputSink.
+
+        Args:
+            stream (typing.TextIO | None, optional): Stream to write to. If None, sys.stdout is looked up each time
+                output is flushed. Defaults to None.
+        """
+        self._stream = stream
+        self._buffer = bytearray()
+        self._flushed = False
+        self._encoded_sequences: dict[str, bytes] = {}
+        self._stream_details: tuple[typing.TextIO, int | None, str, str] | None = None
+        self.frames_written = 0
+        self.bytes_written = 0
+        self.recorder: AsciicastRecorder | None = None
+
+    @property
+    def stream(self) -> typing.TextIO:
+        """The stream output is written to.
+
+        Returns:
+            typing.TextIO: the stream
+        """
+        return self._stream if self._stream is not None else sys.stdout
+
+    @property
+    def frame(self) -> memoryview:
+        """Read-only view of the output assembled since the last flush, or of the most recently flushed output if
+        nothing has been written since. The view is valid until the next write.
+
+        Returns:
+            memoryview: view of the output bytes
+        """
+        return memoryview(self._buffer).toreadonly()
+
+    def begin_frame(self) -> None:
+        """Discards any output that has not been flushed and the previously flushed output. Called automatically
+        before output is appended after a flush."""
+        self._flushed = False
+        try:
+            self._buffer.clear()
+        except BufferError:
+            # a view of the previous frame is still held, leave it intact and assemble into a new buffer
+            self._buffer = bytearray()
+
+    def write(self, text: str) -> None:
+        """Encodes text and appends it to the output.
+
+        Args:
+            text (str): text to write
+        """
+        if self._flushed:
+            self.begin_frame()
+        _, _, encoding, errors = self._get_stream_details()
+        self._buffer += text.encode(encoding, errors)
+
+    def write_sequence(self, sequence: str) -> None:
+        """Appends an escape sequence to the output. The encoded sequence is cached, so this should only be used for
+        sequences that are written repeatedly.
+
+        Args:
+            sequence (str): escape sequence to write
+        """
+        if self._flushed:
+            self.begin_frame()
+        encoded_sequence = self._encoded_sequences.get(sequence)
+        if encoded_sequence is None:
+            encoded_sequence = self._encoded_sequences[sequence] = sequence.encode("ascii")
+        self._buffer += encoded_sequence
+
+    def write_bytes(self, data: bytes | bytearray | memoryview) -> None:
+        """Appends already encoded bytes to the output.
+
+        Args:
+            data (bytes | bytearray | memoryview): bytes to write
+        """
+        if self._flushed:
+            self.begin_frame()
+        self._buffer += data
+
+    def _get_stream_details(self) -> tuple[typing.TextIO, int | None, str, str]:
+        """Returns the stream along with its file descriptor, encoding and encoding error handler. The details are
+        cached until the stream changes.
+
+        Returns:
+            tuple[typing.TextIO, int | None, str, str]: the stream, its file descriptor (None if the stream is not
+                backed by one or on Windows), encoding and error handler
+        """
+        stream = self.stream
+        if self._stream_details is None or self._stream_details[0] is not stream:
+            file_descriptor: int | None = None
+            if sys.platform != "win32":
+                try:
+                    file_descriptor = stream.fileno()
+                except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+                    pass
+            self._stream_details = (
+                stream,
+                file_descriptor,
+                getattr(stream, "encoding", None) or "utf-8",
+                getattr(stream, "errors", None) or "strict",
+            )
+        return self._stream_details
+
+    def _write_buffer(self, buffer: bytearray) -> None:
+        """Writes a buffer to the stream and updates the output statistics.
+
+        Args:
+            buffer (bytearray): output to write
+        """
+        stream, file_descriptor, encoding, errors = self._get_stream_details()
+        # anything written through the text layer of the stream must reach the terminal first
+        stream.flush()
+        if file_descriptor is not None:
+            with memoryview(buffer) as pending:
+                bytes_written = 0
+                while bytes_written < len(pending):
+                    bytes_written += os.write(file_descriptor, pending[bytes_written:])
+        elif hasattr(stream, "buffer"):
+            stream.buffer.write(buffer)
+            stream.buffer.flush()
+        else:
+            stream.write(buffer.decode(encoding, errors))
+            stream.flush()
+        self.frames_written += 1
+        self.bytes_written += len(buffer)
+        if self.recorder is not None:
+            self.recorder.write_output(buffer.decode(encoding, "replace"))
+
+    def flush(self) -> None:
+        """Writes the output assembled since the last flush to the stream. The output remains available through the
+        frame property until the next write."""
+        if self._flushed or not self._buffer:
+            return
+        self._write_buffer(self._buffer)
+        self._flushed = True
+
+    def close(self) -> None:
+        """Writes the pending output and waits until all output has been written."""
+        self.flush()
+
+
+class ThreadedOutputSink(OutputSink):
+    """An OutputSink which writes frames from a background thread.
+
+    Flushing hands the assembled buffer to a writer thread and returns immediately, so the next frame can be computed
+    while the previous one is written. Output is assembled into a fixed pool of buffers. When every buffer is waiting
+    to be written, starting the next frame blocks until the writer thread returns a buffer. This provides backpressure
+    when the terminal cannot keep up, and limits the output queued for the terminal to `buffer_count - 1` frames.
+
+    Errors raised while writing are raised by the next call to flush() or close().
+
+    Attributes:
+        buffer_count (int): Number of buffers in the pool.
+        backpressure_waits (int): Number of frames that waited for the writer thread to return a buffer.
+
+    Methods:
+        close(): Writes the pending output, waits until all output has been written and stops the writer thread.
+    """
+
+    def __init__(self, stream: typing.TextIO | None = None, buffer_count: int = 2) -> None:
+        """Initializes the ThreadedOutputSink.
+
+        Args:
+            stream (typing.TextIO | None, optional): Stream to write to. If None, sys.stdout is looked up each time
+                output is written. Defaults to None.
+            buffer_count (int, optional): Number of buffers in the pool. Must be at least 2: one being written and one
+                being assembled. Defaults to 2.
+
+        Raises:
+            ValueError: if buffer_count is less than 2
+        """
+        if buffer_count < 2:
+            raise ValueError(f"buffer_count must be at least 2, got {buffer_count}.")
+        super().__init__(stream)
+        self.buffer_count = buffer_count
+        self.backpressure_waits = 0
+        self._free_buffers: queue.SimpleQueue[bytearray] = queue.SimpleQueue()
+        for _ in range(buffer_count - 1):
+            self._free_buffers.put(bytearray())
+        self._pending_buffers: queue.Queue[bytearray | None] = queue.Queue()
+        self._writer: threading.Thread | None = None
+        self._writer_error: BaseException | None = None
+
+    def begin_frame(self) -> None:
+        """Discards any output that has not been flushed. If the previous output was flushed, a buffer is taken from
+        the pool, waiting for the writer thread to return one if necessary."""
+        if self._flushed:
+            try:
+                self._buffer = self._free_buffers.get_nowait()
+            except queue.Empty:
+                self.backpressure_waits += 1
+                self._buffer = self._free_buffers.get()
+        super().begin_frame()
+
+    def _run_writer(self) -> None:
+        """Writes buffers from the pending queue until the stop sentinel is received. Buffers are returned to the
+        pool after they have been written."""
+        while True:
+            buffer = self._pending_buffers.get()
+            try:
+                if buffer is None:
+                    return
+                if self._writer_error is None:
+                    self._write_buffer(buffer)
+            except BaseException as error:  # noqa: BLE001
+                # raised on the main thread by the next flush() or close()
+                self._writer_error = error
+            finally:
+                if buffer is not None:
+                    self._free_buffers.put(buffer)
+                self._pending_buffers.task_done()
+
+    def _raise_writer_error(self) -> None:
+        """Raises the error encountered by the writer thread, if any."""
+        if self._writer_error is not None:
+            error, self._writer_error = self._writer_error, None
+            raise error
+
+    def flush(self) -> None:
+        """Hands the output assembled since the last flush to the writer thread. The output remains available through
+        the frame property until the next write.
+
+        Raises:
+            BaseException: the error encountered by the writer thread while writing previous output
+        """
+        self._raise_writer_error()
+        if self._flushed or not self._buffer:
+            return
+        if self._writer is None:
+            self._writer = threading.Thread(target=self._run_writer, name="tte-output-writer", daemon=True)
+            self._writer.start()
+        self._pending_buffers.put(self._buffer)
+        self._flushed = True
+
+    def close(self) -> None:
+        """Writes the pending output, waits until all output has been written and stops the writer thread. The
+        writer thread is started again if more output is flushed.
+
+        Raises:
+            BaseException: the error encountered by the writer thread while writing output
+        """
+        self.flush()
+        if self._writer is not None:
+            self._pending_buffers.put(None)
+            self._writer.join()
+            self._writer = None
+        self._raise_writer_error()
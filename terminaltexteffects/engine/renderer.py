@@ -0,0 +1,250 @@
+"""Renderers that convert frames produced by an effect into the escape sequences written to the terminal.
+
+Frames are passed around as strings (rows separated by newlines, top row first) so the same frame can be printed by
+the Terminal, handed to a TUI, or recorded. Rows are formatted from structured cells by encode_row(), which tracks the
+SGR state across the row and emits only the changes between adjacent cells. The renderers in this module work from the
+formatted strings and keep whatever state they need between frames.
+
+Functions:
+    encode_row: Formats a row of structured cells, emitting only the SGR changes between adjacent cells.
+    parse_row_cells: Splits a row of formatted output into (style, symbol) cells.
+
+Classes:
+    DiffRenderer: Keeps the previously emitted cell grid and produces output that rewrites only the cells that changed.
+"""
+
+from __future__ import annotations
+
+import itertools
+import operator
+import re
+import typing
+
+from terminaltexteffects.utils import ansitools, sgr
+
+_SGR_SEQUENCE = re.compile(r"\x1b\[([0-9;]*)m")
+"""Splits a row into text chunks and SGR parameters. The capture group keeps the parameters in the split result."""
+
+_MAX_CACHED_TRANSITIONS = 1 << 16
+_transitions: dict[tuple[sgr.Style, sgr.Style], tuple[str, bool]] = {}
+
+
+def encode_row(symbols: typing.Sequence[str], styles: typing.Sequence[sgr.Style]) -> str:
+    """Formats a row of structured cells, emitting only the SGR changes between adjacent cells.
+
+    The row starts in the default SGR state. Cells are grouped into runs of the same style and a sequence is only
+    emitted when the style of a run differs from the style in effect. Runs of spaces are drawn in the current style
+    when they would look the same as spaces with their own style. If the row does not end in the default state, a
+    reset is appended so rows can be printed independently.
+
+    Args:
+        symbols (typing.Sequence[str]): The raw symbol for each cell in the row, left to right.
+        styles (typing.Sequence[sgr.Style]): The interned style for each cell in the row, left to right.
+
+    Returns:
+        str: The formatted row.
+    """
+    cell_count = len(symbols)
+    run_starts = [0, *itertools.compress(range(1, cell_count), map(operator.is_not, styles[1:], styles))]
+    if len(run_starts) == 1 and not styles[0]:
+        return "".join(symbols)
+    run_ends = run_starts[1:]
+    run_ends.append(cell_count)
+    output: list[str] = []
+    append = output.append
+    join = "".join
+    transitions = _transitions
+    state = sgr.DEFAULT_STYLE
+    state_space_invisible = True
+    for run_start, run_end in zip(run_starts, run_ends):
+        style = styles[run_start]
+        text = symbols[run_start] if run_end - run_start == 1 else join(symbols[run_start:run_end])
+        if style is not state:
+            transition = transitions.get((state, style))
+            if transition is None:
+                transition = _get_transition(state, style)
+            if state_space_invisible and transition[1] and not text.strip(" "):
+                append(text)
+                continue
+            append(transition[0])
+            state = style
+            state_space_invisible = transition[1]
+        append(text)
+    if state:
+        append(ansitools.RESET_ALL())
+    return join(output)
+
+
+def _get_transition(current_style: sgr.Style, style: sgr.Style) -> tuple[str, bool]:
+    """Returns the SGR sequence that changes the terminal from one style to another and whether a space drawn with the
+    new style looks the same as a space with the default style. The result is cached for encode_row().
+
+    Args:
+        current_style (sgr.Style): the style currently in effect
+        style (sgr.Style): the style to change to
+
+    Returns:
+        tuple[str, bool]: the SGR sequence and whether the new style is invisible on spaces
+    """
+    if len(_transitions) >= _MAX_CACHED_TRANSITIONS:
+        _transitions.clear()
+    transition = _transitions[(current_style, style)] = (
+        sgr.get_transition(current_style, style),
+        sgr.is_space_invisible(style),
+    )
+    return transition
+
+
+def parse_row_cells(row: str) -> list[tuple[sgr.Style, str]]:
+    """Splits a row of formatted output into cells.
+
+    Each cell is a tuple of the SGR style in effect when the cell is drawn and the symbol drawn in the cell. Styles are
+    interned, so two cells compare equal only if they would be drawn identically, regardless of the sequences used to
+    reach the style.
+
+    Args:
+        row (str): A single row of formatted output.
+
+    Returns:
+        list[tuple[sgr.Style, str]]: The (style, symbol) tuple for each cell in the row.
+    """
+    cells: list[tuple[sgr.Style, str]] = []
+    style = sgr.DEFAULT_STYLE
+    for chunk_index, chunk in enumerate(_SGR_SEQUENCE.split(row)):
+        if chunk_index % 2:
+            style = sgr.apply_parameters(style, chunk)
+        else:
+            cells.extend((style, symbol) for symbol in chunk)
+    return cells
+
+
+class DiffRenderer:
+    """Produces terminal output that rewrites only the cells that changed since the previous frame.
+
+    The first frame is written in full. For each following frame, rows are compared to the previously emitted rows
+    and only rows that differ are split into cells. Changed cells are grouped into runs, and runs separated by a
+    short gap of unchanged cells are coalesced when rewriting the gap is cheaper than moving the cursor past it.
+
+    Cursor positioning is relative to the position saved by Terminal.prep_canvas(), which is the row below the bottom
+    row of the canvas.
+
+    Attributes:
+        frames_rendered (int): Number of frames passed to render().
+        bytes_rendered (int): Total length of the output produced by render().
+
+    Methods:
+        render(output_string: str) -> str: Returns the output required to update the terminal to the given frame.
+        reset(): Forget the previously emitted frame. The next frame will be written in full.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the DiffRenderer with no previously emitted frame."""
+        self._previous_rows: list[str] = []
+        self._previous_cells: dict[int, list[tuple[sgr.Style, str]]] = {}
+        self.frames_rendered = 0
+        self.bytes_rendered = 0
+
+    def reset(self) -> None:
+        """Forget the previously emitted frame. The next frame will be written in full."""
+        self._previous_rows = []
+        self._previous_cells = {}
+
+    def render(self, output_string: str) -> str:
+        """Returns the output required to update the terminal from the previously emitted frame to the given frame.
+
+        Args:
+            output_string (str): The formatted frame, rows separated by newlines with the top row first.
+
+        Returns:
+            str: Escape sequences and cells to write to the terminal. Empty if nothing changed.
+        """
+        rows = output_string.split("\n")
+        if len(rows) != len(self._previous_rows):
+            output = ansitools.DEC_RESTORE_CURSOR_POSITION() + ansitools.MOVE_CURSOR_UP(len(rows)) + output_string
+            self._previous_cells = {}
+        else:
+            output = self._render_changed_rows(rows)
+        self._previous_rows = rows
+        self.frames_rendered += 1
+        self.bytes_rendered += len(output)
+        return output
+
+    def _render_changed_rows(self, rows: list[str]) -> str:
+        """Builds the output for every row that differs from the previously emitted frame.
+
+        Args:
+            rows (list[str]): The rows of the new frame, top row first.
+
+        Returns:
+            str: Escape sequences and cells to write to the terminal. Empty if nothing changed.
+        """
+        output: list[str] = []
+        cursor_row = len(rows)  # the saved cursor position is the row below the canvas
+        sgr_state = sgr.DEFAULT_STYLE
+        for row_index, row in enumerate(rows):
+            if row == self._previous_rows[row_index]:
+                continue
+            previous_cells = self._previous_cells.get(row_index)
+            if previous_cells is None:
+                previous_cells = parse_row_cells(self._previous_rows[row_index])
+            cells = parse_row_cells(row)
+            self._previous_cells[row_index] = cells
+            for run_start, run_end in self._find_changed_runs(previous_cells, cells):
+                if not output:
+                    output.append(ansitools.DEC_RESTORE_CURSOR_POSITION())
+                if row_index != cursor_row:
+                    if row_index < cursor_row:
+                        output.append(ansitools.MOVE_CURSOR_UP(cursor_row - row_index))
+                    else:
+                        output.append(ansitools.MOVE_CURSOR_DOWN(row_index - cursor_row))
+                    cursor_row = row_index
+                output.append(ansitools.MOVE_CURSOR_TO_COLUMN(run_start + 1))
+                for cell_style, symbol in cells[run_start:run_end]:
+                    if cell_style is not sgr_state:
+                        output.append(sgr.get_transition(sgr_state, cell_style))
+                        sgr_state = cell_style
+                    output.append(symbol)
+        if sgr_state:
+            output.append(ansitools.RESET_ALL())
+        return "".join(output)
+
+    @staticmethod
+    def _find_changed_runs(
+        previous_cells: list[tuple[sgr.Style, str]], cells: list[tuple[sgr.Style, str]]
+    ) -> list[tuple[int, int]]:
+        """Finds runs of changed cells in a row, coalescing runs when rewriting the unchanged cells between them costs
+        less than moving the cursor to the start of the next run.
+
+        Args:
+            previous_cells (list[tuple[sgr.Style, str]]): Cells previously emitted for the row.
+            cells (list[tuple[sgr.Style, str]]): Cells for the row in the new frame.
+
+        Returns:
+            list[tuple[int, int]]: (start, end) cell index pairs, end exclusive.
+        """
+        previous_length = len(previous_cells)
+        runs: list[tuple[int, int]] = []
+        run_start = -1
+        gap_cost = 0
+        last_changed = -1
+        previous_style = sgr.DEFAULT_STYLE
+        for index, cell in enumerate(cells):
+            style = cell[0]
+            if index < previous_length and cell == previous_cells[index]:
+                if run_start >= 0:
+                    gap_cost += len(cell[1])
+                    if style is not previous_style:
+                        gap_cost += len(sgr.get_transition(previous_style, style))
+                previous_style = style
+                continue
+            previous_style = style
+            if run_start >= 0 and gap_cost > len(ansitools.MOVE_CURSOR_TO_COLUMN(index + 1)):
+                runs.append((run_start, last_changed + 1))
+                run_start = -1
+            if run_start < 0:
+                run_start = index
+            last_changed = index
+            gap_cost = 0
+        if run_start >= 0:
+            runs.append((run_start, last_changed + 1))
+        return runs
@@ -0,0 +1,208 @@
+"""Frame pacing based on absolute deadlines measured with a monotonic clock.
+
+Frame n is due at `start + n / frame_rate`, where start is the time the first frame was presented. Deadlines are
+absolute, so time spent producing and writing a frame does not accumulate as drift. The FramePolicy determines what
+happens when a frame is ready after its deadline.
+
+Classes:
+    FramePolicy: Policies for handling frames that are ready after their deadline.
+    FrameStatistics: Timing statistics collected by a FrameScheduler.
+    FrameScheduler: Sleeps until each frame is due and decides whether late frames are presented.
+"""
+
+from __future__ import annotations
+
+import time
+import typing
+from dataclasses import dataclass
+from enum import Enum, auto
+
+
+class FramePolicy(Enum):
+    """Policies for handling frames that are ready after their deadline.
+
+    Attributes:
+        KEEP (int): Present every frame. A late frame is presented immediately and the schedule restarts from it, so
+            slow frames extend the duration of the effect.
+        SKIP (int): Keep the original schedule. A frame that is ready after the next frame is due is not presented,
+            but the effect continues to be simulated, so the duration of the effect is predictable. If skipping a frame
+            did not reduce how late the following frame is, the effect is slower to simulate than the frame rate and
+            skipping cannot catch up, so the frame is presented and the schedule restarts from it.
+        CATCH_UP (int): Present every frame and keep the original schedule. Late frames are presented without
+            sleeping until the schedule has caught up.
+    """
+
+    KEEP = auto()
+    SKIP = auto()
+    CATCH_UP = auto()
+
+
+@dataclass
+class FrameStatistics:
+    """Timing statistics collected by a FrameScheduler.
+
+    Attributes:
+        frames (int): Number of frames scheduled.
+        presented_frames (int): Number of frames presented.
+        skipped_frames (int): Number of frames not presented because they were too late.
+        late_frames (int): Number of frames that were ready after their deadline.
+        total_jitter (float): Sum of the absolute difference, in seconds, between the deadline and the time each
+            presented frame was released.
+        max_jitter (float): Largest absolute difference, in seconds, between the deadline and the time a presented
+            frame was released.
+        max_lateness (float): Largest time, in seconds, by which a frame missed its deadline.
+        unchanged_frames (int): Number of presented frames that were not written because they were identical to the
+            previously written frame. Counted by the Terminal.
+    """
+
+    frames: int = 0
+    presented_frames: int = 0
+    skipped_frames: int = 0
+    late_frames: int = 0
+    total_jitter: float = 0.0
+    max_jitter: float = 0.0
+    max_lateness: float = 0.0
+    unchanged_frames: int = 0
+
+    @property
+    def mean_jitter(self) -> float:
+        """Mean absolute difference, in seconds, between the deadline and the release time of presented frames.
+
+        Returns:
+            float: mean jitter
+        """
+        return self.total_jitter / self.presented_frames if self.presented_frames else 0.0
+
+
+class FrameScheduler:
+    """Sleeps until each frame is due and decides whether late frames are presented.
+
+    Call wait() once for every frame produced by the effect. It sleeps until the frame is due and returns whether the
+    frame should be presented. Under FramePolicy.SKIP, frame_due() can be called before a frame is rendered to find
+    out whether it is already too late to be presented, so late frames are not rendered at all.
+
+    Attributes:
+        frame_rate (float): Target frame rate. A frame rate of 0 or less disables pacing.
+        policy (FramePolicy): Policy for frames that are ready after their deadline.
+        statistics (FrameStatistics): Timing statistics for the frames scheduled so far.
+
+    Methods:
+        frame_due() -> bool: Returns whether the next frame will be presented if it is rendered now.
+        wait() -> bool: Sleeps until the next frame is due and returns whether the frame should be presented.
+        reset(): Restarts the schedule and clears the statistics.
+    """
+
+    def __init__(
+        self,
+        frame_rate: float,
+        policy: FramePolicy = FramePolicy.KEEP,
+        *,
+        clock: typing.Callable[[], float] = time.perf_counter,
+        sleep: typing.Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initializes the FrameScheduler.
+
+        Args:
+            frame_rate (float): Target frame rate. A frame rate of 0 or less disables pacing.
+            policy (FramePolicy, optional): Policy for frames that are ready after their deadline. Defaults to
+                FramePolicy.KEEP.
+            clock (typing.Callable[[], float], optional): Monotonic clock returning seconds. Defaults to
+                time.perf_counter.
+            sleep (typing.Callable[[float], None], optional): Function used to sleep. Defaults to time.sleep.
+        """
+        self.frame_rate = frame_rate
+        self.policy = policy
+        self.statistics = FrameStatistics()
+        self._clock = clock
+        self._sleep = sleep
+        self._deadline: float | None = None
+        self._skipped_lateness: float | None = None
+        self._frame_skipped = False
+
+    def reset(self) -> None:
+        """Restarts the schedule and clears the statistics. The next frame is presented immediately."""
+        self._deadline = None
+        self._skipped_lateness = None
+        self._frame_skipped = False
+        self.statistics = FrameStatistics()
+
+    def _skip_frame(self, lateness: float, next_deadline: float) -> bool:
+        """Skips the next frame if it is late enough to be skipped and skipping has been reducing how late frames are.
+
+        Args:
+            lateness (float): time, in seconds, by which the frame has missed its deadline
+            next_deadline (float): deadline of the frame after the next frame
+
+        Returns:
+            bool: True if the frame is skipped.
+        """
+        if self.policy is not FramePolicy.SKIP or lateness < 1 / self.frame_rate:
+            return False
+        if self._skipped_lateness is not None and lateness >= self._skipped_lateness:
+            # skipping is not catching up, the frame is presented
+            return False
+        statistics = self.statistics
+        statistics.late_frames += 1
+        statistics.max_lateness = max(statistics.max_lateness, lateness)
+        statistics.skipped_frames += 1
+        self._skipped_lateness = lateness
+        self._deadline = next_deadline
+        return True
+
+    def frame_due(self) -> bool:
+        """Returns whether the next frame will be presented if it is rendered now, without sleeping. Under
+        FramePolicy.SKIP, a frame that is already too late to be presented is skipped by this call and the next call to
+        wait() returns False without sleeping, so the frame does not need to be rendered. Other policies present every
+        frame.
+
+        Returns:
+            bool: True if the frame should be rendered, False if it will be skipped.
+        """
+        if self._frame_skipped:
+            return False
+        if self.policy is not FramePolicy.SKIP or self.frame_rate <= 0 or self._deadline is None:
+            return True
+        lateness = self._clock() - self._deadline
+        if self._skip_frame(lateness, self._deadline + 1 / self.frame_rate):
+            self._frame_skipped = True
+            return False
+        return True
+
+    def wait(self) -> bool:
+        """Sleeps until the next frame is due and returns whether the frame should be presented.
+
+        Returns:
+            bool: True if the frame should be presented, False if it should be skipped.
+        """
+        statistics = self.statistics
+        statistics.frames += 1
+        if self._frame_skipped:
+            # skipped by frame_due() before it was rendered
+            self._frame_skipped = False
+            return False
+        now = self._clock()
+        if self.frame_rate <= 0:
+            statistics.presented_frames += 1
+            return True
+        frame_delay = 1 / self.frame_rate
+        deadline = self._deadline if self._deadline is not None else now
+        next_deadline = deadline + frame_delay
+        if now < deadline:
+            self._sleep(deadline - now)
+            now = self._clock()
+        elif now > deadline:
+            lateness = now - deadline
+            if self._skip_frame(lateness, next_deadline):
+                return False
+            statistics.late_frames += 1
+            statistics.max_lateness = max(statistics.max_lateness, lateness)
+            if self.policy is FramePolicy.KEEP or (self.policy is FramePolicy.SKIP and lateness >= frame_delay):
+                # under SKIP, skipping is not catching up, present the frame and drop the backlog
+                next_deadline = now + frame_delay
+        jitter = abs(now - deadline)
+        statistics.presented_frames += 1
+        statistics.total_jitter += jitter
+        statistics.max_jitter = max(statistics.max_jitter, jitter)
+        self._deadline = next_deadline
+        self._skipped_lateness = None
+        return True
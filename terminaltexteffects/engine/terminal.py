@@ -1,6 +1,7 @@
 """A module for managing the terminal state and output.
 
 Classes:
+    FramePolicyArg: Argument type for frame policies.
     TerminalConfig: Configuration for the terminal.
     Canvas: Represents the canvas in the terminal. The canvas is the area defined by the dimensions of the input data, unless specified otherwise in the TerminalConfig.
     Terminal: A class for managing the terminal state and output.
@@ -8,20 +9,62 @@ Classes:
 
 from __future__ import annotations
 
+import argparse
+import bisect
 import random
 import shutil
 import sys
-import time
 from dataclasses import dataclass
 from enum import Enum, auto
+from fractions import Fraction
 
 import terminaltexteffects.utils.argvalidators as argvalidators
+from terminaltexteffects.engine.asciicast import AsciicastRecorder
 from terminaltexteffects.engine.base_character import EffectCharacter
+from terminaltexteffects.engine.framebuffer import Framebuffer
+from terminaltexteffects.engine.output import OutputSink, ThreadedOutputSink
+from terminaltexteffects.engine.renderer import DiffRenderer
+from terminaltexteffects.engine.scheduler import FramePolicy, FrameScheduler
 from terminaltexteffects.utils import ansitools
 from terminaltexteffects.utils.argsdataclass import ArgField, ArgsDataClass
 from terminaltexteffects.utils.geometry import Coord
 
 
+class FramePolicyArg:
+    """Argument type for frame policies.
+
+    Raises:
+        argparse.ArgumentTypeError: Argument value is not a valid frame policy.
+    """
+
+    METAVAR = "(keep, skip, catch_up)"
+
+    @staticmethod
+    def type_parser(arg: str) -> FramePolicy:
+        """Validates that the given argument is a valid frame policy.
+
+        Args:
+            arg (str): argument to validate
+
+        Returns:
+            FramePolicy: validated frame policy
+
+        Raises:
+            argparse.ArgumentTypeError: Argument value is not a valid frame policy.
+        """
+        policy_map = {
+            "keep": FramePolicy.KEEP,
+            "skip": FramePolicy.SKIP,
+            "catch_up": FramePolicy.CATCH_UP,
+        }
+        if arg.lower().replace("-", "_") in policy_map:
+            return policy_map[arg.lower().replace("-", "_")]
+        else:
+            raise argparse.ArgumentTypeError(
+                f"invalid frame policy: '{arg}' is not a valid frame policy. Choices are keep, skip, or catch_up."
+            )
+
+
 @dataclass
 class TerminalConfig(ArgsDataClass):
     """Configuration for the terminal.
@@ -32,9 +75,14 @@ class TerminalConfig(ArgsDataClass):
         no_color (bool): Disable all colors in the effect.
         wrap_text (bool): Wrap text wider than the canvas width.
         frame_rate (float): Target frame rate for the animation.
+        frame_policy (FramePolicy): How frames that are ready after their deadline are handled.
+        tick_rate (float): Simulation ticks per second. If set to 0 the effect advances one tick per frame.
         canvas_width (int): Cavas width, if set to 0 the canvas width is detected automatically based on the terminal device.
         canvas_height (int): Canvas height, if set to 0 the canvas height is detected automatically based on the terminal device.
         ignore_terminal_dimensions (bool): Ignore the terminal dimensions and use the input data dimensions for the canvas.
+        diff_output (bool): Write only the cells that changed since the previous frame instead of redrawing the canvas.
+        threaded_output (bool): Write frames from a background thread so the next frame is computed while the previous frame is written.
+        record (str): Path of an asciicast v2 file to record the output to. Empty to disable recording.
     """
 
     tab_width: int = ArgField(
@@ -76,6 +124,30 @@ class TerminalConfig(ArgsDataClass):
 
     "float : Minimum time, in seconds, between frames."
 
+    frame_policy: FramePolicy = ArgField(
+        cmd_name="--frame-policy",
+        type_parser=FramePolicyArg.type_parser,
+        metavar=FramePolicyArg.METAVAR,
+        default=FramePolicy.KEEP,
+        help="How frames that are ready after their deadline are handled. keep: show every frame, slow frames delay the "
+        "effect. skip: do not show late frames so the effect finishes on time. catch_up: show every frame without "
+        "waiting until the effect is back on schedule.",
+    )  # type: ignore[assignment]
+
+    "FramePolicy : How frames that are ready after their deadline are handled."
+
+    tick_rate: float = ArgField(
+        cmd_name="--tick-rate",
+        type_parser=argvalidators.NonNegativeFloat.type_parser,
+        metavar=argvalidators.NonNegativeFloat.METAVAR,
+        default=0,
+        help="Simulation ticks per second. The effect advances tick-rate / frame-rate ticks per frame, so the duration "
+        "of the effect does not depend on the frame rate. Frames are held when the tick rate is lower than the frame "
+        "rate. If set to 0, the effect advances one tick per frame.",
+    )  # type: ignore[assignment]
+
+    "float : Simulation ticks per second. If set to 0, the effect advances one tick per frame."
+
     canvas_width: int = ArgField(
         cmd_name=["--canvas-width"],
         type_parser=argvalidators.NonNegativeInt.type_parser,
@@ -102,6 +174,30 @@ class TerminalConfig(ArgsDataClass):
     )  # type: ignore[assignment]
     "bool : Ignore the terminal dimensions and use the input data dimensions for the canvas."
 
+    diff_output: bool = ArgField(
+        cmd_name=["--diff-output"],
+        default=False,
+        action="store_true",
+        help="Write only the cells that changed since the previous frame instead of redrawing the whole canvas. Reduces the output size on slow links.",
+    )  # type: ignore[assignment]
+    "bool : Write only the cells that changed since the previous frame instead of redrawing the whole canvas."
+
+    threaded_output: bool = ArgField(
+        cmd_name=["--threaded-output"],
+        default=False,
+        action="store_true",
+        help="Write frames from a background thread so the next frame is computed while the previous frame is written. Improves the frame rate on terminals where writes block, such as SSH sessions.",
+    )  # type: ignore[assignment]
+    "bool : Write frames from a background thread so the next frame is computed while the previous frame is written."
+
+    record: str = ArgField(
+        cmd_name=["--record"],
+        default="",
+        metavar="(path)",
+        help="Record the output to an asciicast v2 file while it is displayed. Play the recording with 'tte play <path>'.",
+    )  # type: ignore[assignment]
+    "str : Path of an asciicast v2 file to record the output to. Empty to disable recording."
+
 
 @dataclass
 class Canvas:
@@ -201,6 +297,13 @@ class Terminal:
         config (TerminalConfig): Configuration for the terminal.
         canvas (Canvas): The canvas in the terminal.
         character_by_input_coord (dict[Coord, EffectCharacter]): A dictionary of characters by their input coordinates.
+            Accessing it creates the fill characters.
+        framebuffer (Framebuffer): The composited cell grid of the most recent frame.
+        frame_scheduler (FrameScheduler): Paces printed frames and collects frame timing statistics.
+        ticks_per_frame (Fraction | None): Number of simulation ticks per frame, None if the effect advances one tick
+            per frame.
+        output_sink (OutputSink): Assembles the bytes written to stdout. output_sink.frame is a memoryview of the most
+            recently printed frame. A ThreadedOutputSink if threaded_output is enabled in the config.
 
     Methods:
         get_piped_input() -> str: Gets the piped input from stdin.
@@ -212,6 +315,7 @@ class Terminal:
         set_character_visibility(character: EffectCharacter, is_visible: bool): Set the visibility of a character.
         get_formatted_output_string() -> str: Get the formatted output string based on the current terminal state.
         print(output_string: str, enforce_frame_rate: bool = True): Prints the current terminal state to stdout while preserving the cursor position.
+        encode_frame(output_string: str) -> memoryview: Assembles the bytes that print() would write for the frame without writing them.
 
     """
 
@@ -300,13 +404,25 @@ class Terminal:
             for character in self._input_characters
             if character.input_coord.row <= self.canvas.top and character.input_coord.column <= self.canvas.right
         ]
-        self.character_by_input_coord: dict[Coord, EffectCharacter] = {
+        self._character_by_input_coord: dict[Coord, EffectCharacter] = {
             (character.input_coord): character for character in self._input_characters
         }
-        self._fill_characters = self._make_fill_characters()
-        self._visible_characters: set[EffectCharacter] = set()
-        self._frame_rate = self.config.frame_rate
-        self._last_time_printed = time.time()
+        # fill characters are created when first requested, their IDs are reserved so the IDs of added characters do
+        # not depend on whether the fill characters exist
+        self._fill_characters: list[EffectCharacter] | None = None
+        self._first_fill_character_id = self._next_character_id
+        self._next_character_id += self.canvas.top * self.canvas.right - len(self._character_by_input_coord)
+        self._visible_characters_by_layer: dict[int, dict[EffectCharacter, None]] = {}
+        self._visible_layers: list[int] = []
+        self.frame_scheduler = FrameScheduler(self.config.frame_rate, self.config.frame_policy)
+        self.ticks_per_frame: Fraction | None = None
+        if self.config.tick_rate > 0 and self.config.frame_rate > 0:
+            self.ticks_per_frame = Fraction(self.config.tick_rate) / Fraction(self.config.frame_rate)
+        self.output_sink = ThreadedOutputSink() if self.config.threaded_output else OutputSink()
+        self._diff_renderer: DiffRenderer | None = DiffRenderer() if self.config.diff_output else None
+        self._printed_output_string: str | None = None
+        self._skipped_output_string: str | None = None
+        self.framebuffer = Framebuffer(self.canvas.right, self.canvas.top)
         self._update_terminal_state()
 
     def _get_terminal_dimensions(self) -> tuple[int, int]:
@@ -383,32 +499,68 @@ class Terminal:
             for column, symbol in enumerate(line):
                 if symbol != " ":
                     character = EffectCharacter(self._next_character_id, symbol, column + 1, input_height - row)
-                    character.animation.use_xterm_colors = use_xterm_colors
-                    character.animation.no_color = no_color
+                    self._apply_color_config(character, use_xterm_colors, no_color)
                     input_characters.append(character)
                     self._next_character_id += 1
         return input_characters
 
+    @staticmethod
+    def _apply_color_config(character: EffectCharacter, use_xterm_colors: bool, no_color: bool) -> None:
+        """Applies the color configuration to the character's animation. The animation is only created if the
+        configuration differs from the animation defaults.
+
+        Args:
+            character (EffectCharacter): the character to configure
+            use_xterm_colors (bool): whether to convert colors to the closest XTerm-256 color
+            no_color (bool): whether to disable all colors
+        """
+        if use_xterm_colors or no_color:
+            character.animation.use_xterm_colors = use_xterm_colors
+            character.animation.no_color = no_color
+
     def _make_fill_characters(self) -> list[EffectCharacter]:
         """Creates a list of characters to fill the empty spaces in the canvas. The characters input_symbol is a space.
-        The fill characters are added to the character_by_input_coord dictionary.
+        The fill characters are added to the character_by_input_coord dictionary and use the IDs reserved for them
+        when the Terminal was initialized.
 
         Returns:
             list[EffectCharacter]: list of characters
         """
         fill_characters = []
+        character_by_input_coord = self._character_by_input_coord
+        character_id = self._first_fill_character_id
         for row in range(1, self.canvas.top + 1):
             for column in range(1, self.canvas.right + 1):
                 coord = Coord(column, row)
-                if coord not in self.character_by_input_coord:
-                    fill_char = EffectCharacter(self._next_character_id, " ", column, row)
-                    fill_char.animation.use_xterm_colors = self.config.xterm_colors
-                    fill_char.animation.no_color = self.config.no_color
+                if coord not in character_by_input_coord:
+                    fill_char = EffectCharacter(character_id, " ", column, row)
+                    self._apply_color_config(fill_char, self.config.xterm_colors, self.config.no_color)
                     fill_characters.append(fill_char)
-                    self.character_by_input_coord[coord] = fill_char
-                    self._next_character_id += 1
+                    character_by_input_coord[coord] = fill_char
+                    character_id += 1
         return fill_characters
 
+    def _get_fill_characters(self) -> list[EffectCharacter]:
+        """Returns the fill characters, creating them on first use.
+
+        Returns:
+            list[EffectCharacter]: list of fill characters
+        """
+        if self._fill_characters is None:
+            self._fill_characters = self._make_fill_characters()
+        return self._fill_characters
+
+    @property
+    def character_by_input_coord(self) -> dict[Coord, EffectCharacter]:
+        """A dictionary of the input and fill characters by their input coordinates. The fill characters are created
+        on first access.
+
+        Returns:
+            dict[Coord, EffectCharacter]: characters by input coordinate
+        """
+        self._get_fill_characters()
+        return self._character_by_input_coord
+
     def add_character(self, symbol: str, coord: Coord) -> EffectCharacter:
         """Adds a character to the terminal for printing. Used to create characters that are not in the input data.
 
@@ -420,8 +572,7 @@ class Terminal:
             EffectCharacter: the character that was added
         """
         character = EffectCharacter(self._next_character_id, symbol, coord.column, coord.row)
-        character.animation.use_xterm_colors = self.config.xterm_colors
-        character.animation.no_color = self.config.no_color
+        self._apply_color_config(character, self.config.xterm_colors, self.config.no_color)
         self._added_characters.append(character)
         self._next_character_id += 1
         return character
@@ -430,14 +581,38 @@ class Terminal:
         """Update the internal representation of the terminal state with the current position
         of all visible characters.
         """
-        rows = [[" " for _ in range(self.canvas.right)] for _ in range(self.canvas.top)]
-        for character in sorted(self._visible_characters, key=lambda c: c.layer):
-            row = character.motion.current_coord.row - 1
-            column = character.motion.current_coord.column - 1
-            if 0 <= row < self.canvas.top and 0 <= column < self.canvas.right:
-                rows[row][column] = character.symbol
-        terminal_state = ["".join(row) for row in rows]
-        self.terminal_state = terminal_state
+        framebuffer = self.framebuffer
+        framebuffer.clear()
+        symbols = framebuffer.symbols
+        styles = framebuffer.styles
+        layers = framebuffer.layers
+        mark_row = framebuffer.dirty_rows.add
+        width = self.canvas.right
+        height = self.canvas.top
+        index_offset = -width - 1  # cell index = (row - 1) * width + (column - 1)
+        for layer in self._visible_layers:
+            for character in self._visible_characters_by_layer[layer]:
+                # characters which have never moved have no Motion and are at their input coordinate
+                motion = character._motion
+                coord = character._input_coord if motion is None else motion.current_coord
+                row = coord.row
+                column = coord.column
+                if 0 < row <= height and 0 < column <= width:
+                    cell_index = row * width + column + index_offset
+                    visual = character.visual
+                    symbols[cell_index] = visual.raw_symbol
+                    styles[cell_index] = visual.style
+                    layers[cell_index] = layer
+                    mark_row(row)
+
+    @property
+    def terminal_state(self) -> list[str]:
+        """The formatted rows of the most recently composited frame, bottom row first.
+
+        Returns:
+            list[str]: formatted rows
+        """
+        return self.framebuffer.get_rows()[::-1]
 
     def get_characters(
         self,
@@ -462,7 +637,7 @@ class Terminal:
         if input_characters:
             all_characters.extend(self._input_characters)
         if fill_chars:
-            all_characters.extend(self._fill_characters)
+            all_characters.extend(self._get_fill_characters())
         if added_chars:
             all_characters.extend(self._added_characters)
 
@@ -513,7 +688,7 @@ class Terminal:
         if input_characters:
             all_characters.extend(self._input_characters)
         if fill_chars:
-            all_characters.extend(self._fill_characters)
+            all_characters.extend(self._get_fill_characters())
         if added_chars:
             all_characters.extend(self._added_characters)
 
@@ -605,9 +780,10 @@ class Terminal:
         Returns:
             EffectCharacter | None: the character at the specified coordinates, or None if no character is found
         """
-        if coord not in self.character_by_input_coord:
-            return None
-        return self.character_by_input_coord[coord]
+        character = self._character_by_input_coord.get(coord)
+        if character is None and self._fill_characters is None:
+            character = self.character_by_input_coord.get(coord)
+        return character
 
     def set_character_visibility(self, character: EffectCharacter, is_visible: bool) -> None:
         """Set the visibility of a character.
@@ -616,11 +792,38 @@ class Terminal:
             character (EffectCharacter): the character to set visibility for
             is_visible (bool): whether the character should be visible
         """
+        if is_visible and not character._is_visible:
+            character._terminal = self
+            self._get_layer_bucket(character.layer)[character] = None
+        elif not is_visible and character._is_visible:
+            self._visible_characters_by_layer[character.layer].pop(character, None)
         character._is_visible = is_visible
-        if is_visible:
-            self._visible_characters.add(character)
-        else:
-            self._visible_characters.discard(character)
+
+    def _get_layer_bucket(self, layer: int) -> dict[EffectCharacter, None]:
+        """Get the bucket of visible characters for a layer, creating it if necessary.
+
+        Args:
+            layer (int): the layer
+
+        Returns:
+            dict[EffectCharacter, None]: visible characters on the layer, in the order they became visible
+        """
+        bucket = self._visible_characters_by_layer.get(layer)
+        if bucket is None:
+            bucket = self._visible_characters_by_layer[layer] = {}
+            bisect.insort(self._visible_layers, layer)
+        return bucket
+
+    def _move_character_to_layer(self, character: EffectCharacter, previous_layer: int) -> None:
+        """Move a visible character from the bucket for its previous layer to the bucket for its current layer. Called
+        by EffectCharacter when the layer of a visible character changes.
+
+        Args:
+            character (EffectCharacter): the character whose layer changed
+            previous_layer (int): the layer the character was on
+        """
+        self._visible_characters_by_layer[previous_layer].pop(character, None)
+        self._get_layer_bucket(character.layer)[character] = None
 
     def get_formatted_output_string(self) -> str:
         """Get the formatted output string based on the current terminal state.
@@ -631,23 +834,64 @@ class Terminal:
             str: The formatted output string.
         """
         self._update_terminal_state()
-        output_string = "\n".join(self.terminal_state[::-1])
+        output_string = self.framebuffer.to_string()
         return output_string
 
     def prep_canvas(self) -> None:
-        """Prepares the terminal for the effect by adding empty lines and hiding the cursor."""
-        sys.stdout.write(ansitools.HIDE_CURSOR())
-        sys.stdout.write(("\n" * (self.canvas.top)))
-        sys.stdout.write(ansitools.DEC_SAVE_CURSOR_POSITION())
+        """Prepares the terminal for the effect by adding empty lines and hiding the cursor. If record is set in the
+        terminal config, recording starts here."""
+        if self.config.record:
+            self.output_sink.recorder = AsciicastRecorder(
+                self.config.record, max(self._width, self.canvas.right), max(self._height, self.canvas.top + 1)
+            )
+        self.output_sink.write_sequence(ansitools.HIDE_CURSOR())
+        self.output_sink.write_sequence("\n" * (self.canvas.top))
+        self.output_sink.write_sequence(ansitools.DEC_SAVE_CURSOR_POSITION())
+        self.output_sink.flush()
 
     def restore_cursor(self, end_symbol: str = "\n") -> None:
-        """Restores the cursor visibility and prints the end_symbol.
+        """Restores the cursor visibility and prints the end_symbol. If the last frame passed to print() was skipped by
+        the frame policy, it is printed first so the effect always ends on its final frame. Waits until all output has
+        been written and closes the recording, if any.
 
         Args:
             end_symbol (str, optional): The symbol to print after the effect has completed. Defaults to newline.
         """
-        sys.stdout.write(ansitools.SHOW_CURSOR())
-        sys.stdout.write(end_symbol)
+        if self._skipped_output_string is not None:
+            if self._skipped_output_string != self._printed_output_string:
+                self.encode_frame(self._skipped_output_string)
+                self.output_sink.flush()
+                self._printed_output_string = self._skipped_output_string
+            self._skipped_output_string = None
+        if self._diff_renderer:
+            # diff output leaves the cursor at the last changed cell, park it at the end of the bottom row
+            self.output_sink.write_sequence(ansitools.DEC_RESTORE_CURSOR_POSITION())
+            self.output_sink.write_sequence(ansitools.MOVE_CURSOR_UP(1))
+            self.output_sink.write_sequence(ansitools.MOVE_CURSOR_TO_COLUMN(self.canvas.right + 1))
+        self.output_sink.write_sequence(ansitools.SHOW_CURSOR())
+        self.output_sink.write(end_symbol)
+        self.output_sink.close()
+        if self.output_sink.recorder is not None:
+            self.output_sink.recorder.close()
+            self.output_sink.recorder = None
+
+    def encode_frame(self, output_string: str) -> memoryview:
+        """Assembles the bytes that print() would write for the frame, including cursor positioning, without writing
+        them. The returned view is backed by a reusable buffer and is only valid until the next frame is assembled.
+
+        Args:
+            output_string (str): The formatted frame.
+
+        Returns:
+            memoryview: Read-only view of the encoded frame.
+        """
+        self.output_sink.begin_frame()
+        if self._diff_renderer:
+            self.output_sink.write(self._diff_renderer.render(output_string))
+        else:
+            self.move_cursor_to_top()
+            self.output_sink.write(output_string)
+        return self.output_sink.frame
 
     def print(self, output_string: str, *, enforce_frame_rate: bool = True) -> None:
         """Prints the current terminal state to stdout while preserving the cursor position.
@@ -658,26 +902,57 @@ class Terminal:
 
         Notes:
             This method includes animation timing to control the frame rate.
-            If the time since the last print is less than required to limit the frame rate, the method will sleep for the remaining time
-            to ensure a consistent animation speed.
+            If the frame is ready before it is due, the method will sleep until the frame is due to ensure a consistent
+            animation speed. Frames that are ready after they are due are handled according to the frame_policy in
+            the terminal config and may not be printed. If the last frame of the effect is skipped, it is printed by
+            restore_cursor().
+
+            A frame identical to the previously printed frame is not written, but still occupies its place in the
+            frame schedule. Unchanged frames are counted in frame_scheduler.statistics.unchanged_frames.
+
+            If diff_output is enabled in the terminal config, only the cells that changed since the previously printed
+            frame are written.
 
+            The frame is assembled into a reusable byte buffer and written to the stdout file descriptor in a single
+            write. The bytes of the frame remain available through output_sink.frame until the next frame.
+
+            If threaded_output is enabled in the terminal config, the frame is written by a background thread and this
+            method returns without waiting for the write to complete. If the terminal falls behind, the method waits
+            until the writer thread has finished with one of its buffers.
+
+        """
+        if enforce_frame_rate and not self.enforce_framerate():
+            self._skipped_output_string = output_string
+            return
+        self._skipped_output_string = None
+        # the framebuffer returns the same string object for an unchanged frame, making this an identity check
+        if output_string == self._printed_output_string:
+            self.frame_scheduler.statistics.unchanged_frames += 1
+            return
+        self.encode_frame(output_string)
+        self.output_sink.flush()
+        self._printed_output_string = output_string
+
+    def frame_due(self) -> bool:
+        """Returns whether the next frame will be printed if it is rendered now. A frame which is already too late to be
+        printed under the frame policy is skipped, and the next call to print() does not print it. Effects check this
+        before rendering a frame, so late frames are simulated but not rendered.
+
+        Returns:
+            bool: True if the frame should be rendered, False if it will be skipped.
+        """
+        return self.frame_scheduler.frame_due()
+
+    def enforce_framerate(self) -> bool:
+        """Enforces the frame rate set in the terminal config by sleeping until the next frame is due. Deadlines are
+        measured from the first frame with a monotonic clock, so time spent producing frames does not add up as drift.
+
+        Returns:
+            bool: True if the frame should be printed, False if it is late and the frame policy skips it.
         """
-        if enforce_frame_rate:
-            self.enforce_framerate()
-        self.move_cursor_to_top()
-        sys.stdout.write(output_string)
-        sys.stdout.flush()
-
-    def enforce_framerate(self):
-        """Enforces the frame rate set in the terminal config by sleeping if the time since
-        the last frame is shorter than the expected frame delay."""
-        frame_delay = 1 / self._frame_rate
-        time_since_last_print = time.time() - self._last_time_printed
-        if time_since_last_print < frame_delay:
-            time.sleep(frame_delay - time_since_last_print)
-        self._last_time_printed = time.time()
+        return self.frame_scheduler.wait()
 
     def move_cursor_to_top(self):
-        """Restores the cursor position to the top of the canvas."""
-        sys.stdout.write(ansitools.DEC_RESTORE_CURSOR_POSITION())
-        sys.stdout.write(ansitools.MOVE_CURSOR_UP(self.canvas.top))
+        """Restores the cursor position to the top of the canvas. The sequences are written with the next frame."""
+        self.output_sink.write_sequence(ansitools.DEC_RESTORE_CURSOR_POSITION())
+        self.output_sink.write_sequence(ansitools.MOVE_CURSOR_UP(self.canvas.top))
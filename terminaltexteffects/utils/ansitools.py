@@ -51,6 +51,18 @@ def MOVE_CURSOR_UP(y: int) -> str:
     return f"\033[{y}A"
 
 
+def MOVE_CURSOR_DOWN(y: int) -> str:
+    """Moves the cursor down y lines.
+
+    Args:
+        y (int): number of lines to move down
+
+    Returns:
+        str: ANSI escape code
+    """
+    return f"\033[{y}B"
+
+
 def MOVE_CURSOR_TO_COLUMN(x: int) -> str:
     """Moves the cursor to the x column.
 
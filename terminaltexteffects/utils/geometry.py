@@ -4,6 +4,10 @@ This module provides utility functions for geometric calculations and operations
 The purpose of these functions is to find terminal coordinates that fall within certain regions or along certain paths. These functions are
 used by effects to enable more complex animations and movement paths.
 
+Classes:
+    Coord: A coordinate with row and column values.
+    BezierCurve: A quadratic or cubic bezier curve parameterized by arc length.
+
 Functions:
     find_coords_on_circle: Finds points on a circle given the origin, radius, and number of points.
     find_coords_in_circle: Finds coordinates within an ellipse given the center and major axis length.
@@ -11,6 +15,7 @@ Functions:
     find_coord_at_distance: Finds the coordinate at a given distance along a line defined by two coordinates.
     find_coord_on_bezier_curve: Finds points on a quadratic or cubic bezier curve.
     find_coord_on_line: Finds points on a line.
+    get_bezier_curve: Returns the cached BezierCurve for the given start, control point(s) and end.
     find_length_of_bezier_curve: Finds the length of a quadratic or cubic bezier curve.
     find_length_of_line: Finds the length of a line intersecting two coordinates.
     find_normalized_distance_from_center: Returns the normalized distance from the center of the Canvas.
@@ -18,11 +23,16 @@ Functions:
 
 from __future__ import annotations
 
+import bisect
+import functools
 import math
+import sys
 from dataclasses import dataclass
 
+_DATACLASS_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, **_DATACLASS_SLOTS)
 class Coord:
     """A coordinate with row and column values.
 
@@ -34,6 +44,135 @@ class Coord:
     row: int
 
 
+class BezierCurve:
+    """A quadratic or cubic bezier curve parameterized by arc length.
+
+    The curve is sampled once into a table of cumulative lengths when it is created. The table provides the length of
+    the curve and maps a distance along the curve to the curve parameter t, so coordinates found at equal distances
+    are equally spaced along the curve. Use get_bezier_curve() to share curves with the same points.
+
+    Attributes:
+        start (Coord): The starting coordinate of the curve.
+        control (tuple[Coord, ...]): The control point(s) of the curve.
+        end (Coord): The ending coordinate of the curve.
+        length (float): The length of the curve.
+
+    Methods:
+        find_t_at_distance(distance: float) -> float:
+            Returns the curve parameter t at the given distance along the curve.
+        find_coord_at_distance(distance: float) -> Coord:
+            Returns the coordinate at the given distance along the curve.
+    """
+
+    SAMPLE_COUNT = 16
+    """Number of straight line segments used to approximate the curve."""
+
+    def __init__(self, start: Coord, control: tuple[Coord, ...] | Coord, end: Coord) -> None:
+        """Initializes the BezierCurve and builds the arc length table.
+
+        Args:
+            start (Coord): The starting coordinate of the curve.
+            control (tuple[Coord, ...] | Coord): The control point(s) of the curve.
+                For a quadratic bezier curve, a single control point is expected.
+                For a cubic bezier curve, two control points are expected.
+            end (Coord): The ending coordinate of the curve.
+
+        Raises:
+            ValueError: If the number of control points is not 1 or 2.
+        """
+        if isinstance(control, Coord):
+            control = (control,)
+        if len(control) not in (1, 2):
+            raise ValueError(f"Expected 1 or 2 control points, got {len(control)}.")
+        self.start = start
+        self.control = tuple(control)
+        self.end = end
+        # power basis coefficients, the point at t is ((a * t + b) * t + c) * t + d
+        if len(self.control) == 1:
+            control1 = self.control[0]
+            self._column_coefficients = (
+                0,
+                start.column - 2 * control1.column + end.column,
+                2 * (control1.column - start.column),
+                start.column,
+            )
+            self._row_coefficients = (
+                0,
+                start.row - 2 * control1.row + end.row,
+                2 * (control1.row - start.row),
+                start.row,
+            )
+        else:
+            control1, control2 = self.control
+            self._column_coefficients = (
+                end.column - start.column + 3 * (control1.column - control2.column),
+                3 * (start.column - 2 * control1.column + control2.column),
+                3 * (control1.column - start.column),
+                start.column,
+            )
+            self._row_coefficients = (
+                end.row - start.row + 3 * (control1.row - control2.row),
+                3 * (start.row - 2 * control1.row + control2.row),
+                3 * (control1.row - start.row),
+                start.row,
+            )
+        self._sample_lengths = [0.0]
+        previous_x, previous_y = start.column, start.row
+        for sample in range(1, self.SAMPLE_COUNT + 1):
+            x, y = self._find_point(sample / self.SAMPLE_COUNT)
+            self._sample_lengths.append(self._sample_lengths[-1] + math.hypot(x - previous_x, y - previous_y))
+            previous_x, previous_y = x, y
+        self.length = self._sample_lengths[-1]
+
+    def _find_point(self, t: float) -> tuple[float, float]:
+        """Returns the unrounded point on the curve at the curve parameter t.
+
+        Args:
+            t (float): curve parameter between 0 and 1
+
+        Returns:
+            tuple[float, float]: column and row of the point
+        """
+        a, b, c, d = self._column_coefficients
+        x = ((a * t + b) * t + c) * t + d
+        a, b, c, d = self._row_coefficients
+        y = ((a * t + b) * t + c) * t + d
+        return x, y
+
+    def find_t_at_distance(self, distance: float) -> float:
+        """Returns the curve parameter t at the given distance along the curve. The distance is clamped to the length
+        of the curve.
+
+        Args:
+            distance (float): distance from the start of the curve
+
+        Returns:
+            float: curve parameter between 0 and 1
+        """
+        if distance <= 0 or not self.length:
+            return 0.0
+        if distance >= self.length:
+            return 1.0
+        sample_lengths = self._sample_lengths
+        sample = bisect.bisect_left(sample_lengths, distance)
+        previous_length = sample_lengths[sample - 1]
+        fraction = (distance - previous_length) / (sample_lengths[sample] - previous_length)
+        return (sample - 1 + fraction) / self.SAMPLE_COUNT
+
+    def find_coord_at_distance(self, distance: float) -> Coord:
+        """Returns the coordinate at the given distance along the curve. The distance is clamped to the length of the
+        curve.
+
+        Args:
+            distance (float): distance from the start of the curve
+
+        Returns:
+            Coord: The coordinate on the curve at the given distance.
+        """
+        x, y = self._find_point(self.find_t_at_distance(distance))
+        return Coord(round(x), round(y))
+
+
 def find_coords_on_circle(origin: Coord, radius: int, coords_limit: int = 0, unique: bool = True) -> list[Coord]:
     """Finds points on a circle.
 
@@ -207,6 +346,24 @@ def find_length_of_bezier_curve(start: Coord, control: tuple[Coord, ...] | Coord
         control (tuple[Coord, ...] | Coord): The control point(s) of the curve.
         end (Coord): The ending coordinate of the curve.
 
+    Returns:
+        float: The length of the bezier curve.
+    """
+    if isinstance(control, Coord):
+        control = (control,)
+    return _find_length_of_bezier_curve(start, tuple(control), end)
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_length_of_bezier_curve(start: Coord, control: tuple[Coord, ...], end: Coord) -> float:
+    """Finds the length of a bezier curve from the rounded points at each tenth of the curve, up to the ninth. Path
+    step counts are derived from this length. Cached by find_length_of_bezier_curve().
+
+    Args:
+        start (Coord): The starting coordinate of the curve.
+        control (tuple[Coord, ...]): The control point(s) of the curve.
+        end (Coord): The ending coordinate of the curve.
+
     Returns:
         float: The length of the bezier curve.
     """
@@ -216,10 +373,42 @@ def find_length_of_bezier_curve(start: Coord, control: tuple[Coord, ...] | Coord
         coord = find_coord_on_bezier_curve(start, control, end, t / 10)
         length += find_length_of_line(prev_coord, coord)
         prev_coord = coord
-        prev_coord = coord
     return length
 
 
+def get_bezier_curve(start: Coord, control: tuple[Coord, ...] | Coord, end: Coord) -> BezierCurve:
+    """
+    Returns the BezierCurve for the given start, control point(s) and end. Curves are cached, so characters moving
+    along the same curve share its arc length table.
+
+    Args:
+        start (Coord): The starting coordinate of the curve.
+        control (tuple[Coord, ...] | Coord): The control point(s) of the curve.
+        end (Coord): The ending coordinate of the curve.
+
+    Returns:
+        BezierCurve: The curve.
+    """
+    if isinstance(control, Coord):
+        control = (control,)
+    return _get_bezier_curve(start, tuple(control), end)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_bezier_curve(start: Coord, control: tuple[Coord, ...], end: Coord) -> BezierCurve:
+    """Creates a BezierCurve. Cached by get_bezier_curve().
+
+    Args:
+        start (Coord): The starting coordinate of the curve.
+        control (tuple[Coord, ...]): The control point(s) of the curve.
+        end (Coord): The ending coordinate of the curve.
+
+    Returns:
+        BezierCurve: The curve.
+    """
+    return BezierCurve(start, control, end)
+
+
 def find_length_of_line(coord1: Coord, coord2: Coord, double_row_diff: bool = False) -> float:
     """Returns the length of the line intersecting coord1 and coord2. If double_row_diff is True, the distance is
     doubled to account for the terminal character height/width ratio.
@@ -5,10 +5,13 @@ Classes:
     color code or an RGB hex color string. Can be printed to display the color code and appearance as a color block.
     Gradient: A Gradient is a list of RGB hex color strings transitioning from one color to another. Can be printed to
     display the gradient color spectrum.
+    CoordinateColorMapping: A read-only mapping of the coordinates of a canvas to the colors of a gradient, computed
+    when looked up.
 """
 
 from __future__ import annotations
 
+import functools
 import itertools
 import typing
 from collections.abc import Iterator
@@ -24,21 +27,65 @@ class Color:
     """A Color object represents a color in the RGB color space. The color can be initialized with an XTerm-256 color
     code or an RGB hex color string. Can be printed to display the color code and appearance as a color block.
 
+    Colors are immutable and interned by a process-wide LRU cache, so equal color values share one Color object. The
+    RGB values are parsed once when a color is first interned, and the closest XTerm-256 color and the ANSI sequences
+    are cached on the Color when first used. Hex colors are normalized, so Color('#FFFFFF') == Color('ffffff').
+
     Attributes:
-        color_arg (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
+        color_arg (int | str): The normalized color value, an XTerm-256 color code or a lowercase RGB hex color string
+            without a '#'.
         xterm_color (int | None): The XTerm-256 color code. None if the color is an RGB hex color string.
         rgb_color (str): The RGB hex color string.
+        rgb_int (int): The RGB values packed into a 24-bit integer.
+        rgb_ints (tuple[int, int, int]): The RGB values as a tuple of integers.
 
     Properties:
-        rgb_ints (tuple[int, int, int]): Returns the RGB values as a tuple of integers.
+        xterm_index (int): The XTerm-256 color code, or the closest XTerm-256 color to an RGB hex color.
+        fg_sequence (str): The ANSI sequence to set the foreground to the color.
+        bg_sequence (str): The ANSI sequence to set the background to the color.
+
+    Methods:
+        from_rgb: Returns the Color with the given RGB values.
+        intern_cache_info: Returns the hit and miss statistics of the interned color cache.
 
     Raises:
         ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
 
     """
 
+    __slots__ = (
+        "color_arg",
+        "xterm_color",
+        "rgb_color",
+        "rgb_int",
+        "rgb_ints",
+        "_hash",
+        "_xterm_index",
+        "_fg_sequence",
+        "_bg_sequence",
+    )
+
+    INTERN_CACHE_SIZE = 1 << 14
+    """Maximum number of colors kept by each of the interned color caches."""
+
+    color_arg: int | str
+    xterm_color: int | None
+    rgb_color: str
+    rgb_int: int
+    rgb_ints: tuple[int, int, int]
+
+    def __new__(cls, color_value: int | str) -> Color:
+        try:
+            return _get_color(color_value)
+        except TypeError:
+            # unhashable color values
+            raise ValueError(
+                "Invalid color value. Color must be an XTerm-256 color code or an RGB hex color string. Example: 255 or 'ffffff' or '#ffffff'"
+            ) from None
+
     def __init__(self, color_value: int | str) -> None:
-        """Initializes a Color object.
+        """Initializes a Color object. The Color is returned from the interned color cache by __new__(), and its
+        attributes are set when it is first interned.
 
         Args:
             color_value (int | str): The color value as an XTerm-256 color code or an RGB hex color string. Example: 255 or 'ffffff' or '#ffffff'
@@ -46,53 +93,167 @@ class Color:
         Raises:
             ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
         """
-        self.color_arg = color_value
-        self.xterm_color: int | None = None
-        if hexterm.is_valid_color(color_value):
-            if isinstance(color_value, int):
-                self.xterm_color = color_value
-                self.rgb_color = hexterm.xterm_to_hex(color_value)
-            else:
-                self.rgb_color = color_value.strip("#")
-                self.xterm_color = None
-        else:
-            raise ValueError(
-                "Invalid color value. Color must be an XTerm-256 color code or an RGB hex color string. Example: 255 or 'ffffff' or '#ffffff'"
-            )
+
+    @classmethod
+    def from_rgb(cls, red: int, green: int, blue: int) -> Color:
+        """Returns the Color with the given RGB values, without formatting and parsing a hex color string.
+
+        Args:
+            red (int): red value (0-255)
+            green (int): green value (0-255)
+            blue (int): blue value (0-255)
+
+        Returns:
+            Color: the interned Color
+
+        Raises:
+            ValueError: If any of the values is not in the range 0-255.
+        """
+        if not (0 <= red <= 255 and 0 <= green <= 255 and 0 <= blue <= 255):
+            raise ValueError(f"Invalid RGB values: ({red}, {green}, {blue}). Values must be in the range 0-255.")
+        return _intern_color(red << 16 | green << 8 | blue, None)
+
+    @staticmethod
+    def intern_cache_info() -> functools._CacheInfo:
+        """Returns the statistics of the interned color cache.
+
+        Returns:
+            functools._CacheInfo: the hits, misses, maxsize and currsize of the cache
+        """
+        return _intern_color.cache_info()
+
+    @property
+    def xterm_index(self) -> int:
+        """The XTerm-256 color code, or the closest XTerm-256 color to an RGB hex color. Converted when first used.
+
+        Returns:
+            int: The XTerm-256 color code.
+        """
+        xterm_index = self._xterm_index
+        if xterm_index is None:
+            xterm_index = hexterm.hex_to_xterm(self.rgb_color)
+            object.__setattr__(self, "_xterm_index", xterm_index)
+        return xterm_index
 
     @property
-    def rgb_ints(self) -> tuple[int, int, int]:
-        """Returns the RGB values as a tuple of integers.
+    def fg_sequence(self) -> str:
+        """The ANSI sequence to set the foreground to the color. Built when first used.
 
         Returns:
-            tuple[int, int, int]: The RGB values as a tuple of integers.
+            str: The ANSI escape sequence.
         """
-        return colorterm._hex_to_int(self.rgb_color)
+        fg_sequence = self._fg_sequence
+        if fg_sequence is None:
+            fg_sequence = colorterm.fg(self.color_arg)
+            object.__setattr__(self, "_fg_sequence", fg_sequence)
+        return fg_sequence
+
+    @property
+    def bg_sequence(self) -> str:
+        """The ANSI sequence to set the background to the color. Built when first used.
+
+        Returns:
+            str: The ANSI escape sequence.
+        """
+        bg_sequence = self._bg_sequence
+        if bg_sequence is None:
+            bg_sequence = colorterm.bg(self.color_arg)
+            object.__setattr__(self, "_bg_sequence", bg_sequence)
+        return bg_sequence
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError("Color objects are immutable.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("Color objects are immutable.")
+
+    def __reduce__(self) -> tuple[type[Color], tuple[int | str]]:
+        return Color, (self.color_arg,)
+
+    def __copy__(self) -> Color:
+        return self
+
+    def __deepcopy__(self, memo: dict) -> Color:
+        return self
 
     def __repr__(self) -> str:
         return f"Color({self.color_arg})"
 
     def __str__(self) -> str:
-        color_block = f"{colorterm.fg(self.rgb_color)}█████{ansitools.RESET_ALL()}"
+        color_block = f"{self.fg_sequence}█████{ansitools.RESET_ALL()}"
         return f"Color Code: {self.rgb_color}{f' | XTerm Color: {self.xterm_color}' if self.xterm_color else ''}\nColor Appearance: {color_block}"
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Color):
             return NotImplemented
-        return self.color_arg == other.color_arg
+        return self is other or (self.rgb_int == other.rgb_int and self.xterm_color == other.xterm_color)
 
     def __ne__(self, other: object) -> bool:
         if not isinstance(other, Color):
             return NotImplemented
-        return self.color_arg != other.color_arg
+        return self is not other and (self.rgb_int != other.rgb_int or self.xterm_color != other.xterm_color)
 
     def __hash__(self) -> int:
-        return hash(self.color_arg)
+        return self._hash
 
     def __iter__(self) -> Iterator["Color"]:
         return iter((self,))
 
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
+
+@functools.lru_cache(maxsize=Color.INTERN_CACHE_SIZE, typed=True)
+def _get_color(color_value: int | str) -> Color:
+    """Parses a color value and returns the interned Color. Cached by Color.__new__() on the color value as given, so
+    each color value is only parsed once.
+
+    Args:
+        color_value (int | str): The color value as an XTerm-256 color code or an RGB hex color string.
+
+    Returns:
+        Color: the interned Color
+
+    Raises:
+        ValueError: If the color value is not a valid XTerm-256 color code or an RGB hex color string.
+    """
+    if isinstance(color_value, str):
+        hex_color = color_value[1:] if color_value.startswith("#") else color_value
+        if len(hex_color) == 6 and _HEX_DIGITS.issuperset(hex_color):
+            return _intern_color(int(hex_color, 16), None)
+    elif isinstance(color_value, int) and color_value in range(256):
+        return _intern_color(int(hexterm.xterm_to_hex(color_value), 16), int(color_value))
+    raise ValueError(
+        "Invalid color value. Color must be an XTerm-256 color code or an RGB hex color string. Example: 255 or 'ffffff' or '#ffffff'"
+    )
+
+
+@functools.lru_cache(maxsize=Color.INTERN_CACHE_SIZE)
+def _intern_color(rgb_int: int, xterm_color: int | None) -> Color:
+    """Creates the Color for a normalized color value. Cached so equal colors share one Color object.
+
+    Args:
+        rgb_int (int): The RGB values packed into a 24-bit integer.
+        xterm_color (int | None): The XTerm-256 color code, or None for an RGB hex color.
+
+    Returns:
+        Color: the interned Color
+    """
+    color = object.__new__(Color)
+    set_attribute = object.__setattr__
+    rgb_color = f"{rgb_int:06x}"
+    set_attribute(color, "color_arg", rgb_color if xterm_color is None else xterm_color)
+    set_attribute(color, "xterm_color", xterm_color)
+    set_attribute(color, "rgb_color", rgb_color)
+    set_attribute(color, "rgb_int", rgb_int)
+    set_attribute(color, "rgb_ints", (rgb_int >> 16, rgb_int >> 8 & 0xFF, rgb_int & 0xFF))
+    set_attribute(color, "_hash", hash((rgb_int, xterm_color)))
+    set_attribute(color, "_xterm_index", xterm_color)
+    set_attribute(color, "_fg_sequence", None)
+    set_attribute(color, "_bg_sequence", None)
+    return color
+
+
 class Gradient:
     """A Gradient is a list of RGB hex color strings transitioning from one color to another. The gradient color
     list is calculated using linear interpolation based on the provided start and end colors and the number of steps. Gradients
@@ -109,11 +270,24 @@ class Gradient:
     The step count includes the stop for each pair. Total number of colors in the resulting gradient spectrum is the sum of the steps between
     each pair of stops plus 1.
 
+    Spectrums are interned by a process-wide LRU cache keyed on the stops, steps and loop, so equal gradients share
+    the same spectrum tuple and its Color objects and the spectrum is only generated once.
+
     Attributes:
-        spectrum (list[str]): List (length=sum(steps) + 1) of RGB hex color strings
+        spectrum (tuple[Color, ...]): Tuple (length=sum(steps) + 1) of Colors
+
+    Methods:
+        spectrum_cache_info: Returns the hit and miss statistics of the spectrum cache.
+        coordinate_mapping_cache_info: Returns the hit and miss statistics of the coordinate color mapping cache.
 
     """
 
+    SPECTRUM_CACHE_SIZE = 1 << 12
+    """Maximum number of spectrums kept by the spectrum cache."""
+
+    COORDINATE_MAPPING_CACHE_SIZE = 1 << 6
+    """Maximum number of coordinate color mappings kept by the coordinate color mapping cache."""
+
     class Direction(Enum):
         """Enum for specifying the direction of the gradient."""
 
@@ -139,7 +313,7 @@ class Gradient:
             _stops (tuple[Color]): Tuple of Color objects representing the color stops.
             _steps (int | tuple[int, ...]): Number of steps or a tuple of step values for generating the spectrum.
             _loop (bool): Loop the gradient. This causes the final gradient color to transition back to the first gradient color.
-            spectrum (list[str]): List of strings representing the generated spectrum.
+            spectrum (tuple[Color, ...]): The generated spectrum, shared with every equal gradient.
             _index (int): Current index of the spectrum.
 
         Returns:
@@ -150,7 +324,9 @@ class Gradient:
             raise ValueError("At least one stop must be provided.")
         self._steps = steps
         self._loop = loop
-        self.spectrum: list[Color] = self._generate(self._steps)
+        self.spectrum: tuple[Color, ...] = self._generate(self._steps)
+        if self._loop and len(self._stops) > 1:
+            self._stops = self._stops + (self._stops[0],)
         self._index: int = 0
 
     def get_color_at_fraction(self, fraction: float) -> Color:
@@ -167,126 +343,57 @@ class Gradient:
         index = round(fraction * (len(self.spectrum) - 1))
         return self.spectrum[index]
 
-    def _generate(self, steps) -> list[Color]:
-        """Calculate a gradient of colors between two colors using linear interpolation. If
-        there is only one color in the stops tuple, the gradient will be a list of the same color.
-
-        If multiple steps are given, the gradient between pairs of colors will be equal to the number of steps for the pair
-        based on the order of stops and steps.
+    def _generate(self, steps: tuple[int, ...] | int) -> tuple[Color, ...]:
+        """Returns the spectrum of the gradient from the interned spectrum cache. See _generate_spectrum().
 
-        Ex: stops = ("ffffff", "aaaaaa", "000000"), steps = (6, 3)
-        Distance from "ffffff" to "aaaaaa" = 6 steps (7 colors including start and end)
-        Distance from "aaaaaa" to "000000" = 3 steps (4 colors including start and end)
-        Total colors in the gradient spectrum = 10 ("aaaaaa" is not repeated when transitioning from "ffffff" to "aaaaaa" and from "aaaaaa" to "000000")
+        Args:
+            steps (tuple[int, ...] | int): Number of steps or a tuple of step values for generating the spectrum.
 
+        Returns:
+            tuple[Color, ...]: The spectrum of the gradient, shared with every equal gradient.
+        """
+        if not isinstance(steps, int):
+            steps = tuple(steps)
+        return _generate_spectrum(self._stops, steps, self._loop)
 
-        The step count includes the stop for each pair. Total number of colors in the resulting gradient spectrum:
-        sum(steps) + 1
+    @staticmethod
+    def spectrum_cache_info() -> functools._CacheInfo:
+        """Returns the statistics of the spectrum cache.
 
         Returns:
-            list[str]: List (length=sum(steps) + 1) of RGB hex color strings. The first and last colors are the start and end stops, respectively.
+            functools._CacheInfo: the hits, misses, maxsize and currsize of the cache
         """
-        if isinstance(steps, int):
-            steps = (steps,)
-            for step in steps:
-                if step < 1:
-                    raise ValueError("Steps must be greater than 0.")
-        spectrum: list[Color] = []
-        if len(self._stops) == 1:
-            color = self._stops[0]
-            for _ in range(steps[0]):
-                spectrum.append(color)
-            return spectrum
-        if self._loop:
-            self._stops = self._stops + (self._stops[0],)
-        a, b = itertools.tee(self._stops)
-        next(b, None)
-        color_pairs = list(zip(a, b))
-        # color_pairs = list(itertools.pairwise(self._stops))
-        steps = steps[: len(color_pairs)]
-        color_pair: tuple[Color, Color]
-        for color_pair, steps in itertools.zip_longest(color_pairs, steps, fillvalue=steps[-1]):
-            start, end = color_pair
-            start_color_ints = start.rgb_ints
-            end_color_ints = end.rgb_ints
-            # Initialize an empty list to store the gradient colors
-            gradient_colors: list[Color] = []
-            # Calculate the color deltas for each RGB value
-            red_delta = (end_color_ints[0] - start_color_ints[0]) // steps
-            green_delta = (end_color_ints[1] - start_color_ints[1]) // steps
-            blue_delta = (end_color_ints[2] - start_color_ints[2]) // steps
-            # Calculate the intermediate colors and add them to the gradient colors list
-            range_start = int(len(spectrum) > 0)  # if this is the first pair, add the start color to the spectrum
-            for i in range(range_start, max(steps, 0)):
-                red = start_color_ints[0] + (red_delta * i)
-                green = start_color_ints[1] + (green_delta * i)
-                blue = start_color_ints[2] + (blue_delta * i)
-
-                # Ensure that the RGB values are within the valid range of 0-255
-                red = max(0, min(red, 255))
-                green = max(0, min(green, 255))
-                blue = max(0, min(blue, 255))
-
-                # Convert the RGB values to a hex color string and add it to the gradient colors list
-                gradient_colors.append(Color(f"{red:02x}{green:02x}{blue:02x}"))
-            # Add the end color to the gradient colors list
-            gradient_colors.append(end)
-            spectrum.extend(gradient_colors)
-        return spectrum
+        return _generate_spectrum.cache_info()
 
     def build_coordinate_color_mapping(
         self, max_row: int, max_column: int, direction: "Gradient.Direction"
-    ) -> dict[geometry.Coord, Color]:
+    ) -> CoordinateColorMapping:
         """Builds a mapping of coordinates to colors based on the gradient and a direction.
 
         For example, a vertical gradient will have the same color for each column in a row. When applied across all characters in the canvas, the gradient will be visible as a vertical gradient.
 
+        The mapping holds every coordinate with a row from 0 to max_row and a column from 1 to max_column. The color
+        of a coordinate is computed when it is first looked up. Mappings are cached on the spectrum, canvas dimensions
+        and direction, so equal gradients applied to the same canvas share one mapping.
+
         Args:
             max_row (int): The maximum row value.
             max_column (int): The maximum column value.
             direction (Gradient.Direction): The direction of the gradient.
 
         Returns:
-            dict[Coord, str]: A mapping of coordinates to colors.
+            CoordinateColorMapping: A read-only mapping of coordinates to colors.
         """
-        gradient_mapping: dict[geometry.Coord, Color] = {}
-        if direction == Gradient.Direction.VERTICAL:
-            for row_value in range(max_row + 1):
-                if max_row == 0:
-                    fraction = 1.0
-                else:
-                    fraction = row_value / max_row
-                color = self.get_color_at_fraction(fraction)
-                for column_value in range(1, max_column + 1):
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-        elif direction == Gradient.Direction.HORIZONTAL:
-            for column_value in range(1, max_column + 1):
-                if max_column == 0:
-                    fraction = 1.0
-                else:
-                    fraction = column_value / max_column
-                color = self.get_color_at_fraction(fraction)
-                for row_value in range(max_row + 1):
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-        elif direction == Gradient.Direction.RADIAL:
-            for row_value in range(max_row + 1):
-                for column_value in range(1, max_column + 1):
-                    distance_from_center = geometry.find_normalized_distance_from_center(
-                        max_row, max_column, geometry.Coord(column_value, row_value)
-                    )
-                    color = self.get_color_at_fraction(distance_from_center)
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-        elif direction == Gradient.Direction.DIAGONAL:
-            for row_value in range(max_row + 1):
-                for column_value in range(1, max_column + 1):
-                    if max_row == 0 or max_column == 0:
-                        fraction = 1.0
-                    else:
-                        fraction = ((row_value * 2) + column_value) / ((max_row * 2) + max_column)
-                    color = self.get_color_at_fraction(fraction)
-                    gradient_mapping[geometry.Coord(column_value, row_value)] = color
-
-        return gradient_mapping
+        return _build_coordinate_color_mapping(self.spectrum, max_row, max_column, direction)
+
+    @staticmethod
+    def coordinate_mapping_cache_info() -> functools._CacheInfo:
+        """Returns the statistics of the coordinate color mapping cache.
+
+        Returns:
+            functools._CacheInfo: the hits, misses, maxsize and currsize of the cache
+        """
+        return _build_coordinate_color_mapping.cache_info()
 
     def __iter__(self) -> Iterator[Color]:
         yield from self.spectrum
@@ -299,3 +406,292 @@ class Gradient:
         return f"Gradient: Stops({', '.join(c.rgb_color for c in self._stops)}), Steps({self._steps})\n" + "".join(
             color_blocks
         )
+
+
+class CoordinateColorMapping(typing.Mapping[geometry.Coord, Color]):
+    """A read-only mapping of the coordinates of a canvas to the colors of a gradient spectrum in a direction. Returned
+    by Gradient.build_coordinate_color_mapping().
+
+    The mapping holds every coordinate with a row from 0 to max_row and a column from 1 to max_column. The color of a
+    coordinate is computed when it is first looked up and kept for later lookups, so building a mapping for a large
+    canvas costs nothing until it is used, and effects which only look up the coordinates of the input characters
+    only compute those colors. Iterating over the mapping computes every remaining color at once, with NumPy if the
+    optional `numpy` dependency is installed and the canvas is large.
+
+    Attributes:
+        spectrum (tuple[Color, ...]): the spectrum of the gradient
+        max_row (int): the maximum row value
+        max_column (int): the maximum column value
+        direction (Gradient.Direction): the direction of the gradient
+
+    Methods:
+        fraction_at: Returns the fraction of the gradient at a coordinate.
+    """
+
+    __slots__ = ("spectrum", "max_row", "max_column", "direction", "_colors", "_complete")
+
+    VECTORIZE_MIN_COORDS = 4096
+    """Minimum number of coordinates for the colors to be computed with NumPy when the mapping is iterated."""
+
+    def __init__(
+        self, spectrum: tuple[Color, ...], max_row: int, max_column: int, direction: Gradient.Direction
+    ) -> None:
+        """Initializes the mapping. No colors are computed until they are looked up.
+
+        Args:
+            spectrum (tuple[Color, ...]): the spectrum of the gradient
+            max_row (int): the maximum row value
+            max_column (int): the maximum column value
+            direction (Gradient.Direction): the direction of the gradient
+        """
+        self.spectrum = spectrum
+        self.max_row = max_row
+        self.max_column = max_column
+        self.direction = direction
+        self._colors: dict[geometry.Coord, Color] = {}
+        self._complete = False
+
+    def fraction_at(self, column: int, row: int) -> float:
+        """Returns the fraction of the gradient at a coordinate.
+
+        Args:
+            column (int): column value
+            row (int): row value
+
+        Returns:
+            float: the fraction of the gradient, between 0 and 1 for coordinates on the canvas
+        """
+        max_row = self.max_row
+        max_column = self.max_column
+        direction = self.direction
+        if direction == Gradient.Direction.VERTICAL:
+            return 1.0 if max_row == 0 else row / max_row
+        if direction == Gradient.Direction.HORIZONTAL:
+            return 1.0 if max_column == 0 else column / max_column
+        if direction == Gradient.Direction.RADIAL:
+            return geometry.find_normalized_distance_from_center(max_row, max_column, geometry.Coord(column, row))
+        if max_row == 0 or max_column == 0:
+            return 1.0
+        return ((row * 2) + column) / ((max_row * 2) + max_column)
+
+    def _color_at_fraction(self, fraction: float) -> Color:
+        """Returns the color of the spectrum at a fraction. See Gradient.get_color_at_fraction().
+
+        Args:
+            fraction (float): the fraction of the gradient
+
+        Returns:
+            Color: the color at the fraction
+        """
+        if fraction < 0 or fraction > 1:
+            raise ValueError("Fraction must be 0 <= fraction <= 1.")
+        return self.spectrum[round(fraction * (len(self.spectrum) - 1))]
+
+    def _iter_coords(self) -> Iterator[geometry.Coord]:
+        """Yields the coordinates of the canvas in the order the gradient is built, by column and then row for
+        horizontal gradients and by row and then column otherwise.
+
+        Yields:
+            Coord: the coordinates of the canvas
+        """
+        Coord = geometry.Coord
+        rows = range(self.max_row + 1)
+        columns = range(1, self.max_column + 1)
+        if self.direction == Gradient.Direction.HORIZONTAL:
+            for column in columns:
+                for row in rows:
+                    yield Coord(column, row)
+        else:
+            for row in rows:
+                for column in columns:
+                    yield Coord(column, row)
+
+    def _complete_colors(self) -> None:
+        """Computes the color of every coordinate which has not been looked up yet."""
+        coords = list(self._iter_coords())
+        colors = self._colors
+        numpy = _import_numpy() if len(coords) - len(colors) >= self.VECTORIZE_MIN_COORDS else None
+        if numpy is None:
+            for coord in coords:
+                if coord not in colors:
+                    colors[coord] = self._color_at_fraction(self.fraction_at(coord.column, coord.row))
+        else:
+            spectrum = self.spectrum
+            for coord, index in zip(coords, self._vectorized_indexes(numpy, coords).tolist()):
+                colors[coord] = spectrum[index]
+        self._complete = True
+
+    def _vectorized_indexes(self, numpy: typing.Any, coords: list[geometry.Coord]) -> typing.Any:
+        """Computes the spectrum index of every coordinate with NumPy. The arithmetic matches fraction_at() and
+        _color_at_fraction(), so the colors are the same as when each coordinate is looked up.
+
+        Args:
+            numpy (typing.Any): the numpy module
+            coords (list[Coord]): the coordinates, in the order of _iter_coords()
+
+        Returns:
+            typing.Any: an array of the spectrum index of each coordinate
+        """
+        max_row = self.max_row
+        max_column = self.max_column
+        direction = self.direction
+        rows = numpy.fromiter((coord.row for coord in coords), dtype=numpy.float64, count=len(coords))
+        columns = numpy.fromiter((coord.column for coord in coords), dtype=numpy.float64, count=len(coords))
+        if direction == Gradient.Direction.VERTICAL:
+            fractions = numpy.ones_like(rows) if max_row == 0 else rows / max_row
+        elif direction == Gradient.Direction.HORIZONTAL:
+            fractions = numpy.ones_like(columns) if max_column == 0 else columns / max_column
+        elif direction == Gradient.Direction.RADIAL:
+            center_x = max_column / 2
+            center_y = max_row / 2
+            max_distance = ((max_column**2) + ((max_row * 2) ** 2)) ** 0.5
+            distances = numpy.sqrt((columns - center_x) ** 2 + ((rows - center_y) * 2) ** 2)
+            fractions = distances / (max_distance / 2)
+        elif max_row == 0 or max_column == 0:
+            fractions = numpy.ones_like(rows)
+        else:
+            fractions = ((rows * 2) + columns) / ((max_row * 2) + max_column)
+        if fractions.size and (fractions.min() < 0 or fractions.max() > 1):
+            raise ValueError("Fraction must be 0 <= fraction <= 1.")
+        # rint rounds halves to even, as round() does
+        return numpy.rint(fractions * (len(self.spectrum) - 1)).astype(numpy.int64)
+
+    def __getitem__(self, coord: geometry.Coord) -> Color:
+        color = self._colors.get(coord)
+        if color is None:
+            if not (
+                isinstance(coord, geometry.Coord)
+                and 1 <= coord.column <= self.max_column
+                and 0 <= coord.row <= self.max_row
+            ):
+                raise KeyError(coord)
+            color = self._colors[coord] = self._color_at_fraction(self.fraction_at(coord.column, coord.row))
+        return color
+
+    def __contains__(self, coord: object) -> bool:
+        return (
+            isinstance(coord, geometry.Coord) and 1 <= coord.column <= self.max_column and 0 <= coord.row <= self.max_row
+        )
+
+    def __iter__(self) -> Iterator[geometry.Coord]:
+        if not self._complete:
+            self._complete_colors()
+        return self._iter_coords()
+
+    def __len__(self) -> int:
+        return max(self.max_row + 1, 0) * max(self.max_column, 0)
+
+    def __repr__(self) -> str:
+        return (
+            f"CoordinateColorMapping(max_row={self.max_row}, max_column={self.max_column}, "
+            f"direction={self.direction}, computed={len(self._colors)})"
+        )
+
+
+@functools.lru_cache(maxsize=Gradient.SPECTRUM_CACHE_SIZE)
+def _generate_spectrum(stops: tuple[Color, ...], steps: tuple[int, ...] | int, loop: bool) -> tuple[Color, ...]:
+    """Calculate a gradient of colors between two colors using linear interpolation. If
+    there is only one color in the stops tuple, the gradient will be a list of the same color.
+
+    If multiple steps are given, the gradient between pairs of colors will be equal to the number of steps for the pair
+    based on the order of stops and steps.
+
+    Ex: stops = ("ffffff", "aaaaaa", "000000"), steps = (6, 3)
+    Distance from "ffffff" to "aaaaaa" = 6 steps (7 colors including start and end)
+    Distance from "aaaaaa" to "000000" = 3 steps (4 colors including start and end)
+    Total colors in the gradient spectrum = 10 ("aaaaaa" is not repeated when transitioning from "ffffff" to "aaaaaa" and from "aaaaaa" to "000000")
+
+
+    The step count includes the stop for each pair. Total number of colors in the resulting gradient spectrum:
+    sum(steps) + 1
+
+    Cached by Gradient._generate().
+
+    Args:
+        stops (tuple[Color, ...]): the color stops
+        steps (tuple[int, ...] | int): number of steps or a tuple of step values
+        loop (bool): transition from the final stop back to the first stop
+
+    Returns:
+        tuple[Color, ...]: Tuple (length=sum(steps) + 1) of Colors. The first and last colors are the start and end stops, respectively.
+    """
+    if isinstance(steps, int):
+        steps = (steps,)
+        for step in steps:
+            if step < 1:
+                raise ValueError("Steps must be greater than 0.")
+    spectrum: list[Color] = []
+    if len(stops) == 1:
+        color = stops[0]
+        for _ in range(steps[0]):
+            spectrum.append(color)
+        return tuple(spectrum)
+    if loop:
+        stops = stops + (stops[0],)
+    a, b = itertools.tee(stops)
+    next(b, None)
+    color_pairs = list(zip(a, b))
+    # color_pairs = list(itertools.pairwise(stops))
+    steps = steps[: len(color_pairs)]
+    color_pair: tuple[Color, Color]
+    for color_pair, steps in itertools.zip_longest(color_pairs, steps, fillvalue=steps[-1]):
+        start, end = color_pair
+        start_color_ints = start.rgb_ints
+        end_color_ints = end.rgb_ints
+        # Initialize an empty list to store the gradient colors
+        gradient_colors: list[Color] = []
+        # Calculate the color deltas for each RGB value
+        red_delta = (end_color_ints[0] - start_color_ints[0]) // steps
+        green_delta = (end_color_ints[1] - start_color_ints[1]) // steps
+        blue_delta = (end_color_ints[2] - start_color_ints[2]) // steps
+        # Calculate the intermediate colors and add them to the gradient colors list
+        range_start = int(len(spectrum) > 0)  # if this is the first pair, add the start color to the spectrum
+        for i in range(range_start, max(steps, 0)):
+            red = start_color_ints[0] + (red_delta * i)
+            green = start_color_ints[1] + (green_delta * i)
+            blue = start_color_ints[2] + (blue_delta * i)
+
+            # Ensure that the RGB values are within the valid range of 0-255
+            red = max(0, min(red, 255))
+            green = max(0, min(green, 255))
+            blue = max(0, min(blue, 255))
+
+            # Intern the color from the RGB values and add it to the gradient colors list
+            gradient_colors.append(Color.from_rgb(red, green, blue))
+        # Add the end color to the gradient colors list
+        gradient_colors.append(end)
+        spectrum.extend(gradient_colors)
+    return tuple(spectrum)
+
+
+@functools.lru_cache(maxsize=Gradient.COORDINATE_MAPPING_CACHE_SIZE)
+def _build_coordinate_color_mapping(
+    spectrum: tuple[Color, ...], max_row: int, max_column: int, direction: Gradient.Direction
+) -> CoordinateColorMapping:
+    """Returns the coordinate color mapping of a spectrum on a canvas. Cached by
+    Gradient.build_coordinate_color_mapping().
+
+    Args:
+        spectrum (tuple[Color, ...]): the spectrum of the gradient
+        max_row (int): The maximum row value.
+        max_column (int): The maximum column value.
+        direction (Gradient.Direction): The direction of the gradient.
+
+    Returns:
+        CoordinateColorMapping: the mapping
+    """
+    return CoordinateColorMapping(spectrum, max_row, max_column, direction)
+
+
+@functools.lru_cache(maxsize=1)
+def _import_numpy() -> typing.Any:
+    """Returns the numpy module, or None if the optional numpy dependency is not installed.
+
+    Returns:
+        typing.Any: the numpy module or None
+    """
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
@@ -2,12 +2,15 @@
 
 Functions:
     hex_to_xterm: Convert RGB Hex colors to their closest XTerm-256 color.
+    hex_to_xterm_colors: Convert a sequence of RGB Hex colors to their closest XTerm-256 colors.
     xterm_to_hex: Convert XTerm-256 color codes to RGB Hex colors.
     is_valid_color: Check if the input is a valid RGB Hex color code.
 """
 
 from __future__ import annotations
 
+import typing
+
 xterm_to_hex_map = {
     0: "#000000",
     1: "#800000",
@@ -270,9 +273,40 @@ xterm_to_hex_map = {
 xterm_to_rgb_map = {k: (int(v[1:3], 16), int(v[3:5], 16), int(v[5:7], 16)) for k, v in xterm_to_hex_map.items()}
 
 
+_SYSTEM_COLORS = tuple((xterm_color, xterm_to_rgb_map[xterm_color]) for xterm_color in range(16))
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+_GRAY_LEVELS = tuple(8 + 10 * gray_index for gray_index in range(24))
+
+
+def _nearest_levels(levels: tuple[int, ...], value: int) -> tuple[int, ...]:
+    """Returns the indexes of the levels with the smallest absolute difference from the value, in order."""
+    min_diff = min(abs(level - value) for level in levels)
+    return tuple(index for index, level in enumerate(levels) if abs(level - value) == min_diff)
+
+
+# the distance to the 6x6x6 color cube is the sum of the distances of each channel, so the closest cube color is made
+# of the closest level in each channel. Ties are resolved to the lower level, which is the lower color code.
+_CUBE_LEVEL_BY_VALUE = tuple(_nearest_levels(_CUBE_LEVELS, value)[0] for value in range(256))
+# the distance to a gray is smallest at the median channel value and increases away from it, so the closest grays are
+# the levels on either side of the median
+_GRAY_CANDIDATES_BY_MEDIAN = tuple(
+    tuple(
+        sorted(
+            {max((index for index, level in enumerate(_GRAY_LEVELS) if level <= value), default=0)}
+            | {min((index for index, level in enumerate(_GRAY_LEVELS) if level >= value), default=23)}
+        )
+    )
+    for value in range(256)
+)
+
+
 def hex_to_xterm(hex_color: str) -> int:
     """Convert RGB Hex colors to their closest XTerm-256 color.
 
+    The closest color is the one with the smallest sum of channel differences, the lowest color code if several are
+    equally close. Rather than comparing every color, the closest colors of the 6x6x6 color cube and the grayscale ramp
+    are looked up from tables indexed by channel value, and compared with the 16 system colors.
+
     Args:
         hex_color (str): RGB Hex color code, '#' is optional
 
@@ -281,20 +315,59 @@ def hex_to_xterm(hex_color: str) -> int:
     """
     # Strip '#' if present and convert hex to RGB
     color_string = hex_color.strip("#")
-    input_rgb = tuple(int(color_string[i : i + 2], 16) for i in range(0, 6, 2))
+    red, green, blue = int(color_string[0:2], 16), int(color_string[2:4], 16), int(color_string[4:6], 16)
 
-    # Compute the differences between input color and each xterm color
-    min_diff = float("inf")
-
-    for xterm_color, xterm_rgb in xterm_to_rgb_map.items():
-        diff = sum(abs(input_rgb[i] - xterm_rgb[i]) for i in range(3)) / 3
+    min_diff = 766
+    for xterm_color, (xterm_red, xterm_green, xterm_blue) in _SYSTEM_COLORS:
+        diff = abs(red - xterm_red) + abs(green - xterm_green) + abs(blue - xterm_blue)
         if diff < min_diff:
             min_diff = diff
             closest_color = xterm_color
 
+    red_index, green_index, blue_index = (
+        _CUBE_LEVEL_BY_VALUE[red],
+        _CUBE_LEVEL_BY_VALUE[green],
+        _CUBE_LEVEL_BY_VALUE[blue],
+    )
+    diff = (
+        abs(red - _CUBE_LEVELS[red_index])
+        + abs(green - _CUBE_LEVELS[green_index])
+        + abs(blue - _CUBE_LEVELS[blue_index])
+    )
+    if diff < min_diff:
+        min_diff = diff
+        closest_color = 16 + 36 * red_index + 6 * green_index + blue_index
+
+    for gray_index in _GRAY_CANDIDATES_BY_MEDIAN[sorted((red, green, blue))[1]]:
+        gray = _GRAY_LEVELS[gray_index]
+        diff = abs(red - gray) + abs(green - gray) + abs(blue - gray)
+        if diff < min_diff:
+            min_diff = diff
+            closest_color = 232 + gray_index
+
     return closest_color
 
 
+def hex_to_xterm_colors(hex_colors: typing.Iterable[str]) -> list[int]:
+    """Convert a sequence of RGB Hex colors, such as a gradient spectrum, to their closest XTerm-256 colors. Each
+    distinct color is converted once.
+
+    Args:
+        hex_colors (typing.Iterable[str]): RGB Hex color codes, '#' is optional
+
+    Returns:
+        list[int]: (0-255) XTerm-256 color codes, in the same order as the input
+    """
+    xterm_colors: dict[str, int] = {}
+    converted = []
+    for hex_color in hex_colors:
+        xterm_color = xterm_colors.get(hex_color)
+        if xterm_color is None:
+            xterm_color = xterm_colors[hex_color] = hex_to_xterm(hex_color)
+        converted.append(xterm_color)
+    return converted
+
+
 def xterm_to_hex(xterm_color: int) -> str:
     """Convert XTerm-256 color code to RGB Hex color code.
 
@@ -0,0 +1,199 @@
+"""This module provides structured SGR (Select Graphic Rendition) styles and the sequences required to move the terminal
+from one style to another.
+
+A style is the set of SGR parameters in effect when a cell is drawn. Styles are stored as tuples of parameter strings
+in a canonical order (graphical modes, then foreground color, then background color) and are interned, so two cells
+are drawn with the same style if and only if their styles are the same object.
+
+Functions:
+    get_style: Returns the interned style for a sequence of SGR parameters.
+    apply_parameters: Returns the style that results from applying an SGR parameter string to a style.
+    get_sequence: Returns the SGR sequence that applies a style from the default state.
+    get_transition: Returns the shortest SGR sequence that changes the terminal from one style to another.
+    is_space_invisible: Returns whether a space drawn with the style looks the same as a space with the default style.
+"""
+
+from __future__ import annotations
+
+import typing
+
+Style = typing.Tuple[str, ...]
+
+DEFAULT_STYLE: Style = ()
+
+_FOREGROUND = "38"
+_BACKGROUND = "48"
+_SLOT_ORDER = {"1": 0, "2": 1, "3": 2, "4": 3, "5": 4, "7": 5, "8": 6, "9": 7, _FOREGROUND: 8, _BACKGROUND: 9}
+_SLOT_OFF_PARAMETERS = {
+    "1": "22",
+    "2": "22",
+    "3": "23",
+    "4": "24",
+    "5": "25",
+    "7": "27",
+    "8": "28",
+    "9": "29",
+    _FOREGROUND: "39",
+    _BACKGROUND: "49",
+}
+_OFF_PARAMETER_SLOTS = {"22": ("1", "2"), "39": (_FOREGROUND,), "49": (_BACKGROUND,)}
+_OFF_PARAMETER_SLOTS.update(
+    {parameter: (slot,) for slot, parameter in _SLOT_OFF_PARAMETERS.items() if slot in ("3", "4", "5", "7", "8", "9")}
+)
+_SPACE_INVISIBLE_SLOTS = frozenset(("1", "2", "3", "5", "8", _FOREGROUND))
+"""Slots that do not change how a space is drawn: a space has no glyph to embolden, italicize, blink, hide or color."""
+
+_MAX_CACHE_SIZE = 1 << 16
+
+_styles: dict[Style, Style] = {DEFAULT_STYLE: DEFAULT_STYLE}
+_applied_parameters: dict[tuple[Style, str], Style] = {}
+_transitions: dict[tuple[Style, Style], str] = {}
+_space_invisible: dict[Style, bool] = {}
+
+
+def _get_slot(parameter: str) -> str:
+    """Returns the slot a parameter occupies in a style. Parameters in the same slot replace each other.
+
+    Args:
+        parameter (str): a single SGR parameter, including the arguments of extended colors (e.g. '38;5;82')
+
+    Returns:
+        str: the slot
+    """
+    head = parameter.split(";", 1)[0]
+    if head in _SLOT_ORDER:
+        return head
+    code = int(head)
+    if 30 <= code <= 37 or 90 <= code <= 97:
+        return _FOREGROUND
+    if 40 <= code <= 47 or 100 <= code <= 107:
+        return _BACKGROUND
+    return head
+
+
+def get_style(parameters: typing.Iterable[str]) -> Style:
+    """Returns the interned style for a sequence of SGR parameters. Later parameters replace earlier parameters in
+    the same slot.
+
+    Args:
+        parameters (typing.Iterable[str]): SGR parameters, e.g. ('1', '38;2;255;0;0')
+
+    Returns:
+        Style: the interned style
+    """
+    slots = {_get_slot(parameter): parameter for parameter in parameters}
+    style = tuple(slots[slot] for slot in sorted(slots, key=lambda slot: _SLOT_ORDER.get(slot, len(_SLOT_ORDER))))
+    return _styles.setdefault(style, style)
+
+
+def apply_parameters(style: Style, parameters: str) -> Style:
+    """Returns the style that results from applying an SGR parameter string to a style.
+
+    Args:
+        style (Style): the style in effect before the sequence
+        parameters (str): the parameters of an SGR sequence, e.g. '0' or '38;2;255;0;0' for '\\x1b[38;2;255;0;0m'
+
+    Returns:
+        Style: the interned style after the sequence
+    """
+    applied_style = _applied_parameters.get((style, parameters))
+    if applied_style is not None:
+        return applied_style
+    slots = {_get_slot(parameter): parameter for parameter in style}
+    codes = parameters.split(";") if parameters else ["0"]
+    index = 0
+    while index < len(codes):
+        code = codes[index] or "0"
+        if code in (_FOREGROUND, _BACKGROUND) and index + 1 < len(codes):
+            argument_count = 2 if codes[index + 1] == "5" else 4
+            slots[code] = ";".join(codes[index : index + argument_count + 1])
+            index += argument_count
+        elif code == "0":
+            slots.clear()
+        elif code in _OFF_PARAMETER_SLOTS:
+            for slot in _OFF_PARAMETER_SLOTS[code]:
+                slots.pop(slot, None)
+        else:
+            slots[_get_slot(code)] = code
+        index += 1
+    applied_style = get_style(slots.values())
+    if len(_applied_parameters) >= _MAX_CACHE_SIZE:
+        _applied_parameters.clear()
+    _applied_parameters[(style, parameters)] = applied_style
+    return applied_style
+
+
+def get_sequence(style: Style) -> str:
+    """Returns the SGR sequence that applies a style from the default state.
+
+    Args:
+        style (Style): the style
+
+    Returns:
+        str: the SGR sequence, empty for the default style
+    """
+    if not style:
+        return ""
+    return f"\x1b[{';'.join(style)}m"
+
+
+def get_transition(current_style: Style, style: Style) -> str:
+    """Returns the shortest SGR sequence that changes the terminal from one style to another.
+
+    The sequence either turns off the parameters that are no longer used and applies the ones that changed, or
+    resets the terminal and applies the new style from scratch, whichever is shorter.
+
+    Args:
+        current_style (Style): the style currently in effect
+        style (Style): the style to change to
+
+    Returns:
+        str: the SGR sequence, empty if the styles are the same
+    """
+    transition = _transitions.get((current_style, style))
+    if transition is not None:
+        return transition
+    if current_style == style:
+        transition = ""
+    else:
+        current_slots = {_get_slot(parameter): parameter for parameter in current_style}
+        slots = {_get_slot(parameter): parameter for parameter in style}
+        off_parameters: list[str] = []
+        for slot in current_slots:
+            if slot not in slots and _SLOT_OFF_PARAMETERS.get(slot, "0") not in off_parameters:
+                off_parameters.append(_SLOT_OFF_PARAMETERS.get(slot, "0"))
+        if "0" in off_parameters:
+            delta_parameters = None
+        else:
+            # bold and dim share an off parameter, so turning one off requires the other to be reapplied
+            reapplied_slots = ("1", "2") if "22" in off_parameters else ()
+            delta_parameters = off_parameters + [
+                parameter
+                for slot, parameter in slots.items()
+                if current_slots.get(slot) != parameter or slot in reapplied_slots
+            ]
+        reset_parameters = ["0", *style]
+        if delta_parameters is None or len(";".join(reset_parameters)) < len(";".join(delta_parameters)):
+            transition = f"\x1b[{';'.join(reset_parameters)}m" if style else "\x1b[0m"
+        else:
+            transition = f"\x1b[{';'.join(delta_parameters)}m"
+    if len(_transitions) >= _MAX_CACHE_SIZE:
+        _transitions.clear()
+    _transitions[(current_style, style)] = transition
+    return transition
+
+
+def is_space_invisible(style: Style) -> bool:
+    """Returns whether a space drawn with the style looks the same as a space drawn with the default style.
+
+    Args:
+        style (Style): the style
+
+    Returns:
+        bool: True if the style only uses parameters that do not change how a space is drawn
+    """
+    invisible = _space_invisible.get(style)
+    if invisible is None:
+        invisible = all(_get_slot(parameter) in _SPACE_INVISIBLE_SLOTS for parameter in style)
+        _space_invisible[style] = invisible
+    return invisible
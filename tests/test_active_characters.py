@@ -0,0 +1,283 @@
+from __future__ import annotations
+
+import importlib
+import random
+
+import pytest
+
+from terminaltexteffects.engine.active_characters import ActiveCharacters
+from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
+from terminaltexteffects.engine.terminal import TerminalConfig
+from terminaltexteffects.utils import easing
+from terminaltexteffects.utils.geometry import Coord
+
+
+def make_characters() -> list[EffectCharacter]:
+    characters = []
+    for character_id in range(4):
+        character = EffectCharacter(character_id, "a", 1, 1)
+        scene = character.animation.new_scene(id="scene")
+        for duration in (3, 40 + character_id, 1, 12):
+            scene.add_frame(str(duration), duration)
+        path = character.motion.new_path(speed=0.5, hold_time=30 + character_id * 7, id="path")
+        path.new_waypoint(Coord(5, 1 + character_id))
+        final_scene = character.animation.new_scene(id="final")
+        final_scene.add_frame("z", 25)
+        character.event_handler.register_event(
+            EventHandler.Event.PATH_COMPLETE, path, EventHandler.Action.ACTIVATE_SCENE, final_scene
+        )
+        character.animation.activate_scene(scene)
+        character.motion.activate_path(path)
+        characters.append(character)
+    return characters
+
+
+def get_states(characters: list[EffectCharacter]) -> list[tuple[Coord, str]]:
+    return [(character.motion.current_coord, character.visual.symbol) for character in characters]
+
+
+def reference_ticks(characters: list[EffectCharacter], tick_count: int) -> list[list[tuple[Coord, str]]]:
+    """Ticks every active character on every tick, as lists of characters were ticked before."""
+    states = []
+    active_characters = list(characters)
+    for tick in range(tick_count):
+        if tick == 60:
+            characters[1].animation.activate_scene(characters[1].animation.query_scene("final"))
+        active_characters = [character for character in active_characters if character.tick() or character.is_active]
+        states.append(get_states(characters))
+    return states
+
+
+def test_parked_characters_match_ticking_every_character():
+    tick_count = 150
+    expected = reference_ticks(make_characters(), tick_count)
+    characters = make_characters()
+    active_characters = ActiveCharacters(characters)
+    states = []
+    parked_counts = []
+    for tick in range(tick_count):
+        if tick == 60:
+            # changing a parked character wakes it
+            characters[1].animation.activate_scene(characters[1].animation.query_scene("final"))
+        active_characters.update()
+        states.append(get_states(characters))
+        parked_counts.append(active_characters.parked_count)
+    assert states == expected
+    assert max(parked_counts) == len(characters)
+    assert not active_characters
+
+
+def test_characters_are_deduplicated():
+    character = EffectCharacter(0, "a", 1, 1)
+    path = character.motion.new_path()
+    path.new_waypoint(Coord(10, 1))
+    character.motion.activate_path(path)
+    active_characters = ActiveCharacters()
+    active_characters.append(character)
+    active_characters.extend([character, character])
+    assert len(active_characters) == 1
+    assert character in active_characters
+    active_characters.update()
+    assert character.motion.current_coord == Coord(2, 1)
+
+
+def test_removed_characters_are_woken():
+    characters = make_characters()
+    active_characters = ActiveCharacters(characters)
+    for _ in range(10):
+        active_characters.update()
+    assert active_characters.parked_count
+    active_characters.clear()
+    assert not active_characters
+    assert active_characters.parked_count == 0
+    assert all(character._scheduler is None for character in characters)
+
+
+def make_two_frame_character() -> EffectCharacter:
+    character = EffectCharacter(0, "a", 1, 1)
+    scene = character.animation.new_scene(id="scene")
+    scene.add_frame("a", 20)
+    scene.add_frame("b", 20)
+    character.animation.activate_scene(scene)
+    return character
+
+
+def play_with_scene_change(active_characters: ActiveCharacters | None, change) -> tuple[list[str], tuple[int, int]]:
+    character = make_two_frame_character()
+    scene = character.animation.query_scene("scene")
+    if active_characters is not None:
+        active_characters.append(character)
+    symbols = []
+    for tick in range(45):
+        if tick == 10:
+            change(scene)
+        if active_characters is None:
+            character.tick()
+        else:
+            active_characters.update()
+        symbols.append(character.visual.symbol)
+    if active_characters is not None and character in active_characters:
+        # removing a parked character wakes it, bringing its counters up to date
+        active_characters.remove(character)
+    return symbols, (scene.frame_cursor, scene.current_frame_steps)
+
+
+def test_changing_the_scene_of_a_parked_character_matches_ticking():
+    def add_frame(scene) -> None:
+        scene.add_frame("c", 5)
+
+    for change in (lambda scene: scene.reset_scene(), add_frame):
+        expected = play_with_scene_change(None, change)
+        active_characters = ActiveCharacters()
+        assert play_with_scene_change(active_characters, change) == expected
+
+
+def make_moving_character(character_id: int) -> EffectCharacter:
+    character = EffectCharacter(character_id, "a", 1, 1)
+    path = character.motion.new_path(id="path")
+    path.new_waypoint(Coord(10, 1), id="end")
+    character.motion.activate_path(path)
+    return character
+
+
+def remove_on_segment_entered(
+    character: EffectCharacter, active_characters: ActiveCharacters, removed: list[EffectCharacter]
+) -> None:
+    character.event_handler.register_event(
+        EventHandler.Event.SEGMENT_ENTERED,
+        character.motion.query_path("path").query_waypoint("end"),
+        EventHandler.Action.CALLBACK,
+        EventHandler.Callback(lambda _: [active_characters.remove(other) for other in removed]),
+    )
+
+
+def test_characters_removed_by_events_are_not_ticked():
+    active_characters = ActiveCharacters()
+    first, second, third = (make_moving_character(character_id) for character_id in range(3))
+    # the third character is on its last step and would become inactive if it was ticked
+    third_path = third.motion.query_path("path")
+    third_path.current_step = third_path.max_steps - 1
+    remove_on_segment_entered(first, active_characters, [second, third])
+    active_characters.extend([first, second, third])
+    active_characters.update()
+    assert list(active_characters) == [first]
+    assert second.motion.current_coord == third.motion.current_coord == Coord(1, 1)
+    coord = first.motion.current_coord
+    active_characters.update()
+    assert first.motion.current_coord != coord
+
+
+def test_characters_removed_after_their_turn_are_not_ticked_again():
+    active_characters = ActiveCharacters()
+    first, second = make_moving_character(0), make_moving_character(1)
+    remove_on_segment_entered(second, active_characters, [first])
+    active_characters.extend([first, second])
+    active_characters.update()
+    coord = first.motion.current_coord
+    active_characters.update()
+    assert first not in active_characters
+    assert first.motion.current_coord == coord
+
+
+def make_batched_characters() -> list[EffectCharacter]:
+    characters = [EffectCharacter(character_id, "a", 1, 1 + character_id) for character_id in range(6)]
+    for character in characters:
+        row = character.input_coord.row
+        scene = character.animation.new_scene(id="scene")
+        scene.add_frame("a", 25)
+        scene.add_frame("b", 30)
+        path = character.motion.new_path(speed=0.3 + 0.05 * character.character_id, ease=easing.in_out_sine, id="path")
+        path.new_waypoint(Coord(20, row), id="middle")
+        path.new_waypoint(Coord(30, row + 8), bezier_control=Coord(40, row), id="end")
+        detour = character.motion.new_path(speed=0.6, id="detour")
+        detour.new_waypoint(Coord(5, row + 3))
+        character.animation.activate_scene(scene)
+        character.motion.activate_path(path)
+
+    def take_detour(character: EffectCharacter) -> None:
+        character.motion.activate_path(character.motion.query_path("detour"))
+
+    # the third character changes the second character after its turn and the fifth before its turn
+    characters[2].event_handler.register_event(
+        EventHandler.Event.SEGMENT_ENTERED,
+        characters[2].motion.query_path("path").query_waypoint("end"),
+        EventHandler.Action.CALLBACK,
+        EventHandler.Callback(lambda _: [take_detour(characters[1]), take_detour(characters[4])]),
+    )
+    return characters
+
+
+def get_batched_states(characters: list[EffectCharacter]) -> list[tuple[Coord, Coord, str]]:
+    return [
+        (character.motion.current_coord, character.motion.previous_coord, character.visual.symbol)
+        for character in characters
+    ]
+
+
+def test_batched_characters_match_ticking_every_character(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(ActiveCharacters, "BATCH_MIN_CHARACTERS", 2)
+    tick_count = 150
+    characters = make_batched_characters()
+    expected = []
+    ticked_characters = list(characters)
+    for tick in range(tick_count):
+        if tick == 20:
+            characters[3].motion.set_coordinate(Coord(2, 2))
+        ticked_characters = [
+            character for character in ticked_characters if character.tick() or character.is_active
+        ]
+        expected.append(get_batched_states(characters))
+    characters = make_batched_characters()
+    active_characters = ActiveCharacters(characters)
+    states = []
+    batched_counts = []
+    for tick in range(tick_count):
+        if tick == 20:
+            # changing a batched character wakes it
+            characters[3].motion.set_coordinate(Coord(2, 2))
+        active_characters.update()
+        states.append(get_batched_states(characters))
+        batched_counts.append(active_characters.batched_count)
+    assert states == expected
+    assert max(batched_counts) == len(characters)
+    assert active_characters.batched_count == 0
+    assert all(character._scheduler is None for character in characters)
+
+
+def test_removed_characters_are_released_from_the_batch(monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(ActiveCharacters, "BATCH_MIN_CHARACTERS", 2)
+    characters = [make_moving_character(character_id) for character_id in range(3)]
+    for character in characters:
+        character.motion.query_path("path").speed = 0.1
+        character.motion.activate_path(character.motion.query_path("path"))
+    active_characters = ActiveCharacters(characters)
+    for _ in range(10):
+        active_characters.update()
+    assert active_characters.batched_count == 3
+    active_characters.remove(characters[0])
+    path = characters[0].motion.query_path("path")
+    assert (path.current_step, characters[0].motion.current_coord) == (10, Coord(2, 1))
+    active_characters.clear()
+    assert active_characters.batched_count == 0
+    assert all(character._scheduler is None for character in characters)
+
+
+def get_effect_frames(effect_name: str) -> list[str]:
+    module = importlib.import_module(f"terminaltexteffects.effects.effect_{effect_name}")
+    random.seed(0)
+    effect = module.get_effect_and_args()[0]("abc def\nghi\tjkl\n0123456789\n  mn  op")
+    terminal_config = TerminalConfig()
+    terminal_config.frame_rate = 0
+    terminal_config.ignore_terminal_dimensions = True
+    effect.terminal_config = terminal_config
+    return list(effect)
+
+
+@pytest.mark.parametrize("effect_name", ["binarypath", "blackhole", "fireworks", "rings", "scattered", "slide"])
+def test_batched_characters_produce_the_same_frames(effect_name: str, monkeypatch: pytest.MonkeyPatch):
+    pytest.importorskip("numpy")
+    frames = get_effect_frames(effect_name)
+    monkeypatch.setattr(ActiveCharacters, "BATCH_MIN_CHARACTERS", 1)
+    assert get_effect_frames(effect_name) == frames
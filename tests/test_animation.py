@@ -1,7 +1,7 @@
 import pytest
 
 import terminaltexteffects.utils.easing as easing
-from terminaltexteffects.engine.animation import CharacterVisual, Frame, Scene, SyncMetric
+from terminaltexteffects.engine.animation import Animation, CharacterVisual, Frame, Scene, SceneTemplate, SyncMetric
 from terminaltexteffects.engine.base_character import EffectCharacter
 from terminaltexteffects.utils.graphics import Color, Gradient
 
@@ -36,6 +36,33 @@ def test_character_visual_init():
     assert visual.color == "ffffff"
 
 
+def test_character_visual_structured_style():
+    visual = CharacterVisual(symbol="a", bold=True, dim=True, color=82)
+    assert visual.raw_symbol == "a"
+    assert visual.style == ("1", "2", "38;5;82")
+    assert visual.symbol == "\x1b[1m\x1b[2m\x1b[38;5;82ma\x1b[0m"
+    assert CharacterVisual(symbol="b", bold=True, dim=True, color=82).style is visual.style
+    assert CharacterVisual(symbol="a").style == ()
+
+
+def test_character_visual_format_symbol_is_idempotent():
+    visual = CharacterVisual(symbol="a", bold=True)
+    visual.disable_modes()
+    visual.format_symbol()
+    assert visual.symbol == "a"
+    assert visual.style == ()
+
+
+def test_character_visual_formatted_symbols_are_interned():
+    visual = CharacterVisual(symbol="a", italic=True, color="123456")
+    hits = CharacterVisual.format_cache_info().hits
+    other_visual = CharacterVisual(symbol="a", italic=True, color="123456")
+    assert other_visual.symbol is visual.symbol
+    assert other_visual.style is visual.style
+    assert CharacterVisual.format_cache_info().hits == hits + 1
+    assert CharacterVisual(symbol="a", italic=True, color="654321").symbol != visual.symbol
+
+
 def test_frame_init():
     visual = CharacterVisual(
         symbol="a",
@@ -52,7 +79,6 @@ def test_frame_init():
     frame = Frame(character_visual=visual, duration=5)
     assert frame.character_visual == visual
     assert frame.duration == 5
-    assert frame.frames_played == 0
     assert frame.symbol == visual.symbol
 
 
@@ -107,6 +133,53 @@ def test_scene_apply_gradient_to_symbols_unequal_colors_and_symbols():
     assert "z" in scene.frames[-1].symbol
 
 
+def test_scene_playback_advances_cursor_without_moving_frames():
+    scene = Scene(scene_id="test_scene")
+    scene.add_frame(symbol="a", duration=2)
+    scene.add_frame(symbol="b", duration=1)
+    frames = list(scene.frames)
+    assert [scene.get_next_symbol() for _ in range(3)] == ["a", "a", "b"]
+    assert list(scene.frames) == frames
+    assert scene.is_complete
+    assert scene.played_frames == frames
+    scene.reset_scene()
+    assert (scene.frame_cursor, scene.current_frame_steps) == (0, 0)
+    assert scene.activate() == "a"
+
+
+def test_scene_playback_loops():
+    scene = Scene(scene_id="test_scene", is_looping=True)
+    scene.add_frame(symbol="a", duration=1)
+    scene.add_frame(symbol="b", duration=2)
+    assert [scene.get_next_symbol() for _ in range(7)] == ["a", "b", "b", "a", "b", "b", "a"]
+    assert not scene.is_complete
+
+
+def test_scenes_with_identical_frames_share_template():
+    gradient = Gradient(Color("000000"), Color("ffffff"), steps=4)
+    scenes = [Scene(scene_id=str(i)) for i in range(3)]
+    for scene in scenes:
+        scene.apply_gradient_to_symbols(gradient, "ab", 2)
+    scenes[2].add_frame("c", 1)
+    assert scenes[0].template is scenes[1].template
+    assert scenes[0].frames[0] is scenes[1].frames[0]
+    assert scenes[2].template is not scenes[0].template
+    assert scenes[2].easing_total_steps == scenes[0].easing_total_steps + 1
+    scenes[0].get_next_visual()
+    assert (scenes[0].current_frame_steps, scenes[1].current_frame_steps) == (1, 0)
+
+
+def test_scene_from_template_copies_frames_on_add_frame():
+    template = SceneTemplate.get((SceneTemplate.get_frame_key("a", 2, "ff0000", bold=True),))
+    scene = Scene(scene_id="test_scene", template=template)
+    assert scene.activate() == "\x1b[1m\x1b[38;2;255;0;0ma\x1b[0m"
+    assert scene.frame_index_map == {0: template.frames[0], 1: template.frames[0]}
+    scene.add_frame("b", 1)
+    assert len(template.frames) == 1
+    assert [frame.character_visual.raw_symbol for frame in scene.frames] == ["a", "b"]
+    assert scene.frames[0] is not template.frames[0]
+
+
 def test_animation_init(character):
     assert character.animation.character == character
     assert character.animation.scenes == {}
@@ -156,3 +229,37 @@ def test_animation_non_looping_active_scene_is_complete(character):
     assert animation.active_scene_is_complete() is False
     animation.step_animation()
     assert animation.active_scene_is_complete() is True
+
+
+def test_animation_sets_character_visual(character):
+    scene = character.animation.new_scene()
+    scene.add_frame("b", 1, color=Color("ff0000"))
+    character.animation.activate_scene(scene)
+    assert character.visual is scene.frames[0].character_visual
+    assert character.symbol == "\x1b[38;2;255;0;0mb\x1b[0m"
+    character.animation.set_appearance("c")
+    assert character.visual.raw_symbol == "c"
+    assert character.symbol == "c"
+
+
+def test_adjust_color_brightness():
+    assert Animation.adjust_color_brightness(Color("ff0000"), 0.5) == Color("7f0000")
+    assert Animation.adjust_color_brightness(Color("808080"), 0) == Color("000000")
+    assert Animation.adjust_color_brightness(Color("808080"), 10) == Color("ffffff")
+
+
+def test_adjust_color_brightness_cached():
+    color = Color("3a7bd5")
+    adjusted = Animation.adjust_color_brightness(color, 0.37)
+    hits = Animation.brightness_cache_info().hits
+    assert Animation.adjust_color_brightness(Color("3a7bd5"), 0.37) is adjusted
+    assert Animation.brightness_cache_info().hits == hits + 1
+
+
+def test_brightness_ramp():
+    color = Color("3a7bd5")
+    factors = [0.2, 0.5, 0.75, 1.0, 1.3]
+    assert Animation.brightness_ramp(color, factors) == tuple(
+        Animation.adjust_color_brightness(color, factor) for factor in factors
+    )
+    assert Animation.brightness_ramp(color, []) == ()
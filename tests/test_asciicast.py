@@ -0,0 +1,65 @@
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from terminaltexteffects.engine import asciicast
+from terminaltexteffects.engine.output import OutputSink
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
+
+
+def test_terminal_records_output(tmp_path):
+    config = TerminalConfig()
+    config.ignore_terminal_dimensions = True
+    config.record = str(tmp_path / "out.cast")
+    terminal = Terminal("ab\ncd", config)
+    stream = io.StringIO()
+    terminal.output_sink = OutputSink(stream)
+    terminal.prep_canvas()
+    terminal.print("ab\ncd", enforce_frame_rate=False)
+    terminal.print("xy\nzw", enforce_frame_rate=False)
+    terminal.restore_cursor()
+    header, *events = [json.loads(line) for line in (tmp_path / "out.cast").read_text().splitlines()]
+    assert header["version"] == 2
+    assert (header["width"], header["height"]) == (2, 3)
+    assert [event[1] for event in events] == ["o"] * 4
+    assert [event[0] for event in events] == sorted(event[0] for event in events)
+    assert "".join(event[2] for event in events) == stream.getvalue()
+
+
+def test_play_writes_output_events(tmp_path):
+    path = tmp_path / "out.cast"
+    recorder = asciicast.AsciicastRecorder(str(path), 10, 2)
+    recorder.write_output("\x1b[?25lhé")
+    recorder.write_output("llo")
+    recorder.close()
+    with path.open("a", encoding="utf-8") as recording:
+        recording.write(json.dumps([0.01, "i", "ignored"]) + "\n")
+    stream = io.StringIO()
+    asciicast.play(str(path), speed=100, stream=stream)
+    assert stream.getvalue() == "\x1b[?25lhéllo"
+
+
+def test_play_rejects_other_formats(tmp_path):
+    path = tmp_path / "out.cast"
+    path.write_text('{"version": 1}\n')
+    with pytest.raises(ValueError):
+        asciicast.play(str(path), stream=io.StringIO())
+
+
+def test_play_command_does_not_import_effects(tmp_path):
+    path = tmp_path / "out.cast"
+    recorder = asciicast.AsciicastRecorder(str(path), 10, 2)
+    recorder.write_output("frame")
+    recorder.close()
+    code = (
+        "import sys\n"
+        "from terminaltexteffects.__main__ import main\n"
+        f"sys.argv = ['tte', 'play', {str(path)!r}]\n"
+        "main()\n"
+        "assert not [name for name in sys.modules if name.startswith('terminaltexteffects.effects.')]\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert result.stdout == "frame"
@@ -0,0 +1,77 @@
+import pytest
+
+from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
+from terminaltexteffects.utils.geometry import Coord
+
+
+def make_character() -> EffectCharacter:
+    character = EffectCharacter(0, "a", 1, 1)
+    path = character.motion.new_path(id="input")
+    path.new_waypoint(Coord(5, 1), id="end")
+    scene = character.animation.new_scene(id="fade")
+    scene.add_frame("b", 1)
+    return character
+
+
+def test_unregistered_event_is_ignored():
+    character = make_character()
+    path = character.motion.query_path("input")
+    character.event_handler._handle_event(EventHandler.Event.PATH_COMPLETE, path)
+    assert character.event_handler._handlers is None
+    character.event_handler.register_event(EventHandler.Event.PATH_ACTIVATED, path, EventHandler.Action.SET_LAYER, 2)
+    character.event_handler._handle_event(EventHandler.Event.PATH_COMPLETE, path)
+    assert character.layer == 0
+
+
+def test_registered_actions_run_in_order():
+    character = make_character()
+    path = character.motion.query_path("input")
+    calls = []
+    handler = character.event_handler
+    handler.register_event(EventHandler.Event.PATH_COMPLETE, path, EventHandler.Action.SET_LAYER, 2)
+    handler.register_event(
+        EventHandler.Event.PATH_COMPLETE,
+        path,
+        EventHandler.Action.CALLBACK,
+        EventHandler.Callback(lambda character, value: calls.append((character.layer, value)), "x"),
+    )
+    handler._handle_event(EventHandler.Event.PATH_COMPLETE, path)
+    # events registered after the handlers are compiled are added to them
+    handler.register_event(
+        EventHandler.Event.PATH_COMPLETE, path, EventHandler.Action.ACTIVATE_SCENE, character.animation.query_scene("fade")
+    )
+    handler._handle_event(EventHandler.Event.PATH_COMPLETE, path)
+    assert calls == [(2, "x"), (2, "x")]
+    assert character.animation.active_scene is character.animation.query_scene("fade")
+
+
+def test_registered_events_is_read_only_view():
+    character = make_character()
+    path = character.motion.query_path("input")
+    handler = character.event_handler
+    handler.register_event(EventHandler.Event.PATH_COMPLETE, path, EventHandler.Action.SET_LAYER, 2)
+    handler._handle_event(EventHandler.Event.PATH_COMPLETE, path)
+    compiled_handlers = handler._handlers
+    registered_events = handler.registered_events
+    assert registered_events[(EventHandler.Event.PATH_COMPLETE, path)] == ((EventHandler.Action.SET_LAYER, 2),)
+    with pytest.raises(TypeError):
+        registered_events[(EventHandler.Event.PATH_COMPLETE, path)] = ()  # type: ignore[index]
+    # reading the registered events keeps the compiled handlers
+    assert handler._handlers is compiled_handlers
+
+
+def test_register_events_resolves_ids_per_character():
+    characters = [make_character() for _ in range(3)]
+    EventHandler.register_events(
+        characters,
+        [
+            (EventHandler.Event.PATH_COMPLETE, "input", EventHandler.Action.ACTIVATE_SCENE, "fade"),
+            (EventHandler.Event.SEGMENT_ENTERED, ("input", "end"), EventHandler.Action.SET_LAYER, 1),
+        ],
+    )
+    for character in characters:
+        character.motion.activate_path(character.motion.query_path("input"))
+        while character.motion.active_path is not None:
+            character.motion.move()
+        assert character.layer == 1
+        assert character.animation.active_scene is character.animation.query_scene("fade")
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import io
+
+from terminaltexteffects.effects import effect_print, effect_wipe
+from terminaltexteffects.engine.base_effect import BaseEffect
+from terminaltexteffects.engine.output import OutputSink
+from terminaltexteffects.engine.scheduler import FramePolicy, FrameScheduler
+from terminaltexteffects.engine.terminal import Terminal
+
+INPUT_DATA = "ab\ncd\nefg"
+
+
+def get_frames(effect_module, tick_rate: float, frame_rate: int = 100) -> list[str]:
+    effect: BaseEffect = effect_module.get_effect_and_args()[0](INPUT_DATA)
+    effect.terminal_config.frame_rate = frame_rate
+    effect.terminal_config.tick_rate = tick_rate
+    return list(effect)
+
+
+def test_tick_rate_runs_multiple_ticks_per_frame():
+    for effect_module in (effect_wipe, effect_print):
+        frames = get_frames(effect_module, 0)
+        fast_frames = get_frames(effect_module, 400)
+        # the final state is shown even when the effect ends between frames
+        final_frame = [frames[-1]] if (len(frames) - 1) % 4 else []
+        assert fast_frames == frames[::4] + final_frame
+
+
+def test_tick_rate_holds_frames_below_frame_rate():
+    frames = get_frames(effect_wipe, 0)
+    slow_frames = get_frames(effect_wipe, 50)
+    assert slow_frames == [frame for frame in frames for _ in range(2)]
+
+
+def test_tick_rate_matching_frame_rate_is_unchanged():
+    assert get_frames(effect_wipe, 100) == get_frames(effect_wipe, 0)
+
+
+def test_skipped_frames_are_not_rendered_and_final_frame_is_presented(monkeypatch):
+    effect: BaseEffect = effect_wipe.get_effect_and_args()[0](INPUT_DATA)
+    effect.terminal_config.frame_rate = 10
+    effect.terminal_config.frame_policy = FramePolicy.SKIP
+    final_frame = list(effect)[-1]
+    renders = []
+    get_formatted_output_string = Terminal.get_formatted_output_string
+
+    def count_renders(terminal: Terminal) -> str:
+        renders.append(terminal)
+        return get_formatted_output_string(terminal)
+
+    stream = io.StringIO()
+    now = [0.0]
+    with effect.terminal_output() as terminal:
+        terminal.output_sink = OutputSink(stream)
+        terminal.frame_scheduler = FrameScheduler(10, FramePolicy.SKIP, clock=lambda: now[0], sleep=lambda _: None)
+        monkeypatch.setattr(Terminal, "get_formatted_output_string", count_renders)
+        frame_count = 0
+        for frame in effect:
+            frame_count += 1
+            terminal.print(frame)
+            # the time is spent simulating the next frame, which is late by the time it would be rendered
+            now[0] += 0.15
+    statistics = terminal.frame_scheduler.statistics
+    assert statistics.skipped_frames
+    assert len(renders) <= frame_count - statistics.skipped_frames + 1
+    assert stream.getvalue().endswith(final_frame + "\x1b[?25h\n")
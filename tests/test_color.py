@@ -0,0 +1,60 @@
+import copy
+import pickle
+
+import pytest
+
+from terminaltexteffects.utils import colorterm, hexterm
+from terminaltexteffects.utils.graphics import Color
+
+
+def test_equal_color_values_share_color() -> None:
+    assert Color("#FF8800") is Color("ff8800")
+    assert Color("ff8800") is Color.from_rgb(255, 136, 0)
+    assert Color(9) is Color(9)
+
+
+def test_color_normalized() -> None:
+    color = Color("#ABCDEF")
+    assert color.color_arg == color.rgb_color == "abcdef"
+    assert color.rgb_int == 0xABCDEF
+    assert color.rgb_ints == (0xAB, 0xCD, 0xEF)
+    assert color.xterm_color is None
+    assert Color("ABCDEF") == Color("#abcdef")
+    assert hash(Color("ABCDEF")) == hash(Color("#abcdef"))
+
+
+def test_xterm_color_differs_from_hex_color() -> None:
+    xterm_red = Color(9)
+    assert xterm_red.rgb_color == "ff0000"
+    assert xterm_red.xterm_color == 9
+    assert xterm_red != Color("ff0000")
+
+
+def test_xterm_index() -> None:
+    assert Color(0).xterm_index == 0
+    assert Color("123456").xterm_index == hexterm.hex_to_xterm("123456")
+
+
+def test_color_sequences() -> None:
+    assert Color("#ff8800").fg_sequence == colorterm.fg("ff8800")
+    assert Color("#ff8800").bg_sequence == colorterm.bg("ff8800")
+    assert Color(200).fg_sequence == colorterm.fg(200)
+
+
+def test_color_immutable() -> None:
+    color = Color("ff8800")
+    with pytest.raises(AttributeError):
+        color.rgb_color = "000000"  # type: ignore[misc]
+    assert copy.deepcopy(color) is color
+    assert pickle.loads(pickle.dumps(color)) is color
+
+
+@pytest.mark.parametrize("color_value", ["fffff", "#fffff", "fffff#", "0xffff", "ff_fff", "gggggg", 256, -1, 1.5, None])
+def test_invalid_color(color_value) -> None:
+    with pytest.raises(ValueError):
+        Color(color_value)
+
+
+def test_from_rgb_invalid() -> None:
+    with pytest.raises(ValueError):
+        Color.from_rgb(256, 0, 0)
@@ -0,0 +1,124 @@
+import pytest
+
+from terminaltexteffects.engine.framebuffer import Framebuffer
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
+from terminaltexteffects.utils.geometry import Coord
+from terminaltexteffects.utils import sgr
+from terminaltexteffects.utils.graphics import Color
+
+RED_STYLE = sgr.get_style(["38;2;255;0;0"])
+
+
+@pytest.fixture
+def terminal() -> Terminal:
+    config = TerminalConfig()
+    config.ignore_terminal_dimensions = True
+    return Terminal("ab\ncd", config)
+
+
+def test_framebuffer_init_empty():
+    framebuffer = Framebuffer(3, 2)
+    assert framebuffer.symbols == [" "] * 6
+    assert framebuffer.styles == [sgr.DEFAULT_STYLE] * 6
+    assert framebuffer.layers == [0] * 6
+    assert framebuffer.to_string() == "   \n   "
+
+
+def test_framebuffer_cell_index_bottom_row_first():
+    framebuffer = Framebuffer(3, 2)
+    assert framebuffer.cell_index(1, 1) == 0
+    assert framebuffer.cell_index(3, 2) == 5
+    with pytest.raises(IndexError):
+        framebuffer.cell_index(4, 1)
+
+
+def test_framebuffer_get_rows_top_row_first():
+    framebuffer = Framebuffer(2, 2)
+    framebuffer.set_cell(1, 2, "t", sgr.DEFAULT_STYLE)
+    framebuffer.set_cell(2, 1, "b", sgr.DEFAULT_STYLE)
+    assert framebuffer.get_rows() == ["t ", " b"]
+
+
+def test_framebuffer_clear():
+    framebuffer = Framebuffer(2, 1)
+    framebuffer.symbols[0] = "x"
+    framebuffer.styles[0] = RED_STYLE
+    framebuffer.layers[0] = 3
+    framebuffer.clear()
+    assert framebuffer.symbols == [" ", " "]
+    assert framebuffer.styles == [sgr.DEFAULT_STYLE] * 2
+    assert framebuffer.layers == [0, 0]
+
+
+def test_framebuffer_get_cell():
+    framebuffer = Framebuffer(3, 1)
+    framebuffer.symbols[0] = "a"
+    framebuffer.styles[0] = RED_STYLE
+    assert framebuffer.get_cell(1, 1) == ("a", "\x1b[38;2;255;0;0m")
+    assert framebuffer.get_cell(2, 1) == (" ", "")
+
+
+def test_framebuffer_id_views():
+    framebuffer = Framebuffer(3, 1)
+    framebuffer.set_cell(1, 1, "a", RED_STYLE)
+    framebuffer.set_cell(3, 1, "a", sgr.DEFAULT_STYLE)
+    assert list(framebuffer.symbol_ids) == [1, 0, 1]
+    assert list(framebuffer.style_ids) == [1, 0, 0]
+    assert framebuffer.symbol_table == [" ", "a"]
+    assert framebuffer.style_table == ["", "\x1b[38;2;255;0;0m"]
+
+
+def test_framebuffer_rows_emit_sgr_deltas():
+    framebuffer = Framebuffer(4, 1)
+    framebuffer.symbols[:] = list("abcd")
+    framebuffer.styles[:3] = [RED_STYLE] * 3
+    framebuffer.dirty_rows.add(1)
+    assert framebuffer.to_string() == "\x1b[38;2;255;0;0mabc\x1b[0md"
+    framebuffer.styles[3] = RED_STYLE
+    assert framebuffer.to_string() == "\x1b[38;2;255;0;0mabcd\x1b[0m"
+
+
+def test_framebuffer_unchanged_frame_returns_same_string():
+    framebuffer = Framebuffer(2, 2)
+    framebuffer.set_cell(1, 1, "a", sgr.DEFAULT_STYLE)
+    first = framebuffer.to_string()
+    framebuffer.clear()
+    framebuffer.set_cell(1, 1, "a", sgr.DEFAULT_STYLE)
+    assert framebuffer.to_string() is first
+    framebuffer.set_cell(1, 1, "b", sgr.DEFAULT_STYLE)
+    assert framebuffer.to_string() == "  \nb "
+
+
+def test_framebuffer_clear_reformats_rows_written_before_clear():
+    framebuffer = Framebuffer(2, 2)
+    framebuffer.set_cell(1, 2, "a", RED_STYLE)
+    assert framebuffer.get_rows() == ["\x1b[38;2;255;0;0ma \x1b[0m", "  "]
+    framebuffer.clear()
+    framebuffer.set_cell(2, 1, "b", sgr.DEFAULT_STYLE)
+    assert framebuffer.get_rows() == ["  ", " b"]
+    framebuffer.clear()
+    assert framebuffer.to_string() == "  \n  "
+
+
+def test_framebuffer_only_formats_dirty_rows():
+    framebuffer = Framebuffer(2, 2)
+    framebuffer.set_cell(1, 1, "a", sgr.DEFAULT_STYLE)
+    framebuffer.get_rows()
+    # cells written without marking their row are not compared with the formatted rows
+    framebuffer.symbols[framebuffer.cell_index(1, 2)] = "x"
+    framebuffer.set_cell(2, 1, "b", sgr.DEFAULT_STYLE)
+    assert framebuffer.get_rows() == ["  ", "ab"]
+
+
+def test_terminal_composites_visible_characters_by_layer(terminal: Terminal):
+    a = terminal.get_character_by_input_coord(Coord(1, 2))
+    d = terminal.get_character_by_input_coord(Coord(2, 1))
+    assert a and d
+    terminal.set_character_visibility(a, True)
+    terminal.set_character_visibility(d, True)
+    d.animation.set_appearance("d", Color("ff0000"))
+    a.layer = 1
+    a.motion.set_coordinate(d.input_coord)
+    output = terminal.get_formatted_output_string()
+    assert output == "  \n a"
+    assert terminal.framebuffer.layers[terminal.framebuffer.cell_index(2, 1)] == 1
@@ -0,0 +1,44 @@
+import math
+
+from terminaltexteffects.utils import geometry
+from terminaltexteffects.utils.geometry import Coord
+
+
+def test_bezier_curve_length_of_straight_curve():
+    curve = geometry.BezierCurve(Coord(0, 0), Coord(5, 0), Coord(10, 0))
+    assert math.isclose(curve.length, 10)
+    cubic = geometry.BezierCurve(Coord(0, 0), (Coord(0, 10), Coord(0, 20)), Coord(0, 30))
+    assert math.isclose(cubic.length, 30)
+
+
+def test_bezier_curve_is_parameterized_by_distance():
+    # the control point bunches points near the end when stepping t uniformly
+    curve = geometry.BezierCurve(Coord(0, 0), Coord(90, 0), Coord(100, 0))
+    assert [curve.find_coord_at_distance(distance) for distance in range(0, 101, 25)] == [
+        Coord(0, 0),
+        Coord(25, 0),
+        Coord(50, 0),
+        Coord(75, 0),
+        Coord(100, 0),
+    ]
+    assert curve.find_t_at_distance(-1) == 0
+    assert curve.find_t_at_distance(curve.length + 1) == 1
+
+
+def test_bezier_curve_length_is_close_to_arc_length():
+    # quarter circle approximated by a cubic curve
+    handle = round(100 * 4 * (math.sqrt(2) - 1) / 3)
+    curve = geometry.get_bezier_curve(Coord(100, 0), (Coord(100, handle), Coord(handle, 100)), Coord(0, 100))
+    assert math.isclose(curve.length, math.pi * 50, rel_tol=0.01)
+
+
+def test_get_bezier_curve_is_cached():
+    curve = geometry.get_bezier_curve(Coord(1, 1), Coord(5, 9), Coord(9, 1))
+    assert geometry.get_bezier_curve(Coord(1, 1), (Coord(5, 9),), Coord(9, 1)) is curve
+
+
+def test_find_length_of_bezier_curve_is_unchanged():
+    # path step counts are derived from this length, it is measured between the rounded points up to the ninth tenth
+    assert geometry.find_length_of_bezier_curve(Coord(0, 0), Coord(5, 0), Coord(10, 0)) == 9
+    length = geometry.find_length_of_bezier_curve(Coord(1, 1), Coord(5, 9), Coord(9, 1))
+    assert math.isclose(length, 3 * math.sqrt(2) + 2 * math.sqrt(5) + 2)
@@ -1,4 +1,7 @@
-from terminaltexteffects.utils.graphics import Color, Gradient
+import pytest
+
+from terminaltexteffects.utils.geometry import Coord
+from terminaltexteffects.utils.graphics import Color, CoordinateColorMapping, Gradient
 
 
 def test_gradient_length_single_color() -> None:
@@ -44,3 +47,61 @@ def test_gradient_single_step() -> None:
 def test_gradient_three_colors() -> None:
     g = Gradient(Color("ffffff"), Color("000000"), Color("ffffff"), steps=4)
     assert g.spectrum[0] == Color("ffffff") and g.spectrum[4] == Color("000000") and g.spectrum[-1] == Color("ffffff")
+
+
+def test_equal_gradients_share_spectrum() -> None:
+    g1 = Gradient(Color("ff0000"), Color("0000ff"), steps=[5, 7], loop=True)
+    g2 = Gradient(Color("ff0000"), Color("0000ff"), steps=(5, 7), loop=True)
+    assert g1.spectrum is g2.spectrum
+    assert g1.spectrum is not Gradient(Color("ff0000"), Color("0000ff"), steps=(5, 7)).spectrum
+
+
+def test_spectrum_cache_info_counts_hits() -> None:
+    Gradient(Color("123456"), Color("654321"), steps=9)
+    hits = Gradient.spectrum_cache_info().hits
+    Gradient(Color("123456"), Color("654321"), steps=9)
+    assert Gradient.spectrum_cache_info().hits == hits + 1
+
+
+def test_looped_gradient_str_includes_first_stop() -> None:
+    g = Gradient(Color("ff0000"), Color("00ff00"), steps=4, loop=True)
+    assert str(g).startswith("Gradient: Stops(ff0000, 00ff00, ff0000)")
+
+
+def test_coordinate_color_mapping_matches_fractions() -> None:
+    g = Gradient(Color("ff0000"), Color("00ff00"), Color("0000ff"), steps=7)
+    for direction in Gradient.Direction:
+        mapping = g.build_coordinate_color_mapping(9, 30, direction)
+        assert len(mapping) == len(list(mapping)) == 10 * 30
+        for coord, color in mapping.items():
+            assert color == g.get_color_at_fraction(mapping.fraction_at(coord.column, coord.row))
+
+
+def test_coordinate_color_mapping_bounds() -> None:
+    mapping = Gradient(Color("ff0000"), Color("0000ff"), steps=5).build_coordinate_color_mapping(
+        3, 4, Gradient.Direction.VERTICAL
+    )
+    assert Coord(1, 0) in mapping and Coord(4, 3) in mapping
+    assert Coord(0, 0) not in mapping and Coord(5, 3) not in mapping and Coord(1, 4) not in mapping
+    with pytest.raises(KeyError):
+        mapping[Coord(0, 0)]
+    assert mapping.get(Coord(5, 5)) is None
+
+
+def test_coordinate_color_mapping_cached() -> None:
+    g1 = Gradient(Color("ff0000"), Color("0000ff"), steps=5)
+    g2 = Gradient(Color("ff0000"), Color("0000ff"), steps=5)
+    mapping = g1.build_coordinate_color_mapping(10, 20, Gradient.Direction.RADIAL)
+    assert g2.build_coordinate_color_mapping(10, 20, Gradient.Direction.RADIAL) is mapping
+    assert g2.build_coordinate_color_mapping(10, 21, Gradient.Direction.RADIAL) is not mapping
+
+
+def test_coordinate_color_mapping_vectorized(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    g = Gradient(Color("ff0000"), Color("00ff00"), Color("0000ff"), steps=(17, 40))
+    for direction in Gradient.Direction:
+        mapping = CoordinateColorMapping(g.spectrum, 23, 71, direction)
+        expected = {coord: mapping[coord] for coord in mapping._iter_coords()}
+        monkeypatch.setattr(CoordinateColorMapping, "VECTORIZE_MIN_COORDS", 0)
+        assert dict(CoordinateColorMapping(g.spectrum, 23, 71, direction)) == expected
+        monkeypatch.undo()
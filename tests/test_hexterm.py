@@ -0,0 +1,36 @@
+import random
+
+from terminaltexteffects.utils import hexterm
+
+
+def closest_xterm_color(hex_color: str) -> int:
+    """Compares the color with every XTerm-256 color."""
+    rgb = tuple(int(hex_color[i : i + 2], 16) for i in range(0, 6, 2))
+    diffs = [
+        sum(abs(channel - xterm_channel) for channel, xterm_channel in zip(rgb, hexterm.xterm_to_rgb_map[xterm_color]))
+        for xterm_color in range(256)
+    ]
+    return diffs.index(min(diffs))
+
+
+def test_hex_to_xterm_matches_closest_color():
+    rng = random.Random(0)
+    hex_colors = [f"{rng.randrange(0x1000000):06x}" for _ in range(2000)]
+    # values between cube and gray levels, where channels are equally close to two levels
+    levels = (0, 47, 48, 95, 115, 135, 155, 175, 195, 215, 235, 255, 8, 13, 238, 243)
+    hex_colors += [f"{red:02x}{green:02x}{blue:02x}" for red in levels for green in levels for blue in levels]
+    for hex_color in hex_colors:
+        assert hexterm.hex_to_xterm(hex_color) == closest_xterm_color(hex_color), hex_color
+
+
+def test_hex_to_xterm_returns_lowest_code_for_palette_colors():
+    for xterm_color, hex_color in hexterm.xterm_to_hex_map.items():
+        closest = hexterm.hex_to_xterm(hex_color)
+        assert hexterm.xterm_to_hex_map[closest] == hex_color
+        assert closest <= xterm_color
+
+
+def test_hex_to_xterm_colors():
+    hex_colors = ["#ff0000", "123456", "ff0000", "eeeeee"]
+    assert hexterm.hex_to_xterm_colors(hex_colors) == [hexterm.hex_to_xterm(color) for color in hex_colors]
+    assert hexterm.hex_to_xterm_colors([]) == []
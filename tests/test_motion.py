@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import importlib
+import random
+
+import pytest
+
+from terminaltexteffects.engine.base_character import EffectCharacter, EventHandler
+from terminaltexteffects.engine.motion import Path
+from terminaltexteffects.engine.terminal import TerminalConfig
+from terminaltexteffects.utils import easing, geometry
+from terminaltexteffects.utils.geometry import Coord
+
+
+class RecordingEventHandler:
+    Event = EventHandler.Event
+
+    def __init__(self) -> None:
+        self.events: list[tuple[int, EventHandler.Event, str]] = []
+        self.step = 0
+
+    def _handle_event(self, event: EventHandler.Event, waypoint) -> None:
+        self.events.append((self.step, event, waypoint.waypoint_id))
+
+
+def reference_steps(path: Path) -> tuple[list[Coord], list[tuple[int, EventHandler.Event, str]]]:
+    """Steps the path by scanning the segments at every step."""
+    coords = []
+    events = []
+    entered, exited = set(), set()
+    for step in range(1, path.max_steps + 1):
+        distance_factor = path.ease(step / path.max_steps) if path.ease else step / path.max_steps
+        distance_to_travel = distance_factor * path.total_distance
+        for segment in path.segments:
+            if distance_to_travel <= segment.distance:
+                active_segment = segment
+                if id(segment) not in entered:
+                    entered.add(id(segment))
+                    events.append((step, EventHandler.Event.SEGMENT_ENTERED, segment.end.waypoint_id))
+                break
+            distance_to_travel -= segment.distance
+            if id(segment) not in exited:
+                exited.add(id(segment))
+                events.append((step, EventHandler.Event.SEGMENT_EXITED, segment.end.waypoint_id))
+        else:
+            active_segment = path.segments[-1]
+            distance_to_travel += active_segment.distance
+        factor = distance_to_travel / active_segment.distance if active_segment.distance else 0.0
+        if active_segment.end.bezier_control:
+            curve = geometry.get_bezier_curve(
+                active_segment.start.coord, active_segment.end.bezier_control, active_segment.end.coord
+            )
+            coords.append(curve.find_coord_at_distance(factor * curve.length))
+        else:
+            coords.append(geometry.find_coord_on_line(active_segment.start.coord, active_segment.end.coord, factor))
+    return coords, events
+
+
+def reference_step(path: Path, event_handler: EventHandler) -> Coord:
+    """Path.step() without compiling, scanning the segments at every step."""
+    if not path.max_steps or path.current_step >= path.max_steps or not path.total_distance:
+        return path.segments[-1].end.coord
+    path.current_step += 1
+    distance_factor = path.ease(path.current_step / path.max_steps) if path.ease else path.current_step / path.max_steps
+    distance_to_travel = distance_factor * path.total_distance
+    path.last_distance_reached = distance_to_travel
+    for segment in path.segments:
+        if distance_to_travel <= segment.distance:
+            active_segment = segment
+            if not segment.enter_event_triggered:
+                segment.enter_event_triggered = True
+                event_handler._handle_event(event_handler.Event.SEGMENT_ENTERED, segment.end)
+            break
+        distance_to_travel -= segment.distance
+        if not segment.exit_event_triggered:
+            segment.exit_event_triggered = True
+            event_handler._handle_event(event_handler.Event.SEGMENT_EXITED, segment.end)
+    else:
+        active_segment = path.segments[-1]
+        distance_to_travel += active_segment.distance
+    factor = distance_to_travel / active_segment.distance if active_segment.distance else 0.0
+    if active_segment.end.bezier_control:
+        curve = geometry.get_bezier_curve(
+            active_segment.start.coord, active_segment.end.bezier_control, active_segment.end.coord
+        )
+        return curve.find_coord_at_distance(factor * curve.length)
+    return geometry.find_coord_on_line(active_segment.start.coord, active_segment.end.coord, factor)
+
+
+def step_path(path: Path) -> tuple[list[Coord], list[tuple[int, EventHandler.Event, str]]]:
+    event_handler = RecordingEventHandler()
+    coords = []
+    while path.current_step < path.max_steps:
+        event_handler.step = path.current_step + 1
+        coords.append(path.step(event_handler))  # type: ignore[arg-type]
+    return coords, event_handler.events
+
+
+def make_character(ease: easing.EasingFunction | None) -> tuple[EffectCharacter, Path]:
+    character = EffectCharacter(0, "a", 1, 1)
+    path = character.motion.new_path(speed=0.7, ease=ease)
+    path.new_waypoint(Coord(10, 1))
+    path.new_waypoint(Coord(10, 1))
+    path.new_waypoint(Coord(11, 2))
+    path.new_waypoint(Coord(30, 12), bezier_control=Coord(5, 20))
+    path.new_waypoint(Coord(2, 2))
+    return character, path
+
+
+def test_compiled_path_matches_segment_scan():
+    for ease in (None, easing.in_out_sine, easing.out_bounce, easing.in_out_back):
+        character, path = make_character(ease)
+        character.motion.activate_path(path)
+        assert step_path(path) == reference_steps(path)
+
+
+def test_compiled_path_recompiles_on_activation():
+    character, path = make_character(easing.in_out_sine)
+    character.motion.activate_path(path)
+    step_path(path)
+    character.motion.set_coordinate(Coord(40, 8))
+    character.motion.activate_path(path)
+    coords, events = step_path(path)
+    assert (coords, events) == reference_steps(path)
+    assert coords[-1] == Coord(2, 2)
+    assert events[0] == (1, EventHandler.Event.SEGMENT_ENTERED, "0")
+
+
+def test_motion_move_matches_path_step():
+    character, path = make_character(easing.in_out_sine)
+    character.motion.activate_path(path)
+    expected_coords, _ = reference_steps(path)
+    coords = []
+    while character.motion.active_path is not None:
+        character.motion.move()
+        coords.append(character.motion.current_coord)
+    assert coords == expected_coords
+
+
+def effect_frames(effect_name: str) -> list[str]:
+    module = importlib.import_module(f"terminaltexteffects.effects.effect_{effect_name}")
+    effect_class = module.get_effect_and_args()[0]
+    random.seed(0)
+    effect = effect_class("abc def\nghi\tjkl\n0123456789\n  mn  op")
+    terminal_config = TerminalConfig()
+    terminal_config.frame_rate = 0
+    terminal_config.ignore_terminal_dimensions = True
+    effect.terminal_config = terminal_config
+    return list(effect)
+
+
+@pytest.mark.parametrize(
+    "effect_name",
+    [
+        "slice",
+        "slide",
+        "rain",
+        "crumble",
+        "bubbles",
+        "spray",
+        "synthgrid",
+        "blackhole",
+        "binarypath",
+        "fireworks",
+        "orbittingvolley",
+        "rings",
+    ],
+)
+def test_compiled_paths_produce_the_same_frames(effect_name: str, monkeypatch: pytest.MonkeyPatch) -> None:
+    frames = effect_frames(effect_name)
+    # paths stepped by the reference are never compiled, so Motion.move() always calls it
+    monkeypatch.setattr(Path, "step", reference_step)
+    assert effect_frames(effect_name) == frames
@@ -0,0 +1,171 @@
+import io
+import os
+import threading
+
+import pytest
+
+from terminaltexteffects.engine.output import OutputSink, ThreadedOutputSink
+from terminaltexteffects.engine.scheduler import FramePolicy, FrameScheduler
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
+
+
+@pytest.fixture
+def terminal() -> Terminal:
+    config = TerminalConfig()
+    config.ignore_terminal_dimensions = True
+    return Terminal("ab\ncd", config)
+
+
+def test_output_sink_writes_single_frame_to_file_descriptor():
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(write_fd, "w", encoding="utf-8") as stream:
+        sink = OutputSink(stream)
+        sink.write_sequence("\x1b8")
+        sink.write("héllo")
+        assert bytes(sink.frame) == "\x1b8héllo".encode()
+        sink.flush()
+        assert os.read(read_fd, 100) == "\x1b8héllo".encode()
+    os.close(read_fd)
+    assert sink.frames_written == 1
+    assert sink.bytes_written == len("\x1b8héllo".encode())
+
+
+def test_output_sink_writes_to_binary_buffer_without_file_descriptor():
+    raw = io.BytesIO()
+    stream = io.TextIOWrapper(raw, encoding="utf-8")
+    sink = OutputSink(stream)
+    sink.write("█▓╱ héllo")
+    sink.flush()
+    assert raw.getvalue().decode("utf-8") == "█▓╱ héllo"
+
+
+def test_output_sink_does_not_write_to_file_descriptor_on_windows(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr("sys.platform", "win32")
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(write_fd, "w", encoding="utf-8") as stream:
+        written: list[bytes] = []
+        monkeypatch.setattr(stream.buffer, "write", lambda data: written.append(bytes(data)))
+        sink = OutputSink(stream)
+        sink.write("█▓╱")
+        sink.flush()
+    os.close(read_fd)
+    assert b"".join(written).decode("utf-8") == "█▓╱"
+
+
+def test_output_sink_reuses_buffer_between_frames():
+    stream = io.StringIO()
+    sink = OutputSink(stream)
+    sink.write("first")
+    sink.flush()
+    assert bytes(sink.frame) == b"first"
+    sink.write("second")
+    sink.flush()
+    assert stream.getvalue() == "firstsecond"
+    assert bytes(sink.frame) == b"second"
+
+
+def test_output_sink_held_frame_view_is_not_invalidated():
+    sink = OutputSink(io.StringIO())
+    sink.write("first")
+    sink.flush()
+    held_view = sink.frame
+    sink.write("second")
+    assert bytes(held_view) == b"first"
+    assert bytes(sink.frame) == b"second"
+
+
+def test_output_sink_frame_view_is_read_only():
+    sink = OutputSink(io.StringIO())
+    sink.write("abc")
+    with pytest.raises(TypeError):
+        sink.frame[0] = 0
+
+
+def test_terminal_encode_frame(terminal: Terminal):
+    frame = terminal.encode_frame("ab\ncd")
+    assert bytes(frame) == b"\x1b8\x1b[2Aab\ncd"
+    assert bytes(terminal.encode_frame("xy\nzw")) == b"\x1b8\x1b[2Axy\nzw"
+
+
+def test_terminal_print_writes_frame(terminal: Terminal):
+    stream = io.StringIO()
+    terminal.output_sink = OutputSink(stream)
+    terminal.print("ab\ncd", enforce_frame_rate=False)
+    assert stream.getvalue() == "\x1b8\x1b[2Aab\ncd"
+
+
+class SlowStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = threading.Event()
+
+    def write(self, text: str) -> int:
+        self.release.wait(5)
+        return super().write(text)
+
+
+def test_threaded_output_sink_writes_frames_in_order():
+    read_fd, write_fd = os.pipe()
+    with os.fdopen(write_fd, "w", encoding="utf-8") as stream:
+        sink = ThreadedOutputSink(stream, buffer_count=3)
+        for frame_number in range(50):
+            sink.write(f"[{frame_number}]")
+            sink.flush()
+            assert bytes(sink.frame) == f"[{frame_number}]".encode()
+        sink.close()
+    output = os.read(read_fd, 1000)
+    os.close(read_fd)
+    assert output == "".join(f"[{frame_number}]" for frame_number in range(50)).encode()
+    assert sink.frames_written == 50
+
+
+def test_threaded_output_sink_applies_backpressure():
+    stream = SlowStream()
+    sink = ThreadedOutputSink(stream)
+    sink.write("first")
+    sink.flush()
+    sink.write("second")
+    sink.flush()
+    assert sink.backpressure_waits == 0
+    # both buffers are queued or being written, the third frame waits for the writer thread
+    timer = threading.Timer(0.05, stream.release.set)
+    timer.start()
+    sink.write("third")
+    sink.close()
+    timer.join()
+    assert sink.backpressure_waits == 1
+    assert stream.getvalue() == "firstsecondthird"
+
+
+def test_threaded_output_sink_raises_writer_errors():
+    read_fd, write_fd = os.pipe()
+    os.close(read_fd)
+    stream = os.fdopen(write_fd, "w", encoding="utf-8")
+    sink = ThreadedOutputSink(stream)
+    sink.write("frame")
+    sink.flush()
+    with pytest.raises(BrokenPipeError):
+        sink.close()
+    stream.close()
+
+
+def test_terminal_print_skips_unchanged_frames(terminal: Terminal):
+    stream = io.StringIO()
+    terminal.output_sink = OutputSink(stream)
+    for frame in ("ab\ncd", "ab\ncd", "xy\nzw", "xy\nzw"):
+        terminal.print(frame, enforce_frame_rate=False)
+    assert stream.getvalue() == "\x1b8\x1b[2Aab\ncd\x1b8\x1b[2Axy\nzw"
+    assert terminal.frame_scheduler.statistics.unchanged_frames == 2
+
+
+def test_terminal_restore_cursor_prints_skipped_final_frame(terminal: Terminal):
+    stream = io.StringIO()
+    terminal.output_sink = OutputSink(stream)
+    now = [0.0]
+    terminal.frame_scheduler = FrameScheduler(10, FramePolicy.SKIP, clock=lambda: now[0], sleep=lambda _: None)
+    for frame, cost in (("ab\ncd", 0), ("xy\nzw", 0.1), ("ef\ngh", 0.25)):
+        now[0] += cost
+        terminal.print(frame)
+    assert "ef" not in stream.getvalue()
+    terminal.restore_cursor()
+    assert stream.getvalue().endswith("\x1b8\x1b[2Aef\ngh\x1b[?25h\n")
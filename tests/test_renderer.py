@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+
+from terminaltexteffects.engine.renderer import DiffRenderer, encode_row, parse_row_cells
+from terminaltexteffects.utils import colorterm, sgr
+
+RED = colorterm.fg("ff0000")
+RESET = "\x1b[0m"
+RED_STYLE = sgr.get_style(["38;2;255;0;0"])
+BOLD_RED_STYLE = sgr.get_style(["1", "38;2;255;0;0"])
+UNDERLINE_STYLE = sgr.get_style(["4"])
+
+
+def apply_output(grid: list[list[tuple[sgr.Style, str]]], output: str) -> None:
+    """Minimal terminal emulator for the sequences emitted by the renderers. Row len(grid) is the saved cursor row."""
+    height = len(grid)
+    row, column, state = height, 0, sgr.DEFAULT_STYLE
+    for match in re.finditer(r"\x1b(?:8|\[([0-9;]*)([ABGm]))|\n|(.)", output, re.S):
+        params, command, symbol = match.groups()
+        if match.group(0) == "\x1b8":
+            row, column = height, 0
+        elif match.group(0) == "\n":
+            row, column = row + 1, 0
+        elif command == "A":
+            row -= int(params)
+        elif command == "B":
+            row += int(params)
+        elif command == "G":
+            column = int(params) - 1
+        elif command == "m":
+            state = sgr.apply_parameters(state, params)
+        else:
+            grid[row][column] = (state, symbol)
+            column += 1
+
+
+def emulate(frames: list[str], renderer: DiffRenderer) -> list[list[tuple[sgr.Style, str]]]:
+    height = len(frames[0].split("\n"))
+    width = len(parse_row_cells(frames[0].split("\n")[0]))
+    grid = [[(sgr.DEFAULT_STYLE, " ")] * width for _ in range(height)]
+    for frame in frames:
+        apply_output(grid, renderer.render(frame))
+    return grid
+
+
+def test_parse_row_cells_tracks_sgr_state():
+    cells = parse_row_cells(f"a{RED}b{RESET} {RED}c")
+    assert cells == [((), "a"), (RED_STYLE, "b"), ((), " "), (RED_STYLE, "c")]
+
+
+def test_parse_row_cells_canonical_styles():
+    cells = parse_row_cells(f"{RED}\x1b[1ma\x1b[0;1;38;2;255;0;0mb\x1b[22mc")
+    assert cells == [(BOLD_RED_STYLE, "a"), (BOLD_RED_STYLE, "b"), (RED_STYLE, "c")]
+    assert cells[0][0] is cells[1][0]
+
+
+def test_sgr_transition_emits_only_changes():
+    assert sgr.get_transition(sgr.DEFAULT_STYLE, RED_STYLE) == RED
+    assert sgr.get_transition(RED_STYLE, BOLD_RED_STYLE) == "\x1b[1m"
+    assert sgr.get_transition(BOLD_RED_STYLE, RED_STYLE) == "\x1b[22m"
+    assert sgr.get_transition(RED_STYLE, sgr.DEFAULT_STYLE) == RESET
+    assert sgr.get_transition(RED_STYLE, RED_STYLE) == ""
+
+
+def test_encode_row_emits_sgr_deltas():
+    row = encode_row(list("ab c d"), [RED_STYLE, RED_STYLE, (), RED_STYLE, (), BOLD_RED_STYLE])
+    assert row == f"{RED}ab c \x1b[1md{RESET}"
+    assert parse_row_cells(row) == [
+        (RED_STYLE, "a"),
+        (RED_STYLE, "b"),
+        (RED_STYLE, " "),
+        (RED_STYLE, "c"),
+        (RED_STYLE, " "),
+        (BOLD_RED_STYLE, "d"),
+    ]
+
+
+def test_encode_row_keeps_visible_space_styles():
+    row = encode_row(list("a b"), [RED_STYLE, UNDERLINE_STYLE, RED_STYLE])
+    assert row == f"{RED}a\x1b[0;4m \x1b[0;38;2;255;0;0mb{RESET}"
+    assert encode_row(list("ab "), [(), (), ()]) == "ab "
+
+
+def test_diff_renderer_first_frame_is_full_redraw():
+    renderer = DiffRenderer()
+    output = renderer.render("ab\ncd")
+    assert output == "\x1b8\x1b[2Aab\ncd"
+
+
+def test_diff_renderer_unchanged_frame_is_empty():
+    renderer = DiffRenderer()
+    renderer.render("ab\ncd")
+    assert renderer.render("ab\ncd") == ""
+
+
+def test_diff_renderer_writes_only_changed_cells():
+    renderer = DiffRenderer()
+    renderer.render("abcdefghijklmnopqrst\n" * 3 + "abcdefghijklmnopqrst")
+    output = renderer.render("abcdefghijklmnopqrst\n" * 2 + "abcdefghijklmnopqrsX\nabcdefghijklmnopqrst")
+    assert output == "\x1b8\x1b[2A\x1b[20GX"
+
+
+def test_diff_renderer_coalesces_short_gaps():
+    renderer = DiffRenderer()
+    renderer.render("abcdefghij")
+    assert renderer.render("XbXdefghij") == "\x1b8\x1b[1A\x1b[1GXbX"
+    assert renderer.render("XbXdefghiX") == "\x1b8\x1b[1A\x1b[10GX"
+
+
+def test_diff_renderer_output_reproduces_frames():
+    frames = [
+        "abc  \n     \n  xyz",
+        f"a{RED}b{RESET}c  \n  {RED}q{RESET}  \n  xyz",
+        f"a{RED}bc{RESET}  \n     \n  {RED}x{RESET}yz",
+        f"{RED}a{RESET}    \n  z  \n     ",
+    ]
+    grid = emulate(frames, DiffRenderer())
+    assert grid == [parse_row_cells(row) for row in frames[-1].split("\n")]
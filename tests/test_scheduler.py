@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import argparse
+
+import pytest
+
+from terminaltexteffects.engine.scheduler import FramePolicy, FrameScheduler
+from terminaltexteffects.engine.terminal import FramePolicyArg
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def make_scheduler(policy: FramePolicy) -> tuple[FrameScheduler, FakeClock]:
+    clock = FakeClock()
+    return FrameScheduler(10, policy, clock=clock, sleep=clock.sleep), clock
+
+
+def run_frames(scheduler: FrameScheduler, clock: FakeClock, frame_costs: list[float]) -> list[bool]:
+    presented = []
+    for cost in frame_costs:
+        clock.now += cost
+        presented.append(scheduler.wait())
+    return presented
+
+
+def test_scheduler_uses_absolute_deadlines():
+    scheduler, clock = make_scheduler(FramePolicy.KEEP)
+    assert run_frames(scheduler, clock, [0, 0.03, 0.05, 0.09]) == [True] * 4
+    assert clock.sleeps == pytest.approx([0.07, 0.05, 0.01])
+    assert clock.now == pytest.approx(0.3)
+    assert scheduler.statistics.late_frames == 0
+
+
+def test_scheduler_keep_restarts_schedule_after_late_frame():
+    scheduler, clock = make_scheduler(FramePolicy.KEEP)
+    assert run_frames(scheduler, clock, [0, 0.35, 0]) == [True] * 3
+    assert clock.now == pytest.approx(0.45)
+    assert scheduler.statistics.late_frames == 1
+    assert scheduler.statistics.max_lateness == pytest.approx(0.25)
+
+
+def test_scheduler_catch_up_presents_late_frames_without_sleeping():
+    scheduler, clock = make_scheduler(FramePolicy.CATCH_UP)
+    assert run_frames(scheduler, clock, [0, 0.35, 0, 0, 0]) == [True] * 5
+    assert clock.now == pytest.approx(0.4)
+    assert scheduler.statistics.late_frames == 3
+
+
+def test_scheduler_skip_drops_late_frames_and_keeps_schedule():
+    scheduler, clock = make_scheduler(FramePolicy.SKIP)
+    assert run_frames(scheduler, clock, [0, 0.35, 0, 0, 0]) == [True, False, False, True, True]
+    assert clock.now == pytest.approx(0.4)
+    statistics = scheduler.statistics
+    assert (statistics.frames, statistics.presented_frames, statistics.skipped_frames) == (5, 3, 2)
+
+
+def test_scheduler_skip_presents_when_skipping_cannot_catch_up():
+    scheduler, clock = make_scheduler(FramePolicy.SKIP)
+    assert run_frames(scheduler, clock, [0, 0.2, 0.2, 0.2, 0.2]) == [True, False, True, False, True]
+
+
+def test_scheduler_unlimited_frame_rate_never_sleeps():
+    clock = FakeClock()
+    scheduler = FrameScheduler(0, clock=clock, sleep=clock.sleep)
+    assert run_frames(scheduler, clock, [0, 0, 0]) == [True] * 3
+    assert clock.sleeps == []
+
+
+def test_frame_policy_arg():
+    assert FramePolicyArg.type_parser("catch-up") is FramePolicy.CATCH_UP
+    assert FramePolicyArg.type_parser("SKIP") is FramePolicy.SKIP
+    with pytest.raises(argparse.ArgumentTypeError):
+        FramePolicyArg.type_parser("drop")
+
+
+def test_scheduler_frame_due_skips_late_frames_before_rendering():
+    scheduler, clock = make_scheduler(FramePolicy.SKIP)
+    assert scheduler.frame_due()
+    assert scheduler.wait()
+    clock.now += 0.25
+    assert not scheduler.frame_due()
+    assert not scheduler.wait()
+    assert scheduler.frame_due()
+    assert scheduler.wait()
+    statistics = scheduler.statistics
+    assert (statistics.frames, statistics.presented_frames, statistics.skipped_frames) == (3, 2, 1)
+
+
+def test_scheduler_frame_due_only_skips_under_skip_policy():
+    scheduler, clock = make_scheduler(FramePolicy.CATCH_UP)
+    scheduler.wait()
+    clock.now += 1
+    assert scheduler.frame_due()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+
+import pytest
+
+from terminaltexteffects.engine.terminal import Terminal, TerminalConfig
+from terminaltexteffects.utils.geometry import Coord
+
+
+@pytest.fixture
+def terminal() -> Terminal:
+    config = TerminalConfig()
+    config.ignore_terminal_dimensions = True
+    return Terminal("abc", config)
+
+
+def visible_by_layer(terminal: Terminal) -> dict[int, list[str]]:
+    return {
+        layer: [character.input_symbol for character in terminal._visible_characters_by_layer[layer]]
+        for layer in terminal._visible_layers
+        if terminal._visible_characters_by_layer[layer]
+    }
+
+
+def test_set_character_visibility_buckets_by_layer(terminal: Terminal):
+    a, b, c = terminal.get_characters()
+    b.layer = 2
+    for character in (a, b, c):
+        terminal.set_character_visibility(character, True)
+    assert visible_by_layer(terminal) == {0: ["a", "c"], 2: ["b"]}
+    terminal.set_character_visibility(a, False)
+    terminal.set_character_visibility(a, False)
+    assert visible_by_layer(terminal) == {0: ["c"], 2: ["b"]}
+    assert a.is_visible is False
+
+
+def test_layer_change_moves_visible_character(terminal: Terminal):
+    a, b, c = terminal.get_characters()
+    for character in (a, b, c):
+        terminal.set_character_visibility(character, True)
+    c.layer = -1
+    a.layer = 3
+    assert visible_by_layer(terminal) == {-1: ["c"], 0: ["b"], 3: ["a"]}
+    assert terminal._visible_layers == sorted(terminal._visible_layers)
+
+
+def test_higher_layer_drawn_on_top(terminal: Terminal):
+    a, b, _ = terminal.get_characters()
+    terminal.set_character_visibility(b, True)
+    terminal.set_character_visibility(a, True)
+    a.motion.set_coordinate(Coord(2, 1))
+    assert terminal.get_formatted_output_string() == " a "
+    b.layer = 1
+    assert terminal.get_formatted_output_string() == " b "
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclasses are slotted from Python 3.10")
+def test_bytes_per_character():
+    config = TerminalConfig()
+    config.ignore_terminal_dimensions = True
+    input_data = "\n".join("abcdefghij" * 25 for _ in range(400))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        terminal = Terminal(input_data, config)
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    character_count = len(terminal.get_characters())
+    assert character_count == 100_000
+    assert allocated / character_count < 800
+
+
+def test_fill_characters_created_on_demand():
+    config = TerminalConfig()
+    config.ignore_terminal_dimensions = True
+    terminal = Terminal("a b\nc", config)
+    assert terminal._fill_characters is None
+    added = terminal.add_character("x", Coord(1, 1))
+    assert added.character_id == 6
+    assert terminal.get_character_by_input_coord(Coord(2, 2)).input_symbol == " "
+    fill_characters = terminal.get_characters(input_characters=False, fill_chars=True)
+    assert [(c.character_id, c.input_coord) for c in fill_characters] == [
+        (5, Coord(2, 2)),
+        (3, Coord(2, 1)),
+        (4, Coord(3, 1)),
+    ]
+    assert len(terminal.character_by_input_coord) == 6
+
+
+def test_character_subsystems_created_on_first_access(terminal: Terminal):
+    character = terminal.get_characters()[0]
+    assert (character._animation, character._motion, character._event_handler) == (None, None, None)
+    assert not character.is_active
+    character.tick()
+    terminal.set_character_visibility(character, True)
+    assert terminal.get_formatted_output_string() == "a  "
+    assert character.motion.current_coord == character.input_coord
+    assert character._motion is not None